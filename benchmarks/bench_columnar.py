@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Row versus columnar hand-off
+
+Converts `--notifications` counter notifications into a list of dict rows
+through the message wrappers, and into columnar batches with
+``gnmi.columnar.ColumnarBatcher`` for each available backend.
+
+    python benchmarks/bench_columnar.py [--notifications N] [--updates N]
+"""
+
+import argparse
+import time
+
+from gnmi import columnar
+from gnmi.columnar import ColumnarBatcher
+from gnmi.messages import Notification_, Path_
+from gnmi.proto import gnmi_pb2 as pb
+
+
+def _notifications(count: int, updates: int) -> list:
+    notifs = []
+    for n in range(count):
+        prefix = Path_.from_string(
+            "/interfaces/interface[name=Ethernet%d]/state/counters" % (n % 48)).raw
+        notifs.append(Notification_(pb.Notification(
+            timestamp=n, prefix=prefix, update=[
+                pb.Update(path=pb.Path(elem=[pb.PathElem(name="counter%d" % i)]),
+                          val=pb.TypedValue(uint_val=n * i))
+                for i in range(updates)
+            ])))
+    return notifs
+
+
+def rows(notifs: list) -> int:
+    table = []
+    for notif in notifs:
+        prefix = notif.prefix
+        for update in notif.update:
+            table.append({
+                "timestamp": notif.timestamp,
+                "target": "veos1",
+                "path": str(prefix + update.path),
+                "value": update.get_value(),
+            })
+    return len(table)
+
+
+def batches(backend: str):
+    def run(notifs: list) -> int:
+        batcher = ColumnarBatcher(batch_size=50000, backend=backend,
+                                  target="veos1")
+        return sum(b.num_rows for b in batcher.feed(notifs))
+    run.__name__ = "columnar " + backend
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--notifications", type=int, default=2000)
+    parser.add_argument("--updates", type=int, default=20)
+    args = parser.parse_args()
+
+    notifs = _notifications(args.notifications, args.updates)
+    cases = [rows]
+    if columnar.NUMPY_SUPPORTED:
+        cases.append(batches("numpy"))
+    if columnar.ARROW_SUPPORTED:
+        cases.append(batches("arrow"))
+
+    for func in cases:
+        best = None
+        for _ in range(3):
+            start = time.perf_counter()
+            count = func(notifs)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print("%-16s %12.0f rows/s" % (func.__name__, count / best))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Import and CLI start-up time
+
+Each statement runs in a fresh interpreter, the best of `--repeat` runs is
+reported along with the time of a bare interpreter for reference.
+
+    python benchmarks/bench_import.py [--repeat N]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+STATEMENTS = [
+    ("python", "pass"),
+    ("import gnmi", "import gnmi"),
+    ("gnmi.__version__", "import gnmi; gnmi.__version__"),
+    ("import gnmi.session", "import gnmi.session"),
+    ("from gnmi import get", "from gnmi import get"),
+    ("gnmipy --version",
+     "import sys; sys.argv = ['gnmipy', '--version']\n"
+     "from gnmi.entry import main\n"
+     "try:\n    main()\nexcept SystemExit:\n    pass"),
+]
+
+
+def _run(statement: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", statement], check=True,
+                   stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    for name, statement in STATEMENTS:
+        best = min(_run(statement) for _ in range(args.repeat))
+        print("%-24s %8.1f ms" % (name, best * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Notification decoding throughput
+
+Compares walking a notification through the ``Update_``/``Path_`` wrappers
+with ``Notification_.iter_leaves``. The notification mimics an interface
+counters update with a keyed prefix.
+
+    python benchmarks/bench_leaves.py [--updates N] [--repeat N]
+"""
+
+import argparse
+import timeit
+
+from gnmi.messages import Notification_, Path_, Update_
+from gnmi.proto import gnmi_pb2 as pb
+
+
+def _notification(count: int) -> Notification_:
+    prefix = Path_.from_string(
+        "/interfaces/interface[name=Ethernet1]/state/counters").raw
+    updates = []
+    for i in range(count):
+        if i % 4 == 0:
+            value = "up"
+        elif i % 4 == 1:
+            value = float(i)
+        else:
+            value = i * 1000
+        updates.append(
+            Update_.from_keyval(("/counter-%d/value" % i, value)).raw)
+    return Notification_(pb.Notification(prefix=prefix, update=updates))
+
+
+def wrappers(notif: Notification_) -> list:
+    prefix = notif.prefix
+    return [(str(prefix + u.path), u.get_value()) for u in notif.update]
+
+
+def leaves(notif: Notification_) -> list:
+    return list(notif.iter_leaves())
+
+
+def leaves_tuple(notif: Notification_) -> list:
+    return list(notif.iter_leaves(as_tuple=True))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--updates", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    notif = _notification(args.updates)
+    assert wrappers(notif) == leaves(notif)
+
+    baseline = None
+    for func in (wrappers, leaves, leaves_tuple):
+        best = min(timeit.repeat(lambda: func(notif), number=args.repeat,
+                                 repeat=5)) / args.repeat
+        rate = args.updates / best
+        baseline = baseline or best
+        print("%-16s %10.1f us/notification %12.0f updates/s %6.1fx" % (
+            func.__name__, best * 1e6, rate, baseline / best))
+
+
+if __name__ == "__main__":
+    main()
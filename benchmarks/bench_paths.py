@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Path parsing throughput
+
+Parses a set of telemetry paths with the previous regex based parser, the
+tokenizer in ``gnmi.util.parse_path`` and ``Path_.from_string`` with and
+without the path cache.
+
+    python benchmarks/bench_paths.py [--repeat N]
+"""
+
+import argparse
+import re
+import timeit
+
+from gnmi import messages, util
+from gnmi.messages import Path_
+
+PATHS = [
+    "/interfaces/interface[name=Ethernet%d]/state/counters/in-octets" % i
+    for i in range(1, 49)
+] + [
+    "/network-instances/network-instance[name=default]/protocols/protocol"
+    "[identifier=BGP][name=BGP]/bgp/neighbors/neighbor"
+    "[neighbor-address=10.0.0.%d]/afi-safis/afi-safi[afi-safi-name=IPV4]"
+    "/state/prefixes/received" % i
+    for i in range(1, 17)
+] + [
+    "/system/state/hostname",
+    "/components/component[name=CPU0]/cpu/utilization/state/instant",
+]
+
+_RE_COMPONENT = re.compile(r"^(?P<name>[^[]+)(?P<keyval>\[.*\])?$")
+
+
+def legacy(path: str) -> list:
+    parsed = []
+    elems = [re.sub(r"\\", "", name) for name in re.split(r"(?<!\\)/", path) if name]
+    for elem in elems:
+        keys = {}
+        match = _RE_COMPONENT.search(elem)
+        if match.group("keyval"):
+            for keyval in re.findall(r"\[([^]]*)\]", match.group("keyval")):
+                key, val = keyval.split("=")
+                keys[key] = val
+        parsed.append(dict(name=match.group("name"), keys=keys))
+    return parsed
+
+
+def from_string(path: str) -> Path_:
+    return Path_.from_string(path)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    cases = [
+        ("legacy regex", legacy, None),
+        ("parse_path", util.parse_path, None),
+        ("from_string", from_string, 0),
+        ("from_string cached", from_string, len(PATHS)),
+    ]
+
+    for name, func, cache_size in cases:
+        if cache_size is not None:
+            messages.set_path_cache_size(cache_size)
+
+        def run():
+            for path in PATHS:
+                func(path)
+
+        best = min(timeit.repeat(run, number=args.repeat, repeat=5))
+        rate = len(PATHS) * args.repeat / best
+        print("%-20s %12.0f paths/s" % (name, rate))
+
+
+if __name__ == "__main__":
+    main()
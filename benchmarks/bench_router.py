@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Regex loop versus trie routing
+
+Registers `--handlers` path patterns and matches `--paths` counter paths
+against them, once by trying a compiled regex per pattern and once with
+``gnmi.router.Router`` with and without its match cache.
+
+    python benchmarks/bench_router.py [--handlers N] [--paths N]
+"""
+
+import argparse
+import re
+import time
+
+from gnmi.path import PathKey
+from gnmi.router import Router
+
+
+def _patterns(count: int) -> list:
+    patterns = ["/interfaces/interface[name=*]/state/counters/...",
+                "/system/..."]
+    for n in range(count - len(patterns)):
+        patterns.append("/interfaces/interface[name=Ethernet%d]/state/counters/counter%d"
+                        % (n % 48, n))
+    return patterns
+
+
+def _regex(pattern: str) -> "re.Pattern":
+    expr = re.escape(pattern)
+    expr = expr.replace(re.escape("..."), ".*").replace(re.escape("*"), "[^/\\]]+")
+    return re.compile(expr + "$")
+
+
+def _paths(count: int) -> list:
+    return ["/interfaces/interface[name=Ethernet%d]/state/counters/counter%d"
+            % (n % 48, n % 64) for n in range(count)]
+
+
+def regexes(patterns: list, paths: list) -> int:
+    compiled = [(_regex(p), p) for p in patterns]
+    matched = 0
+    for path in paths:
+        matched += len([p for r, p in compiled if r.match(path)])
+    return matched
+
+
+def router(cache_size: int):
+    def run(patterns: list, paths: list) -> int:
+        r = Router(cache_size=cache_size)
+        for pattern in patterns:
+            r.add(pattern, print)
+        keys = [PathKey.from_string(p) for p in paths]
+        return sum(len(r.match(k)) for k in keys)
+    run.__name__ = "router cache=%d" % cache_size
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--handlers", type=int, default=500)
+    parser.add_argument("--paths", type=int, default=20000)
+    args = parser.parse_args()
+
+    patterns = _patterns(args.handlers)
+    paths = _paths(args.paths)
+
+    for func in (regexes, router(0), router(4096)):
+        best = None
+        for _ in range(3):
+            start = time.perf_counter()
+            func(patterns, paths)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print("%-18s %12.0f paths/s" % (func.__name__, len(paths) / best))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""TypedValue decoding per value type
+
+For each type decodes a notification of `--updates` updates with the
+previous ``HasField`` chain, ``gnmi.values.decode`` per update and
+``gnmi.values.extract_values`` for the whole notification. Numeric types are
+also converted in bulk with ``gnmi.values.extract_numeric``.
+
+    python benchmarks/bench_values.py [--updates N] [--repeat N]
+"""
+
+import argparse
+import base64
+import json
+import timeit
+from decimal import Decimal
+
+from gnmi import values
+from gnmi.proto import gnmi_pb2 as pb
+
+SAMPLES = {
+    "int_val": lambda i: -i,
+    "uint_val": lambda i: i * 1000003,
+    "double_val": lambda i: i / 3.0,
+    "float_val": lambda i: i / 3.0,
+    "bool_val": lambda i: bool(i & 1),
+    "string_val": lambda i: "Ethernet%d" % i,
+    "bytes_val": lambda i: b"\x00\x01" * 8,
+    "decimal_val": lambda i: pb.Decimal64(digits=i * 101, precision=2),
+    "json_ietf_val": lambda i: json.dumps({"in-octets": i, "name": "Et%d" % i}).encode(),
+    "leaflist_val": lambda i: pb.ScalarArray(element=[
+        pb.TypedValue(uint_val=i), pb.TypedValue(uint_val=i + 1)]),
+}
+
+_FIELDS = ["any_val", "ascii_val", "bool_val", "bytes_val", "decimal_val",
+           "float_val", "int_val", "json_ietf_val", "json_val", "leaflist_val",
+           "proto_bytes", "string_val", "uint_val", "double_val"]
+
+
+def legacy(val: pb.TypedValue):
+    for field in _FIELDS:
+        if val.HasField(field):
+            break
+    else:
+        raise ValueError("Unhandled typed value %s" % val)
+
+    if field == "bytes_val":
+        return base64.b64encode(val.bytes_val)
+    if field == "decimal_val":
+        return Decimal(str(val.decimal_val.digits / 10**val.decimal_val.precision))
+    if field in ("json_ietf_val", "json_val"):
+        return json.loads(getattr(val, field))
+    if field == "leaflist_val":
+        return [legacy(e) for e in val.leaflist_val.element]
+    return getattr(val, field)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--updates", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print("%-14s %14s %14s %14s" % ("type", "legacy", "decode", "extract_values"))
+    for field, sample in SAMPLES.items():
+        notif = pb.Notification(update=[
+            pb.Update(path=pb.Path(elem=[pb.PathElem(name="leaf%d" % i)]),
+                      val=pb.TypedValue(**{field: sample(i)}))
+            for i in range(args.updates)
+        ])
+
+        cases = [
+            lambda: [legacy(u.val) for u in notif.update],
+            lambda: [values.decode(u.val) for u in notif.update],
+            lambda: values.extract_values(notif),
+        ]
+        rates = []
+        for case in cases:
+            best = min(timeit.repeat(case, number=args.repeat, repeat=5))
+            rates.append(args.updates * args.repeat / best)
+        print("%-14s %12.0f/s %12.0f/s %12.0f/s" % (field, *rates))
+
+    print()
+    print("%-14s %14s %14s %14s" % ("bulk", "extract_values", "array",
+                                     "numpy"))
+    for field, dtype in (("uint_val", "uint64"), ("decimal_val", "float64")):
+        sample = SAMPLES[field]
+        notif = pb.Notification(update=[
+            pb.Update(val=pb.TypedValue(**{field: sample(i)}))
+            for i in range(args.updates)
+        ])
+        cases = [
+            lambda: values.extract_values(notif),
+            lambda: values.extract_numeric(notif, dtype),
+        ]
+        if values.NUMPY_SUPPORTED:
+            cases.append(lambda: values.extract_numeric(notif, dtype, "numpy"))
+
+        rates = []
+        for case in cases:
+            best = min(timeit.repeat(case, number=args.repeat, repeat=5))
+            rates.append("%12.0f/s" % (args.updates * args.repeat / best))
+        print("%-14s %s" % (field, " ".join(rates)))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 # Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
 # Arista Networks, Inc. Confidential and Proprietary.
 
+import importlib
 import sys
 
 __version__ = "0.4.0"
@@ -10,5 +11,30 @@ if sys.version_info < (3, 9):
     # see: https://devguide.python.org/devcycle/
     raise ValueError("Python 3.9+ is required")
 
-from gnmi.session import Session
-from gnmi.api import capabilites, delete, get, replace, subscribe, update
+# grpc and the generated protobuf modules take most of the import time, they
+# are only loaded once one of these is used
+_LAZY_ATTRS = {
+    "PathKey": "gnmi.path",
+    "Session": "gnmi.session",
+    "capabilites": "gnmi.api",
+    "delete": "gnmi.api",
+    "get": "gnmi.api",
+    "replace": "gnmi.api",
+    "subscribe": "gnmi.api",
+    "update": "gnmi.api",
+}
+
+__all__ = ["PathKey", "Session", "capabilites", "delete", "get", "replace",
+           "subscribe", "update"]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.aio
+~~~~~~~~~~~~~~~~
+
+asyncio gNMI client built on grpc.aio
+
+"""
+
+from gnmi.aio.session import AsyncSession
+from gnmi.aio.api import capabilites, delete, get, replace, subscribe, update
+from gnmi.aio.fanout import Fanout, TargetStatus
+from gnmi.aio.resilient import AsyncResilientSubscription
+from gnmi.aio.poll import PollScheduler
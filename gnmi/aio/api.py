@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.aio.api
+~~~~~~~~~~~~~~~~
+
+Coroutine variants of the :mod:`gnmi.api` helpers
+
+"""
+
+from typing import Any, AsyncGenerator, List, Tuple
+
+from gnmi.api import _session_args
+from gnmi.aio.session import AsyncSession
+from gnmi.messages import CapabilitiesResponse_, Notification_, SetResponse_
+from gnmi.exceptions import GrpcDeadlineExceeded
+from gnmi.structures import Auth, CertificateStore, GetOptions
+from gnmi.structures import Options, SubscribeOptions
+
+__all__ = ["capabilites", "delete", "get", "replace", "subscribe", "update"]
+
+def _new_session(target: str,
+        auth: Auth = None,
+        insecure: bool = False,
+        certificates: CertificateStore = {},
+        override: str = None) -> AsyncSession:
+
+    target, kwargs = _session_args(target, auth, insecure, certificates,
+                                   override)
+    return AsyncSession(target, **kwargs)
+
+
+async def capabilites(target: str,
+        auth: Auth = None,
+        insecure: bool = False,
+        certificates: CertificateStore = {},
+        override: str = None) -> CapabilitiesResponse_:
+    """
+    Get supported models and encodings from target
+
+    Usage::
+
+        >>> await capabilites("veos1:6030", auth=("admin", "p4ssw0rd"))
+
+    See :func:`gnmi.api.capabilites` for parameters
+    """
+    async with _new_session(target, auth, insecure, certificates,
+                            override) as sess:
+        return await sess.capabilities()
+
+
+async def get(target: str,
+        paths: list,
+        auth: Auth = None,
+        insecure: bool = False,
+        certificates: CertificateStore = {},
+        override: str = None,
+        options: GetOptions = {}) -> AsyncGenerator[Notification_, None]:
+    """
+    Get path(s) from target
+
+    Usage::
+
+        >>> async for notif in get("veos1:6030", ["/system/config"],
+        ...         auth=("admin", "p4ssw0rd")):
+        ...     for update in notif.updates:
+        ...         print(update.path, update.get_value())
+
+    See :func:`gnmi.api.get` for parameters
+    """
+    async with _new_session(target, auth, insecure, certificates,
+                            override) as sess:
+        response = await sess.get(paths, options=options)
+        for notif in response:
+            yield notif
+
+
+async def subscribe(target: str,
+        paths: list,
+        auth: Auth = None,
+        insecure: bool = False,
+        certificates: CertificateStore = {},
+        override: str = None,
+        options: SubscribeOptions = {}) -> AsyncGenerator[Notification_, None]:
+    """
+    Subscribe to updates from target
+
+    Usage::
+
+        >>> async for notif in subscribe("veos1:6030", ["/interfaces"],
+        ...         auth=("admin", "p4ssw0rd")):
+        ...     for update in notif.updates:
+        ...         print(update.path, update.get_value())
+
+    See :func:`gnmi.api.subscribe` for parameters
+    """
+    async with _new_session(target, auth, insecure, certificates,
+                            override) as sess:
+        try:
+            async for resp in sess.subscribe(paths, options=options):
+                if resp.sync_response:
+                    continue
+                yield resp.update
+        except GrpcDeadlineExceeded:
+            pass
+
+
+async def delete(target: str,
+        deletes: List[str] = [],
+        auth: Auth = None,
+        insecure: bool = False,
+        certificates: CertificateStore = {},
+        override: str = None,
+        options: Options = {}) -> SetResponse_:
+    """
+    Delete paths from the target
+
+    See :func:`gnmi.api.delete` for parameters
+    """
+    async with _new_session(target, auth, insecure, certificates,
+                            override) as sess:
+        return await sess.set(deletes=deletes, options=options)
+
+
+async def replace(target: str,
+        replacements: List[Tuple[str, Any]] = [],
+        auth: Auth = None,
+        insecure: bool = False,
+        certificates: CertificateStore = {},
+        override: str = None,
+        options: Options = {}) -> SetResponse_:
+    """
+    Replace paths on the target
+
+    See :func:`gnmi.api.replace` for parameters
+    """
+    async with _new_session(target, auth, insecure, certificates,
+                            override) as sess:
+        return await sess.set(replacements=replacements, options=options)
+
+
+async def update(target: str,
+        updates: List[Tuple[str, Any]] = [],
+        auth: Auth = None,
+        insecure: bool = False,
+        certificates: CertificateStore = {},
+        override: str = None,
+        options: Options = {}) -> SetResponse_:
+    """
+    Update paths on the target
+
+    See :func:`gnmi.api.update` for parameters
+    """
+    async with _new_session(target, auth, insecure, certificates,
+                            override) as sess:
+        return await sess.set(updates=updates, options=options)
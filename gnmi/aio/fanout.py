@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.aio.fanout
+~~~~~~~~~~~~~~~~
+
+Subscribe to the same paths on many targets and merge the streams
+
+"""
+
+import asyncio
+import collections
+import time
+from typing import AsyncGenerator, Callable, Dict, Iterable, Mapping, Optional
+from typing import Tuple, Union
+
+from gnmi.aio.api import _new_session
+from gnmi.aio.resilient import AsyncResilientSubscription
+from gnmi.aio.session import AsyncSession
+from gnmi.exceptions import GrpcDeadlineExceeded
+from gnmi.messages import Notification_
+from gnmi.resilient import Backoff
+from gnmi.structures import Auth, CertificateStore, SubscribeOptions
+
+__all__ = ["Fanout", "TargetStatus"]
+
+Inventory = Union[Iterable[Union[str, AsyncSession]],
+                  Mapping[str, Union[str, AsyncSession]]]
+
+_DONE = object()
+
+
+class TargetStatus(object):
+    r"""Progress of a single target's subscription
+
+    `state` moves from ``pending`` (waiting for a concurrency slot) to
+    ``connecting``, ``streaming`` once the first response arrives and ends in
+    ``done`` or ``failed``. `error` holds the exception of a failed target.
+    """
+
+    PENDING = "pending"
+    CONNECTING = "connecting"
+    STREAMING = "streaming"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(self, name: str):
+        self.name = name
+        self.state = self.PENDING
+        self.synced = False
+        self.notifications = 0
+        self.error: Optional[BaseException] = None
+        self.last_update: Optional[float] = None
+
+    def __repr__(self):
+        return "TargetStatus(%r, state=%r, notifications=%d)" % (
+            self.name, self.state, self.notifications)
+
+
+class Fanout(object):
+    r"""Runs one subscription per target on a single event loop and yields a
+    merged stream of ``(target, Notification_)``
+
+    A failing target is recorded in :attr:`status` and does not interrupt the
+    others. Given a `backoff`, targets reconnect through
+    :class:`gnmi.aio.resilient.AsyncResilientSubscription` instead of failing
+    on transport errors and notifications replayed by a resync are dropped.
+    At most `concurrency` targets connect at once, the remaining targets wait
+    for a slot. A slot is released as soon as the first response of a target
+    arrives, so long lived ``stream`` mode subscriptions do not keep the
+    targets past `concurrency` waiting.
+
+    Usage::
+
+        >>> fanout = Fanout(["sw1:6030", "sw2:6030"], ["/interfaces"],
+        ...     auth=("admin", ""), options={"mode": "stream"})
+        >>> async for target, notif in fanout:
+        ...     for update in notif.updates:
+        ...         print(target, update.path, update.get_value())
+        >>> fanout.summary()
+        {'done': 1, 'failed': 1}
+
+    :param targets: target urls, sessions, or a mapping of name to either
+    :param paths: List of paths
+    :type paths: list
+    :param options: Subscribe options
+    :type options: gnmi.structures.SubscribeOptions
+    :param concurrency: maximum number of targets connecting at once
+    :type concurrency: int
+    :param queue_size: merged responses buffered before streams are paused
+    :type queue_size: int
+    :param backoff: reconnect failed streams with this backoff
+    :type backoff: gnmi.resilient.Backoff
+    """
+
+    def __init__(self, targets: Inventory,
+                 paths: list,
+                 options: SubscribeOptions = {},
+                 concurrency: int = 1000,
+                 queue_size: int = 10000,
+                 backoff: Optional[Backoff] = None,
+                 auth: Auth = None,
+                 insecure: bool = False,
+                 certificates: CertificateStore = {},
+                 override: str = None):
+
+        if isinstance(targets, Mapping):
+            items = list(targets.items())
+        else:
+            items = [(str(t.target) if isinstance(t, AsyncSession) else t, t)
+                     for t in targets]
+
+        self._targets: Dict[str, Union[str, AsyncSession]] = dict(items)
+        self.paths = paths
+        self.options = options
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.backoff = backoff
+        self._session_args = (auth, insecure, certificates, override)
+
+        self.status: Dict[str, TargetStatus] = {
+            name: TargetStatus(name) for name in self._targets}
+
+    def summary(self) -> Dict[str, int]:
+        r"""Number of targets in each state"""
+        return dict(collections.Counter(s.state for s in self.status.values()))
+
+    def _session(self, target: Union[str, AsyncSession]) -> Tuple[AsyncSession, bool]:
+        if isinstance(target, AsyncSession):
+            return target, False
+        return _new_session(target, *self._session_args), True
+
+    async def _worker(self, name: str, queue: asyncio.Queue,
+                      slots: asyncio.Semaphore) -> None:
+        status = self.status[name]
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                slots.release()
+
+        try:
+            await slots.acquire()
+            try:
+                status.state = TargetStatus.CONNECTING
+                sess, owned = self._session(self._targets[name])
+                try:
+                    await self._stream(sess, status, queue, release)
+                finally:
+                    if owned:
+                        await sess.close()
+            finally:
+                release()
+            status.state = TargetStatus.DONE
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            status.state = TargetStatus.FAILED
+            status.error = exc
+
+        await queue.put(_DONE)
+
+    async def _stream(self, sess: AsyncSession, status: TargetStatus,
+                      queue: asyncio.Queue, release: Callable[[], None]) -> None:
+        if self.backoff is not None:
+            # each target needs its own backoff state
+            backoff = Backoff(self.backoff.initial, self.backoff.maximum,
+                              self.backoff.multiplier, self.backoff.jitter)
+            responses = AsyncResilientSubscription(sess, self.paths,
+                                                   self.options, backoff)
+        else:
+            responses = sess.subscribe(self.paths, self.options)
+
+        try:
+            async for resp in responses:
+                if status.state != TargetStatus.STREAMING:
+                    # connected, the slot goes to the next target
+                    status.state = TargetStatus.STREAMING
+                    release()
+                status.last_update = time.time()
+                if resp.sync_response:
+                    status.synced = True
+                    continue
+                if getattr(resp, "replayed", False):
+                    continue
+                status.notifications += 1
+                await queue.put((status.name, resp.update))
+        except GrpcDeadlineExceeded:
+            pass
+
+    def __aiter__(self) -> AsyncGenerator[Tuple[str, Notification_], None]:
+        return self._run()
+
+    async def _run(self) -> AsyncGenerator[Tuple[str, Notification_], None]:
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        slots = asyncio.Semaphore(self.concurrency)
+        tasks = [asyncio.ensure_future(self._worker(name, queue, slots))
+                 for name in self._targets]
+
+        remaining = len(tasks)
+        try:
+            while remaining:
+                item = await queue.get()
+                if item is _DONE:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
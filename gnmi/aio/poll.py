@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.aio.poll
+~~~~~~~~~~~~~~~~
+
+Client-side scheduler for POLL mode subscriptions
+
+"""
+
+import asyncio
+import inspect
+import random
+from typing import AsyncGenerator, Dict, List, Optional, Tuple, Union
+
+from gnmi.aio.session import AsyncPollSubscription
+from gnmi.messages import Notification_
+from gnmi.session import PollSubscription
+
+__all__ = ["PollScheduler"]
+
+_DONE = object()
+
+
+class PollScheduler(object):
+    r"""Polls many open POLL subscriptions on a fixed interval
+
+    Every subscription gets a random phase within the interval so polls to a
+    large fleet are spread out instead of firing at the same instant, and
+    each poll instant is moved by up to ``jitter * interval`` to keep them
+    from lining up again. Poll instants are computed from the phase, a slow
+    target does not drift the schedule, it only skips the polls it missed.
+
+    Blocking :class:`gnmi.session.PollSubscription` handles are polled in the
+    default executor. A failing subscription is dropped from the schedule
+    and its exception kept in :attr:`errors`.
+
+    Usage::
+
+        >>> scheduler = PollScheduler(interval=30, jitter=0.1)
+        >>> for name, sess in sessions.items():
+        ...     scheduler.add(name, await sess.poll(paths))
+        >>> async for name, notifications in scheduler:
+        ...     store(name, notifications)
+
+    :param interval: seconds between polls of one subscription
+    :type interval: float
+    :param jitter: fraction of the interval each poll instant may move by
+    :type jitter: float
+    :param rounds: polls per subscription, unlimited if ``None``
+    :type rounds: int
+    """
+
+    def __init__(self, interval: float, jitter: float = 0.1,
+                 rounds: Optional[int] = None, queue_size: int = 10000):
+        self.interval = interval
+        self.jitter = jitter
+        self.rounds = rounds
+        self.queue_size = queue_size
+        self.errors: Dict[str, BaseException] = {}
+        self._handles: Dict[str, Union[PollSubscription,
+                                       AsyncPollSubscription]] = {}
+
+    def add(self, name: str,
+            handle: Union[PollSubscription, AsyncPollSubscription]) -> None:
+        r"""Schedule `handle` under `name`"""
+        self._handles[name] = handle
+
+    async def _poll(self, handle) -> List[Notification_]:
+        if inspect.iscoroutinefunction(handle.poll):
+            return await handle.poll()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, handle.poll)
+
+    async def _worker(self, name: str, handle, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        phase = loop.time() + random.uniform(0, self.interval)
+        count = 0
+        try:
+            while self.rounds is None or count < self.rounds:
+                skew = random.uniform(-self.jitter, self.jitter) * self.interval
+                delay = phase + count * self.interval + skew - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                await queue.put((name, await self._poll(handle)))
+
+                # skip instants that passed while waiting on the target
+                elapsed = loop.time() - phase
+                count = max(count + 1, int(elapsed // self.interval) + 1)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self.errors[name] = exc
+
+        await queue.put(_DONE)
+
+    def __aiter__(self) -> AsyncGenerator[Tuple[str, List[Notification_]], None]:
+        return self._run()
+
+    async def _run(self) -> AsyncGenerator[Tuple[str, List[Notification_]], None]:
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        tasks = [asyncio.ensure_future(self._worker(name, handle, queue))
+                 for name, handle in self._handles.items()]
+
+        remaining = len(tasks)
+        try:
+            while remaining:
+                item = await queue.get()
+                if item is _DONE:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
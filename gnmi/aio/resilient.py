@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.aio.resilient
+~~~~~~~~~~~~~~~~
+
+asyncio variant of :mod:`gnmi.resilient`
+
+"""
+
+import asyncio
+from typing import AsyncGenerator, Optional
+
+from gnmi.aio.session import AsyncSession
+from gnmi.exceptions import GrpcError
+from gnmi.resilient import Backoff, ResilientResponse_, _ResumeState
+from gnmi.structures import SubscribeOptions
+
+__all__ = ["AsyncResilientSubscription"]
+
+
+class AsyncResilientSubscription(_ResumeState):
+    r"""Subscribe and transparently reconnect on transport failures
+
+    See :class:`gnmi.resilient.ResilientSubscription`.
+
+    Usage::
+
+        >>> async for resp in AsyncResilientSubscription(sess, paths):
+        ...     if resp.sync_response or resp.replayed:
+        ...         continue
+    """
+
+    def __init__(self, session: AsyncSession, paths: list,
+                 options: SubscribeOptions = {},
+                 backoff: Optional[Backoff] = None,
+                 max_retries: Optional[int] = None,
+                 resume_updates_only: bool = False):
+        super(AsyncResilientSubscription, self).__init__(
+            paths, options, backoff, max_retries, resume_updates_only)
+        self.session = session
+
+    def __aiter__(self) -> AsyncGenerator[ResilientResponse_, None]:
+        return self._run()
+
+    async def _run(self) -> AsyncGenerator[ResilientResponse_, None]:
+        while True:
+            try:
+                async for resp in self.session.subscribe(self.paths,
+                                                         self.options):
+                    yield self._track(resp.raw)
+                return
+            except GrpcError as err:
+                delay = self._retry_delay(err)
+
+            await asyncio.sleep(delay)
+            await self.session.reconnect()
+            self._resume()
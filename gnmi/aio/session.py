@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.aio.session
+~~~~~~~~~~~~~~~~
+
+Implementation of the asyncio gnmi.session API built on grpc.aio
+
+"""
+
+import asyncio
+
+import grpc
+import grpc.aio
+from gnmi.proto import gnmi_pb2 as pb  # type: ignore
+from gnmi.proto import gnmi_pb2_grpc  # type: ignore
+
+from typing import TYPE_CHECKING, AsyncGenerator, List, Optional
+
+from gnmi.messages import CapabilitiesResponse_, GetResponse_, Notification_
+from gnmi.messages import SubscribeResponse_, SetResponse_
+from gnmi.constants import GET_CHUNK_BYTES, GET_CHUNK_PATHS, GET_CONCURRENCY
+from gnmi.exceptions import GnmiBatchError
+from gnmi.session import BaseSession
+from gnmi.structures import Metadata, CertificateStore, Options
+from gnmi.structures import GetOptions, GrpcOptions, SubscribeOptions
+from gnmi.target import Target
+
+if TYPE_CHECKING:
+    from gnmi.certcache import CertificateCache
+
+
+class AsyncSession(BaseSession):
+    r"""Represents a gNMI session running on an asyncio event loop
+
+    The channel is opened on the first RPC, so sessions can be created
+    outside of a running loop. Streams do not use a thread each, thousands of
+    subscriptions can share a single event loop.
+
+    Basic Usage::
+
+        In [1]: from gnmi.aio import AsyncSession
+        In [2]: async with AsyncSession(Target.from_url("veos3:6030"),
+        ...:         metadata={"username": "admin", "password": ""}) as sess:
+        ...:     resp = await sess.get(["/system/config/hostname"])
+
+    """
+
+    def __init__(self,
+                 target: Target,
+                 metadata: Metadata = {},
+                 insecure: bool = False,
+                 certificates: CertificateStore = {},
+                 grpc_options: GrpcOptions = {},
+                 cert_cache: Optional['CertificateCache'] = None):
+
+        super(AsyncSession, self).__init__(target, metadata=metadata,
+                                           insecure=insecure,
+                                           certificates=certificates,
+                                           grpc_options=grpc_options,
+                                           cert_cache=cert_cache)
+        self._channel: Optional[grpc.aio.Channel] = None
+        self._stub = None
+        # created on the first RPC, within the running loop
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self) -> 'AsyncSession':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def _new_channel(self) -> grpc.aio.Channel:
+        options = self._channel_options()
+
+        if self._insecure:
+            return grpc.aio.insecure_channel(self.target.grpc_target,
+                                             options=options)
+
+        server_cert = None
+        if self._needs_server_certificate():
+            # fetching the certificate blocks on a TLS handshake, keep it off
+            # the event loop
+            loop = asyncio.get_running_loop()
+            server_cert = await loop.run_in_executor(
+                None, self._fetch_server_certificate)
+
+        creds = self._channel_credentials(server_cert)
+
+        return grpc.aio.secure_channel(self.target.grpc_target, creds,
+                                       options=options)
+
+    async def _get_stub(self) -> gnmi_pb2_grpc.gNMIStub:
+        if self._stub is not None:
+            return self._stub
+
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+
+        # concurrent first RPCs wait for a single channel, opening one yields
+        # while the server certificate is fetched
+        async with self._connect_lock:
+            if self._stub is None:
+                channel = await self._new_channel()
+                self._channel = channel
+                self._stub = gnmi_pb2_grpc.gNMIStub(channel)  # type: ignore
+            return self._stub
+
+    async def close(self) -> None:
+        r"""Close the underlying channel, cancelling any active RPCs"""
+        if self._channel is not None:
+            await self._channel.close()
+        self._channel = None
+        self._stub = None
+
+    async def reconnect(self) -> None:
+        r"""Close the channel, a new one is opened by the next RPC
+
+        A server certificate trusted on first use is fetched again, in case
+        the target rotated it.
+        """
+        self._expire_server_certificate()
+        await self.close()
+
+    async def capabilities(self) -> CapabilitiesResponse_:
+        r"""Discover capabilities of the target
+
+        :rtype: gnmi.messages.CapabilitiesResponse_
+        """
+        stub = await self._get_stub()
+        _cr = pb.CapabilityRequest()  # type: ignore
+
+        try:
+            response = await stub.Capabilities(_cr, metadata=self.metadata)
+        except grpc.RpcError as rpcerr:
+            raise self._rpc_error(rpcerr)
+
+        return CapabilitiesResponse_(response)
+
+    async def get(self, paths: list, options: GetOptions = {}) -> GetResponse_:
+        r"""Get snapshot of state from the target
+
+        :param paths: List of paths
+        :type paths: list
+        :param options:
+        :type options: gnmi.structures.GetOptions
+
+        :rtype: gnmi.messages.GetResponse_
+        """
+        stub = await self._get_stub()
+        _gr = self._get_request(paths, options)
+
+        try:
+            response = await stub.Get(_gr, metadata=self.metadata)
+        except grpc.RpcError as rpcerr:
+            raise self._rpc_error(rpcerr)
+
+        return GetResponse_(response)
+
+    async def get_batched(self, paths: list, options: GetOptions = {},
+                          max_paths: int = GET_CHUNK_PATHS,
+                          max_bytes: int = GET_CHUNK_BYTES,
+                          concurrency: int = GET_CONCURRENCY) -> GetResponse_:
+        r"""Get a large number of paths in concurrent chunks
+
+        See :meth:`gnmi.session.Session.get_batched`.
+
+        :raises gnmi.exceptions.GnmiBatchError: if any chunk failed
+        :rtype: gnmi.messages.GetResponse_
+        """
+        stub = await self._get_stub()
+        chunks = self._get_chunks(paths, max_paths, max_bytes)
+        slots = asyncio.Semaphore(concurrency)
+        errors = []
+
+        async def _get(chunk):
+            async with slots:
+                try:
+                    return await stub.Get(self._get_request(chunk, options),
+                                          metadata=self.metadata)
+                except grpc.RpcError as rpcerr:
+                    errors.append((chunk, self._rpc_error(rpcerr)))
+
+        results = await asyncio.gather(*[_get(chunk) for chunk in chunks])
+
+        response = self._merge_get_responses([r for r in results if r is not None])
+        if errors:
+            raise GnmiBatchError(errors, response)
+        return response
+
+    async def set(self, deletes: list = [], replacements: list = [],
+                  updates: list = [], options: Options = {}) -> SetResponse_:
+        r"""Set set, update or delete value from specified path
+
+        :param updates: List of updates
+        :type updates: list
+        :param replacements: List of replacements
+        :type replacements: list
+        :param deletes: List of deletes
+        :type deletes: list
+        :param options:
+        :type options: gnmi.structures.Options
+        :rtype: gnmi.messages.SetResponse_
+        """
+        stub = await self._get_stub()
+        _sr = self._set_request(deletes, replacements, updates, options)
+
+        try:
+            response = await stub.Set(_sr, metadata=self.metadata)
+        except grpc.RpcError as rpcerr:
+            raise self._rpc_error(rpcerr)
+
+        return SetResponse_(response)
+
+    async def subscribe(self, paths: list, options: SubscribeOptions = {}
+                        ) -> AsyncGenerator[SubscribeResponse_, None]:
+        r"""Subscribe to state updates from the target
+
+        Usage::
+
+            async for resp in sess.subscribe(paths, {"mode": "stream"}):
+                if resp.sync_response:
+                    continue
+                for update in resp.update:
+                    print(str(update.path), update.get_value())
+
+        :param paths: List of paths
+        :type paths: list
+        :param options:
+        :type options: gnmi.structures.SubscribeOptions
+        :rtype: gnmi.messages.SubscribeResponse_
+        """
+        stub = await self._get_stub()
+        timeout = options.get("timeout")
+        sub_list = self._subscription_list(paths, options)
+
+        def _sr():
+            yield pb.SubscribeRequest(subscribe=sub_list)
+
+        call = stub.Subscribe(_sr(), timeout=timeout, metadata=self.metadata)
+        try:
+            async for r in call:
+                yield SubscribeResponse_(r)
+        except grpc.RpcError as rpcerr:
+            raise self._subscribe_error(rpcerr)
+        finally:
+            # consumer stopped early, don't leave the stream open
+            call.cancel()
+
+    async def poll(self, paths: list,
+                   options: SubscribeOptions = {}) -> 'AsyncPollSubscription':
+        r"""Open a POLL mode subscription
+
+        Usage::
+
+            sub = await sess.poll(["/system/memory/state"])
+            try:
+                for _ in range(3):
+                    notifications = await sub.poll()
+                    await asyncio.sleep(10)
+            finally:
+                sub.close()
+
+        :param paths: List of paths
+        :type paths: list
+        :param options: ``mode`` is forced to ``poll``
+        :type options: gnmi.structures.SubscribeOptions
+        :rtype: gnmi.aio.session.AsyncPollSubscription
+        """
+        stub = await self._get_stub()
+        sub_list = self._poll_subscription_list(paths, options)
+
+        call = stub.Subscribe(metadata=self.metadata)
+        await call.write(pb.SubscribeRequest(subscribe=sub_list))
+        return AsyncPollSubscription(self, call)
+
+
+class AsyncPollSubscription(object):
+    r"""Handle of an open POLL mode subscription
+
+    See :class:`gnmi.session.PollSubscription`.
+    """
+
+    def __init__(self, session: AsyncSession, call):
+        self.session = session
+        self._call = call
+        self._lock = asyncio.Lock()
+        self._initial = True
+        self.polls = 0
+
+    async def __aenter__(self) -> 'AsyncPollSubscription':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.close()
+
+    async def poll(self) -> List[Notification_]:
+        r"""Trigger a poll and wait for the target to answer it
+
+        :rtype: list of gnmi.messages.Notification_
+        """
+        async with self._lock:
+            try:
+                if self._initial:
+                    self._initial = False
+                else:
+                    await self._call.write(pb.SubscribeRequest(poll=pb.Poll()))
+                self.polls += 1
+
+                notifications = []
+                while True:
+                    r = await self._call.read()
+                    if r is grpc.aio.EOF or r.sync_response:
+                        return notifications
+                    notifications.append(Notification_(r.update))
+            except grpc.RpcError as rpcerr:
+                raise self.session._subscribe_error(rpcerr)
+
+    def close(self) -> None:
+        r"""Cancel the subscription"""
+        self._call.cancel()
@@ -7,6 +7,7 @@ from gnmi.messages import Notification_, SetResponse_, Update_, Path_
 from gnmi.exceptions import GrpcDeadlineExceeded
 from typing import Any, Generator, List, Tuple
 
+from gnmi.pool import default_pool
 from gnmi.session import Session
 from gnmi.structures import Auth, CertificateStore, GetOptions, Metadata
 from gnmi.structures import Options, SubscribeOptions, GrpcOptions
@@ -14,11 +15,11 @@ from gnmi.target import Target
 
 __all__ = ["capabilites", "delete", "get", "replace", "subscribe", "update"]
 
-def _new_session(target: str,
+def _session_args(target: str,
         auth: Auth = None,
         insecure: bool = False,
         certificates: CertificateStore = {},
-        override: str = None):
+        override: str = None) -> Tuple[Target, dict]:
     
     target = Target.from_url(target)
 
@@ -34,10 +35,21 @@ def _new_session(target: str,
     if override:
         grpc_options["server_host_override"] = override
     
-    return Session(target, metadata=metadata, certificates=certificates,
+    return target, dict(metadata=metadata, certificates=certificates,
                 insecure=insecure, grpc_options=grpc_options)
 
 
+def _new_session(target: str,
+        auth: Auth = None,
+        insecure: bool = False,
+        certificates: CertificateStore = {},
+        override: str = None):
+    
+    target, kwargs = _session_args(target, auth, insecure, certificates,
+                                   override)
+    return Session(target, pool=default_pool, **kwargs)
+
+
 def capabilites(target: str, 
         auth: Auth = None,
         insecure: bool = False,
@@ -59,8 +71,8 @@ def capabilites(target: str,
     :param override: override hostname
     :type override: str
     """
-    sess = _new_session(target, auth, insecure, certificates, override)
-    return sess.capabilities()
+    with _new_session(target, auth, insecure, certificates, override) as sess:
+        return sess.capabilities()
 
 
 def get(target: str,
@@ -96,10 +108,9 @@ def get(target: str,
     :param options: Get options
     :type options: gnmi.structures.GetOptions
     """
-    sess = _new_session(target, auth, insecure, certificates, override)
-
-    for notif in sess.get(paths, options=options):
-        yield notif
+    with _new_session(target, auth, insecure, certificates, override) as sess:
+        for notif in sess.get(paths, options=options):
+            yield notif
 
 
 def subscribe(target: str,
@@ -137,16 +148,15 @@ def subscribe(target: str,
     :param options: Subscribe options
     :type options: gnmi.structures.SubscribeOptions
     """
-    sess = _new_session(target, auth, insecure, certificates, override)
-
-    try:
-        for resp in sess.subscribe(paths, options=options):
-            if resp.sync_response:
-                continue
-            yield resp.update
+    with _new_session(target, auth, insecure, certificates, override) as sess:
+        try:
+            for resp in sess.subscribe(paths, options=options):
+                if resp.sync_response:
+                    continue
+                yield resp.update
 
-    except GrpcDeadlineExceeded:
-        pass
+        except GrpcDeadlineExceeded:
+            pass
 
 
 def delete(target: str,
@@ -177,8 +187,8 @@ def delete(target: str,
     :param options: Subscribe options
     :type options: gnmi.structures.SubscribeOptions
     """
-    sess = _new_session(target, auth, insecure, certificates, override)
-    return sess.set(deletes=deletes, options=options)
+    with _new_session(target, auth, insecure, certificates, override) as sess:
+        return sess.set(deletes=deletes, options=options)
 
 
 def replace(target: str,
@@ -209,8 +219,8 @@ def replace(target: str,
     :param options: Subscribe options
     :type options: gnmi.structures.SubscribeOptions
     """
-    sess = _new_session(target, auth, insecure, certificates, override)
-    return sess.set(replacements=replacements, options=options)
+    with _new_session(target, auth, insecure, certificates, override) as sess:
+        return sess.set(replacements=replacements, options=options)
 
 
 def update(target: str,
@@ -241,5 +251,5 @@ def update(target: str,
     :param options: Subscribe options
     :type options: gnmi.structures.SubscribeOptions
     """
-    sess = _new_session(target, auth, insecure, certificates, override)
-    return sess.set(updates=updates, options=options)
+    with _new_session(target, auth, insecure, certificates, override) as sess:
+        return sess.set(updates=updates, options=options)
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.batch
+~~~~~~~~~~~~~~~~
+
+Batching and coalescing of Set operations
+
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Set, Tuple
+
+import grpc
+
+from gnmi.proto import gnmi_pb2 as pb  # type: ignore
+from gnmi.messages import Path_, SetResponse_, Update_
+from gnmi.structures import Options
+
+__all__ = ["SetBatcher"]
+
+DELETE = "delete"
+REPLACE = "replace"
+UPDATE = "update"
+
+# order in which a target applies the operations of one SetRequest
+_RANK = {DELETE: 0, REPLACE: 1, UPDATE: 2}
+
+_Key = Tuple[Any, ...]
+
+
+def _path_key(path: pb.Path) -> _Key:
+    return (path.origin,) + tuple(
+        (e.name, tuple(sorted(e.key.items()))) for e in path.elem)
+
+
+class _Op(object):
+
+    def __init__(self, kind: str, key: _Key, message, value: Any = None):
+        self.kind = kind
+        self.key = key
+        self.message = message
+        self.value = value
+        self.size = message.ByteSize()
+        self.future: Future = Future()
+        self.dropped = False
+
+
+class _Batch(object):
+
+    def __init__(self):
+        self.ops: List[_Op] = []
+        self.size = 0
+        self.count = 0
+        self.by_key: Dict[_Key, List[_Op]] = {}
+        # every prefix of a pending path -> pending paths below it
+        self.by_prefix: Dict[_Key, Set[_Key]] = {}
+
+    def add(self, op: _Op) -> None:
+        self.ops.append(op)
+        self.size += op.size
+        self.count += 1
+        self.by_key.setdefault(op.key, []).append(op)
+        for i in range(1, len(op.key) + 1):
+            self.by_prefix.setdefault(op.key[:i], set()).add(op.key)
+
+    def drop(self, op: _Op) -> None:
+        op.dropped = True
+        self.size -= op.size
+        self.count -= 1
+        ops = self.by_key[op.key]
+        ops.remove(op)
+        if not ops:
+            del self.by_key[op.key]
+            for i in range(1, len(op.key) + 1):
+                keys = self.by_prefix[op.key[:i]]
+                keys.discard(op.key)
+                if not keys:
+                    del self.by_prefix[op.key[:i]]
+
+    def overlapping(self, key: _Key) -> List[Tuple[_Op, bool]]:
+        r"""Pending ops on `key`, its ancestors and descendants, flagged
+        ``True`` when they sit at or below `key`
+        """
+        found = []
+        for i in range(1, len(key)):
+            for op in self.by_key.get(key[:i], ()):
+                found.append((op, False))
+        for below in self.by_prefix.get(key, ()):
+            for op in self.by_key[below]:
+                found.append((op, True))
+        return found
+
+    def request(self, prefix: pb.Path) -> pb.SetRequest:
+        setargs: Dict[str, Any] = dict(prefix=prefix, delete=[], replace=[],
+                                       update=[])
+        for op in self.ops:
+            if not op.dropped:
+                setargs[op.kind].append(op.message)
+        return pb.SetRequest(**setargs)
+
+
+class SetBatcher(object):
+    r"""Accumulates Set operations from many callers into few SetRequests
+
+    Every operation returns a :class:`concurrent.futures.Future` resolved
+    with the :class:`gnmi.messages.SetResponse_` of the request that applied
+    it, or the :class:`gnmi.exceptions.GrpcError` it failed with.
+
+    Writes are coalesced while they wait:
+
+    * a delete or replace drops pending writes to the same path and below it
+    * an update of a leaf drops a pending update of the same leaf, updates
+      with a ``dict`` value are merged by the target and all kept
+
+    A target applies the deletes, replaces and updates of one request in
+    that order. When an operation would be reordered against a pending one
+    on an overlapping path the batch is closed and the operation starts the
+    next one, so the outcome always matches submission order. A batch is
+    also closed once it holds `max_ops` operations or `max_bytes` of encoded
+    operations. Closed batches are sent right away by the caller that closed
+    them, :meth:`flush` sends the rest.
+
+    Usage::
+
+        >>> with SetBatcher(sess, max_bytes=256 * 1024) as batcher:
+        ...     for name, desc in descriptions.items():
+        ...         path = "/interfaces/interface[name=%s]/config/description"
+        ...         batcher.update(path % name, desc)
+        >>> # leaving the block flushed everything
+
+    :param session: gNMI session
+    :type session: gnmi.session.Session
+    :param max_bytes: encoded size of the operations in one request
+    :type max_bytes: int
+    :param max_ops: operations in one request
+    :type max_ops: int
+    :param options: Set options applied to every request
+    :type options: gnmi.structures.Options
+    """
+
+    def __init__(self, session, max_bytes: int = 1024 * 1024,
+                 max_ops: int = 10000, options: Options = {}):
+        self.session = session
+        self.max_bytes = max_bytes
+        self.max_ops = max_ops
+        self.options = options
+        self.requests = 0
+        self.superseded = 0
+
+        self._prefix = session._parse_path(options.get("prefix"))
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._batch = _Batch()
+        self._sealed: List[_Batch] = []
+
+    def __enter__(self) -> 'SetBatcher':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.flush()
+
+    def update(self, path: str, value: Any) -> Future:
+        r"""Queue an update (merge) of `path` with `value`"""
+        message = Update_.from_keyval((path, value)).raw
+        return self._submit(_Op(UPDATE, _path_key(message.path), message,
+                                value))
+
+    def replace(self, path: str, value: Any) -> Future:
+        r"""Queue a replacement of `path` with `value`"""
+        message = Update_.from_keyval((path, value)).raw
+        return self._submit(_Op(REPLACE, _path_key(message.path), message,
+                                value))
+
+    def delete(self, path: str) -> Future:
+        r"""Queue a delete of `path`"""
+        message = Path_.from_string(path).raw
+        return self._submit(_Op(DELETE, _path_key(message), message))
+
+    def _supersedes(self, op: _Op, pending: _Op, below: bool) -> bool:
+        if op.kind in (DELETE, REPLACE):
+            return below
+        return pending.kind == UPDATE and pending.key == op.key and \
+            not isinstance(op.value, dict)
+
+    def _submit(self, op: _Op) -> Future:
+        with self._lock:
+            batch = self._batch
+            for pending, below in batch.overlapping(op.key):
+                if self._supersedes(op, pending, below):
+                    batch.drop(pending)
+                    self.superseded += 1
+                    op.future.add_done_callback(
+                        lambda f, pending=pending: _chain(f, pending.future))
+                elif _RANK[pending.kind] > _RANK[op.kind]:
+                    self._seal()
+                    break
+
+            if self._batch.count and (
+                    self._batch.count >= self.max_ops or
+                    self._batch.size + op.size > self.max_bytes):
+                self._seal()
+            self._batch.add(op)
+            send = bool(self._sealed)
+
+        if send:
+            self._send_sealed()
+        return op.future
+
+    def _seal(self) -> None:
+        if self._batch.count:
+            self._sealed.append(self._batch)
+        self._batch = _Batch()
+
+    def _send_sealed(self) -> None:
+        with self._send_lock:
+            while True:
+                with self._lock:
+                    if not self._sealed:
+                        return
+                    batch = self._sealed.pop(0)
+                self._send(batch)
+
+    def _send(self, batch: _Batch) -> None:
+        ops = [op for op in batch.ops if not op.dropped]
+        with self._lock:
+            self.requests += 1
+        try:
+            request = batch.request(self._prefix)
+            response = self.session._stub.Set(request,
+                                              metadata=self.session.metadata)
+            result = SetResponse_(response)
+        except grpc.RpcError as rpcerr:
+            error = self.session._rpc_error(rpcerr)
+            for op in ops:
+                op.future.set_exception(error)
+            return
+        except Exception as exc:
+            # e.g. a closed channel or a value that cannot be serialized,
+            # callers would otherwise wait on the futures forever
+            for op in ops:
+                op.future.set_exception(exc)
+            return
+
+        for op in ops:
+            op.future.set_result(result)
+
+    def flush(self) -> None:
+        r"""Send every pending operation and wait for the responses"""
+        with self._lock:
+            self._seal()
+        self._send_sealed()
+
+    @property
+    def pending(self) -> int:
+        r"""Number of operations not sent yet"""
+        with self._lock:
+            return self._batch.count + sum(b.count for b in self._sealed)
+
+
+def _chain(source: Future, target: Future) -> None:
+    if source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
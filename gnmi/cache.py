@@ -0,0 +1,393 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.cache
+~~~~~~~~~~~~~~~~
+
+Live state tree maintained from subscriptions
+
+"""
+
+import collections
+import threading
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple, Union
+
+from gnmi import values
+from gnmi.path import MULTI_WILDCARD, WILDCARD, Elem, Keys, PathKey, elem_matches
+
+Leaf = collections.namedtuple("Leaf", ("path", "value", "timestamp"))
+Leaf.__doc__ = "Latest value and timestamp of a path in a :class:`StateCache`"
+
+
+class _Node(object):
+
+    __slots__ = ("children", "value", "timestamp", "generation", "has_value")
+
+    def __init__(self):
+        # entries by name then by keys, so that lookups of names are O(1)
+        # even when keys have to be matched against a wildcard
+        self.children: Dict[str, Dict[Keys, "_Node"]] = {}
+        self.has_value = False
+        self.value: Any = None
+        self.timestamp = 0
+        self.generation = 0
+
+    def empty(self) -> bool:
+        return not self.children and not self.has_value
+
+    def child(self, elem: Elem) -> Optional["_Node"]:
+        entries = self.children.get(elem[0])
+        if entries is None:
+            return None
+        return entries.get(elem[1])
+
+
+def _to_key(path: Union[PathKey, str, Any]) -> PathKey:
+    if isinstance(path, PathKey):
+        return path
+    if isinstance(path, str):
+        return PathKey.from_string(path)
+    return path.key
+
+
+class StateCache(object):
+    r"""Latest value of every leaf of one or more subscriptions
+
+    Leaves are kept in a trie of path elements: exact lookups are O(depth),
+    deletes remove the whole subtree and wildcard queries only visit the
+    matching branches.
+
+    Updates received before the first ``sync_response`` are applied but
+    :attr:`synced` stays ``False`` until it arrives. After :meth:`resync`,
+    e.g. when a subscription is re-established, leaves not refreshed by the
+    new initial sync are removed once it completes.
+
+    The cache is safe to read from other threads while a subscription is
+    consumed.
+
+    Usage::
+
+        >>> cache = StateCache()
+        >>> threading.Thread(target=cache.consume,
+        ...                  args=(sess.subscribe(paths),), daemon=True).start()
+        >>> cache.wait_synced(10)
+        >>> for leaf in cache.query("/interfaces/interface[name=*]/state/counters"):
+        ...     print(leaf.path, leaf.value)
+    """
+
+    def __init__(self):
+        self._roots: Dict[str, _Node] = {}
+        self._lock = threading.RLock()
+        self._synced = threading.Event()
+        self._resyncing = False
+        self._count = 0
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, path: Union[PathKey, str]) -> bool:
+        return self.get(path) is not None
+
+    @property
+    def synced(self) -> bool:
+        return self._synced.is_set()
+
+    def wait_synced(self, timeout: Optional[float] = None) -> bool:
+        r"""Wait for the initial sync to complete
+
+        :param timeout: seconds to wait, ``None`` waits forever
+        :type timeout: float
+        :rtype: bool
+        :returns: ``True`` once synced, ``False`` on timeout
+        """
+        return self._synced.wait(timeout)
+
+    def resync(self) -> None:
+        r"""Start a new initial sync
+
+        Leaves not updated between this call and the next ``sync_response``
+        are removed when it is applied.
+        """
+        with self._lock:
+            self.generation += 1
+            self._resyncing = True
+            self._synced.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._roots.clear()
+            self._count = 0
+
+    def update(self, path: Union[PathKey, str], value: Any,
+               timestamp: int = 0) -> None:
+        r"""Set the value of a leaf
+
+        :param path: the path
+        :type path: Union[PathKey, str]
+        :param value: the value
+        :type value: Any
+        :param timestamp: timestamp in nanoseconds
+        :type timestamp: int
+        """
+        key = _to_key(path)
+        with self._lock:
+            node = self._roots.get(key.origin)
+            if node is None:
+                node = self._roots[key.origin] = _Node()
+
+            for name, keys in key.elems:
+                entries = node.children.get(name)
+                if entries is None:
+                    entries = node.children[name] = {}
+                child = entries.get(keys)
+                if child is None:
+                    child = entries[keys] = _Node()
+                node = child
+
+            if not node.has_value:
+                node.has_value = True
+                self._count += 1
+            node.value = value
+            node.timestamp = timestamp
+            node.generation = self.generation
+
+    def delete(self, path: Union[PathKey, str]) -> int:
+        r"""Remove a path and everything below it
+
+        The path is resolved like the patterns of :meth:`query`, it may
+        contain wildcards and list elements without keys remove every entry.
+
+        :param path: the path
+        :type path: Union[PathKey, str]
+        :rtype: int
+        :returns: number of leaves removed
+        """
+        key = _to_key(path)
+        with self._lock:
+            paths = [p for p, _ in self._match_nodes(key)]
+            return sum(self._delete(p) for p in paths)
+
+    def _delete(self, key: PathKey, subtree: bool = True) -> int:
+        # remove the node at `key` with its subtree, or only its value, and
+        # the ancestors left empty
+        root = self._roots.get(key.origin)
+        if root is None:
+            return 0
+
+        trail: List[Tuple[_Node, Elem]] = []
+        node = root
+        for elem in key.elems:
+            child = node.child(elem)
+            if child is None:
+                return 0
+            trail.append((node, elem))
+            node = child
+
+        if subtree:
+            removed = self._leaves(node)
+            node.children = {}
+        else:
+            removed = int(node.has_value)
+        node.has_value = False
+        node.value = None
+        self._count -= removed
+
+        trail.append((node, ("", ())))
+        for (parent, (name, keys)), (child, _) in zip(
+                reversed(trail[:-1]), reversed(trail[1:])):
+            if not child.empty():
+                break
+            self._unlink(parent, name, keys)
+
+        if root.empty():
+            del self._roots[key.origin]
+        return removed
+
+    @staticmethod
+    def _unlink(parent: _Node, name: str, keys: Keys) -> None:
+        entries = parent.children[name]
+        del entries[keys]
+        if not entries:
+            del parent.children[name]
+
+    @staticmethod
+    def _leaves(node: _Node) -> int:
+        count = 0
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            count += node.has_value
+            for entries in node.children.values():
+                stack.extend(entries.values())
+        return count
+
+    def get(self, path: Union[PathKey, str]) -> Optional[Leaf]:
+        r"""Latest value of a leaf
+
+        :param path: the path, without wildcards
+        :type path: Union[PathKey, str]
+        :rtype: Optional[Leaf]
+        """
+        key = _to_key(path)
+        with self._lock:
+            node = self._roots.get(key.origin)
+            for elem in key.elems:
+                if node is None:
+                    return None
+                node = node.child(elem)
+
+            if node is None or not node.has_value:
+                return None
+            return Leaf(key, node.value, node.timestamp)
+
+    def query(self, pattern: Union[PathKey, str]) -> List[Leaf]:
+        r"""Leaves at or below the paths matching `pattern`
+
+        Usage::
+
+            >>> cache.query("/interfaces/interface[name=*]/state/oper-status")
+            [Leaf(path=PathKey('/interfaces/interface[name=Et1]/state/oper-status'),
+                  value='UP', timestamp=1700000000000000000)]
+
+        :param pattern: the path, ``*`` matches any name or key value,
+            ``...`` any number of elements and list elements without keys
+            every entry
+        :type pattern: Union[PathKey, str]
+        :rtype: List[Leaf]
+        """
+        key = _to_key(pattern)
+        with self._lock:
+            return [Leaf(path, node.value, node.timestamp)
+                    for match in self._match_nodes(key)
+                    for path, node in self._subtree(*match)]
+
+    def _match_nodes(self, pattern: PathKey) -> List[Tuple[PathKey, _Node]]:
+        if pattern.origin:
+            roots = [(pattern.origin, self._roots.get(pattern.origin))]
+        else:
+            roots = list(self._roots.items())
+
+        matched: Dict[int, Tuple[PathKey, _Node]] = {}
+        for origin, root in roots:
+            if root is not None:
+                self._match(root, pattern.elems, 0, PathKey(origin=origin),
+                            matched)
+        return list(matched.values())
+
+    def _match(self, node: _Node, pattern: Tuple[Elem, ...], i: int,
+               path: PathKey, matched: Dict[int, Tuple[PathKey, _Node]]) -> None:
+        if i == len(pattern):
+            matched.setdefault(id(node), (path, node))
+            return
+
+        name, keys = pattern[i]
+        if name == MULTI_WILDCARD:
+            self._match(node, pattern, i + 1, path, matched)
+            for child_name, entries in node.children.items():
+                for child_keys, child in entries.items():
+                    self._match(child, pattern, i,
+                                path + PathKey._make("", ((child_name, child_keys),)),
+                                matched)
+            return
+
+        if name == WILDCARD:
+            candidates = list(node.children.items())
+        elif name in node.children:
+            candidates = [(name, node.children[name])]
+        else:
+            return
+
+        for child_name, entries in candidates:
+            exact = entries.get(keys) if keys else None
+            if exact is not None:
+                items: Iterable = [(keys, exact)]
+            else:
+                items = entries.items()
+
+            for child_keys, child in items:
+                if exact is None and not elem_matches(
+                        (child_name, keys), (child_name, child_keys)):
+                    continue
+                self._match(child, pattern, i + 1,
+                            path + PathKey._make("", ((child_name, child_keys),)),
+                            matched)
+
+    @staticmethod
+    def _subtree(path: PathKey, node: _Node) -> Generator[Tuple[PathKey, _Node], None, None]:
+        # nodes holding a value at or below `node`
+        stack = [(path, node)]
+        while stack:
+            path, node = stack.pop()
+            if node.has_value:
+                yield path, node
+            for name, entries in node.children.items():
+                for keys, child in entries.items():
+                    stack.append((path + PathKey._make("", ((name, keys),)), child))
+
+    def items(self) -> List[Leaf]:
+        r"""All leaves
+
+        :rtype: List[Leaf]
+        """
+        return self.query(PathKey())
+
+    def _prune(self, generation: int) -> None:
+        # remove the values set before `generation`
+        stale = [path for origin, root in self._roots.items()
+                 for path, node in self._subtree(PathKey(origin=origin), root)
+                 if node.generation < generation]
+        for path in stale:
+            self._delete(path, subtree=False)
+
+    def apply(self, response: Any) -> None:
+        r"""Apply a subscribe response or a notification
+
+        :param response: the response
+        :type response: Union[gnmi.messages.SubscribeResponse_, gnmi.messages.Notification_]
+        """
+        if hasattr(response, "sync_response"):
+            if response.sync_response:
+                with self._lock:
+                    if self._resyncing:
+                        self._prune(self.generation)
+                        self._resyncing = False
+                    self._synced.set()
+                return
+            if not response.raw.HasField("update"):
+                return
+            notification = response.update
+        else:
+            notification = response
+
+        raw = notification.raw
+        prefix = notification.prefix.key
+        timestamp = raw.timestamp
+
+        with self._lock:
+            for path in notification.delete:
+                self.delete(prefix + path.key)
+
+            for update in raw.update:
+                if update.HasField("val"):
+                    value = values.decode(update.val)
+                else:
+                    value = values.extract_values([update])[0]
+                self.update(prefix + PathKey.from_pb(update.path), value,
+                            timestamp)
+
+    def consume(self, responses: Iterable[Any]) -> None:
+        r"""Apply `responses` until they are exhausted
+
+        :param responses: subscribe responses, e.g. from
+            :meth:`gnmi.session.Session.subscribe`, or get responses
+        :type responses: Iterable
+        """
+        for response in responses:
+            if hasattr(response, "sync_response") or \
+                    not hasattr(response, "notification"):
+                self.apply(response)
+            else:
+                for notification in response.notification:
+                    self.apply(notification)
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.certcache
+~~~~~~~~~~~~~~~~
+
+Trust-on-first-use cache of server certificates for targets without a CA
+
+"""
+
+import hashlib
+import json
+import os
+import pathlib
+import re
+import socket
+import ssl
+import tempfile
+import threading
+import time
+import warnings
+from typing import Dict, Optional, Union
+
+from gnmi.environments import GNMI_CERT_CACHE, GNMI_CERT_PIN
+from gnmi.exceptions import GnmiCertificateError
+from gnmi.target import Target
+
+__all__ = ["CertificateCache", "default_cache", "fetch_server_certificate",
+           "fingerprint"]
+
+DEFAULT_MAX_AGE: float = 24 * 60 * 60
+DEFAULT_CONNECT_TIMEOUT: float = 10.0
+
+
+def fingerprint(pem: bytes) -> str:
+    r"""SHA-256 fingerprint of a PEM certificate"""
+    der = ssl.PEM_cert_to_DER_cert(pem.decode())
+    return hashlib.sha256(der).hexdigest()
+
+
+def fetch_server_certificate(target: Target,
+                             timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT
+                             ) -> bytes:
+    r"""Retrieve the certificate presented by `target` as PEM
+
+    :param target: the target
+    :type target: gnmi.target.Target
+    :param timeout: seconds allowed for the connection and for each step of
+        the handshake, ``None`` waits forever
+    :type timeout: float
+    :rtype: bytes
+    """
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+
+    if target.path is None:
+        sock = socket.create_connection(target.addr, timeout=timeout)
+        server_hostname: Optional[str] = target.location
+    else:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        server_hostname = None
+        try:
+            sock.connect(target.path)
+        except OSError:
+            sock.close()
+            raise
+
+    with sock:
+        with context.wrap_socket(sock, server_hostname=server_hostname) as tls:
+            der = tls.getpeercert(binary_form=True)
+    return ssl.DER_cert_to_PEM_cert(der).encode()
+
+
+class CertificateCache(object):
+    r"""Caches server certificates on disk so that reconnects, other sessions
+    and other processes skip the extra handshake used to fetch them
+
+    Entries are JSON files in `path`, one per target, written atomically so
+    processes can share the directory. An entry is used without contacting
+    the target for `max_age` seconds, or until :meth:`expire` is called,
+    e.g. when a session reconnects. After that the certificate is fetched
+    again: if its fingerprint changed a
+    :class:`gnmi.exceptions.GnmiCertificateError` is raised, without `pin` a
+    warning is issued and the new certificate replaces the old one. Entries
+    whose stored fingerprint does not match their certificate are ignored.
+
+    Without a `path` certificates are only cached in memory.
+
+    :param path: cache directory
+    :type path: str
+    :param max_age: seconds an entry is trusted without checking the target
+    :type max_age: float
+    :param pin: refuse certificates that differ from the cached one, see
+        ``GNMI_CERT_PIN``
+    :type pin: bool
+    """
+
+    def __init__(self, path: Optional[Union[str, os.PathLike]] = None,
+                 max_age: float = DEFAULT_MAX_AGE, pin: bool = GNMI_CERT_PIN):
+        self.path = pathlib.Path(path) if path else None
+        self.max_age = max_age
+        self.pin = pin
+        self._memory: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(target: Target) -> str:
+        return str(target)
+
+    def _file(self, key: str) -> pathlib.Path:
+        return self.path / (re.sub(r"[^\w.\-]", "_", key) + ".json")  # type: ignore
+
+    def _load(self, key: str) -> Optional[dict]:
+        entry = self._memory.get(key)
+        if entry is None and self.path is not None:
+            try:
+                with open(self._file(key), "r") as fh:
+                    entry = json.load(fh)
+            except (OSError, ValueError):
+                return None
+
+        if entry is None or entry.get("target") != key:
+            return None
+        try:
+            if fingerprint(entry["pem"].encode()) != entry["fingerprint"]:
+                return None
+        except (KeyError, ValueError):
+            return None
+
+        self._memory[key] = entry
+        return entry
+
+    def _store(self, key: str, entry: dict) -> None:
+        self._memory[key] = entry
+        if self.path is None:
+            return
+
+        self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w") as fh:
+                json.dump(entry, fh)
+            os.replace(tmp, self._file(key))
+        except OSError:
+            os.unlink(tmp)
+            raise
+
+    def lookup(self, target: Target) -> Optional[bytes]:
+        r"""Return the cached certificate of `target`, even if expired"""
+        with self._lock:
+            entry = self._load(self._key(target))
+        return entry["pem"].encode() if entry else None
+
+    def get(self, target: Target) -> bytes:
+        r"""Return the certificate of `target`, fetching it if it is not
+        cached or the cached entry expired
+
+        :rtype: bytes PEM encoded certificate
+        """
+        key = self._key(target)
+        with self._lock:
+            entry = self._load(key)
+        if entry is not None and time.time() - entry["fetched"] < self.max_age:
+            return entry["pem"].encode()
+
+        pem = fetch_server_certificate(target)
+        digest = fingerprint(pem)
+
+        if entry is not None and entry["fingerprint"] != digest:
+            message = ("certificate of %s changed from %s to %s" %
+                       (key, entry["fingerprint"], digest))
+            if self.pin:
+                raise GnmiCertificateError(
+                    message + ", remove the cached certificate to trust it")
+            warnings.warn(message, RuntimeWarning, stacklevel=2)
+
+        with self._lock:
+            self._store(key, {"target": key, "fetched": time.time(),
+                              "fingerprint": digest, "pem": pem.decode()})
+        return pem
+
+    def expire(self, target: Target) -> None:
+        r"""Fetch the certificate of `target` again on the next :meth:`get`
+
+        The entry is kept, so a changed certificate is still detected.
+        """
+        key = self._key(target)
+        with self._lock:
+            entry = self._load(key)
+            if entry is not None and entry["fetched"]:
+                self._store(key, dict(entry, fetched=0))
+
+    def remove(self, target: Target) -> None:
+        r"""Forget the certificate of `target`"""
+        key = self._key(target)
+        with self._lock:
+            self._memory.pop(key, None)
+            if self.path is not None:
+                try:
+                    self._file(key).unlink()
+                except FileNotFoundError:
+                    pass
+
+    def clear(self) -> None:
+        r"""Forget every certificate"""
+        with self._lock:
+            self._memory.clear()
+            if self.path is not None and self.path.exists():
+                for fil in self.path.glob("*.json"):
+                    fil.unlink()
+
+
+default_cache = CertificateCache(GNMI_CERT_CACHE)
@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.columnar
+~~~~~~~~~~~~~~~~
+
+Accumulate notifications into columnar record batches
+
+Each update, and each delete, becomes a row of the columns:
+
+- ``timestamp``: notification timestamp in nanoseconds
+- ``target``: the target name
+- ``path_id``: index of the full path in the paths of the batch, only the
+  paths used by a batch are kept, so ids are not stable across batches
+- ``kind``: which value column holds the value, see :data:`KINDS`
+- ``int_value``, ``uint_value``, ``float_value``, ``bool_value``,
+  ``string_value`` and ``bytes_value``
+
+JSON values are kept as text in ``string_value`` and are never decoded,
+Decimal64 values are stored as floats.
+
+Batches are ``pyarrow.RecordBatch`` objects, where ``path_id`` is replaced by
+a dictionary encoded ``path`` column whose indices are the path ids, or
+:class:`ColumnarBatch` objects of NumPy arrays when pyarrow is not
+installed.
+
+The flush interval is checked when rows are added, a stream that goes quiet
+keeps its partial batch until :meth:`ColumnarBatcher.flush_expired` or
+:meth:`ColumnarBatcher.flush` is called, e.g. from a timer thread.
+
+"""
+
+import importlib
+import importlib.util
+import json
+import threading
+import time
+from typing import Any, Dict, Generator, Iterable, List, Optional
+
+from gnmi import values
+
+ARROW_SUPPORTED: bool = importlib.util.find_spec("pyarrow") is not None
+NUMPY_SUPPORTED: bool = importlib.util.find_spec("numpy") is not None
+
+KINDS = ("null", "int", "uint", "float", "bool", "string", "bytes", "json")
+NULL, INT, UINT, FLOAT, BOOL, STRING, BYTES, JSON = range(len(KINDS))
+
+# value column, numpy dtype and arrow type name by kind
+_COLUMNS = (
+    ("int_value", "int64", "int64", (INT,)),
+    ("uint_value", "uint64", "uint64", (UINT,)),
+    ("float_value", "float64", "float64", (FLOAT,)),
+    ("bool_value", "bool", "bool_", (BOOL,)),
+    ("string_value", "object", "string", (STRING, JSON)),
+    ("bytes_value", "object", "binary", (BYTES,)),
+)
+
+_FIELD_KINDS = {
+    "int_val": INT,
+    "uint_val": UINT,
+    "float_val": FLOAT,
+    "double_val": FLOAT,
+    "bool_val": BOOL,
+    "string_val": STRING,
+    "ascii_val": STRING,
+    "bytes_val": BYTES,
+    "proto_bytes": BYTES,
+}
+
+
+def _convert(value: Any) -> tuple:
+    field = value.WhichOneof("value")
+    kind = _FIELD_KINDS.get(field)
+    if kind is not None:
+        return kind, getattr(value, field)
+
+    if field in ("json_val", "json_ietf_val"):
+        return JSON, getattr(value, field).decode("utf-8")
+    if field == "decimal_val":
+        return FLOAT, values._decimal_float(value.decimal_val)
+    if field == "leaflist_val":
+        return JSON, json.dumps(values.decode(value), default=str)
+    if field == "any_val":
+        return BYTES, value.any_val.SerializeToString()
+    return NULL, None
+
+
+class ColumnarBatch(object):
+    r"""A batch of rows as NumPy arrays
+
+    :param columns: arrays by column name
+    :type columns: Dict[str, numpy.ndarray]
+    :param paths: full paths of the batch by path id
+    :type paths: List[str]
+    """
+
+    __slots__ = ("columns", "paths")
+
+    def __init__(self, columns: Dict[str, Any], paths: List[str]):
+        self.columns = columns
+        self.paths = paths
+
+    def __len__(self) -> int:
+        return len(self.columns["timestamp"])
+
+    num_rows = property(__len__)
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns[name]
+
+    def path(self, row: int) -> str:
+        return self.paths[self.columns["path_id"][row]]
+
+    def value(self, row: int) -> Any:
+        kind = self.columns["kind"][row]
+        for name, _, _, kinds in _COLUMNS:
+            if kind in kinds:
+                return self.columns[name][row]
+        return None
+
+
+class ColumnarBatcher(object):
+    r"""Convert notifications into columnar batches
+
+    Usage::
+
+        >>> batcher = ColumnarBatcher(batch_size=50000, flush_interval=1.0)
+        >>> for batch in batcher.feed(sess.subscribe(paths), target="veos1"):
+        ...     table.write(batch)
+
+    :param batch_size: number of rows after which a batch is returned, the
+        rows of a notification are never split so a batch may be larger
+    :type batch_size: int
+    :param flush_interval: seconds after which a partial batch is returned by
+        :meth:`add` or :meth:`flush_expired`, ``None`` to only flush full
+        batches
+    :type flush_interval: float
+    :param backend: ``arrow``, ``numpy`` or ``auto`` for arrow when installed
+    :type backend: str
+    :param target: default value of the target column
+    :type target: str
+    """
+
+    def __init__(self, batch_size: int = 10000,
+                 flush_interval: Optional[float] = None,
+                 backend: str = "auto", target: str = ""):
+
+        if batch_size < 1:
+            raise ValueError("Invalid batch size: %d" % batch_size)
+
+        if backend == "auto":
+            backend = "arrow" if ARROW_SUPPORTED else "numpy"
+        if backend not in ("arrow", "numpy"):
+            raise ValueError("Unknown backend: %s" % backend)
+        if backend == "numpy" and not NUMPY_SUPPORTED:
+            raise ValueError("Columnar batches require pyarrow or numpy")
+
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.backend = backend
+        self.target = target
+
+        self._lib = importlib.import_module(
+            "pyarrow" if backend == "arrow" else "numpy")
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        # paths of the pending rows only, so memory and the cost of a flush
+        # do not grow with every path ever seen
+        self._path_ids: Dict[str, int] = {}
+        self.paths: List[str] = []
+        self._timestamps: List[int] = []
+        self._targets: List[str] = []
+        self._path_column: List[int] = []
+        self._kinds: List[int] = []
+        self._values: List[Any] = []
+        self._started: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    def _path_id(self, path: str) -> int:
+        path_id = self._path_ids.get(path)
+        if path_id is None:
+            path_id = self._path_ids[path] = len(self.paths)
+            self.paths.append(path)
+        return path_id
+
+    def add(self, notification: Any, target: Optional[str] = None) -> Optional[Any]:
+        r"""Add the rows of a notification
+
+        :param notification: the notification
+        :type notification: gnmi.messages.Notification_
+        :param target: target column value, defaults to the prefix target or
+            the batcher target
+        :type target: str
+        :rtype: the batch when it is complete or the flush interval expired
+        """
+        raw = notification.raw
+        if target is None:
+            target = raw.prefix.target or self.target
+
+        with self._lock:
+            if self._started is None:
+                self._started = time.monotonic()
+
+            timestamp = raw.timestamp
+            path_id = self._path_id
+            rows = 0
+
+            for path, value in notification.iter_leaves(decode=False):
+                kind, val = _convert(value)
+                self._path_column.append(path_id(path))
+                self._kinds.append(kind)
+                self._values.append(val)
+                rows += 1
+
+            if raw.delete:
+                prefix = notification.prefix.key
+                for path in notification.delete:
+                    self._path_column.append(path_id(str(prefix + path.key)))
+                    self._kinds.append(NULL)
+                    self._values.append(None)
+                    rows += 1
+
+            self._timestamps.extend([timestamp] * rows)
+            self._targets.extend([target] * rows)
+
+            if len(self._kinds) >= self.batch_size or self._expired():
+                return self._flush()
+
+        return None
+
+    def _expired(self) -> bool:
+        return self.flush_interval is not None and \
+            self._started is not None and \
+            time.monotonic() - self._started >= self.flush_interval
+
+    def flush(self) -> Optional[Any]:
+        r"""Return the pending rows as a batch
+
+        :rtype: the batch or ``None`` when nothing is pending
+        """
+        with self._lock:
+            return self._flush()
+
+    def flush_expired(self) -> Optional[Any]:
+        r"""Return the pending rows as a batch once the flush interval expired
+
+        :meth:`add` only checks the interval when rows arrive, call this
+        periodically, e.g. from a timer thread, so a quiet stream still
+        flushes its partial batch.
+
+        :rtype: the batch or ``None`` when nothing is due
+        """
+        with self._lock:
+            if not self._expired():
+                return None
+            return self._flush()
+
+    def _flush(self) -> Optional[Any]:
+        if not self._kinds:
+            return None
+
+        if self.backend == "arrow":
+            batch = self._arrow_batch()
+        else:
+            batch = self._numpy_batch()
+        self._reset()
+        return batch
+
+    def feed(self, responses: Iterable[Any],
+             target: Optional[str] = None) -> Generator[Any, None, None]:
+        r"""Batch the notifications of `responses`
+
+        The flush interval is only checked as responses arrive, a partial
+        batch of a quiet stream is returned with the next response.
+
+        :param responses: an iterable of notifications, get responses or
+            subscribe responses, e.g. from :meth:`gnmi.session.Session.get`
+            or :meth:`gnmi.session.Session.subscribe`
+        :type responses: Iterable
+        :param target: target column value
+        :type target: str
+        :rtype: Generator of batches, the last one possibly partial
+        """
+        for response in responses:
+            if hasattr(response, "sync_response"):
+                if response.sync_response or \
+                        not response.raw.HasField("update"):
+                    continue
+                notifications = [response.update]
+            elif hasattr(response, "notification"):
+                notifications = response.notification
+            else:
+                notifications = [response]
+
+            for notification in notifications:
+                batch = self.add(notification, target)
+                if batch is not None:
+                    yield batch
+
+        batch = self.flush()
+        if batch is not None:
+            yield batch
+
+    def _numpy_batch(self) -> ColumnarBatch:
+        np = self._lib
+        kinds = np.array(self._kinds, dtype="uint8")
+        columns = {
+            "timestamp": np.array(self._timestamps, dtype="int64"),
+            "target": np.array(self._targets, dtype="object"),
+            "path_id": np.array(self._path_column, dtype="uint32"),
+            "kind": kinds,
+        }
+
+        for name, dtype, _, column_kinds in _COLUMNS:
+            column = np.zeros(len(kinds), dtype=dtype)
+            rows = np.flatnonzero(np.isin(kinds, column_kinds))
+            if len(rows):
+                column[rows] = [self._values[i] for i in rows]
+            columns[name] = column
+
+        return ColumnarBatch(columns, self.paths)
+
+    def _arrow_batch(self) -> Any:
+        pa = self._lib
+        kinds = self._kinds
+        vals = self._values
+
+        arrays = [
+            pa.array(self._timestamps, pa.timestamp("ns")),
+            pa.array(self._targets, pa.string()).dictionary_encode(),
+            pa.DictionaryArray.from_arrays(
+                pa.array(self._path_column, pa.uint32()),
+                pa.array(self.paths, pa.string())),
+            pa.array(kinds, pa.uint8()),
+        ]
+        names = ["timestamp", "target", "path", "kind"]
+
+        for name, _, arrow_type, column_kinds in _COLUMNS:
+            if len(column_kinds) == 1:
+                kind = column_kinds[0]
+                column = [v if k == kind else None for k, v in zip(kinds, vals)]
+            else:
+                column = [v if k in column_kinds else None
+                          for k, v in zip(kinds, vals)]
+            arrays.append(pa.array(column, getattr(pa, arrow_type)()))
+            names.append(name)
+
+        return pa.RecordBatch.from_arrays(arrays, names=names)
@@ -2,16 +2,12 @@
 # Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
 # Arista Networks, Inc. Confidential and Proprietary.
 
+import importlib.util
 from collections.abc import Mapping
 from typing import Any
 
-YAML_SUPPORTED: bool = False
-
-try:
-    import yaml
-    YAML_SUPPORTED = True
-except ImportError:
-    pass
+# yaml is imported on first use, checking for it is much cheaper
+YAML_SUPPORTED: bool = importlib.util.find_spec("yaml") is not None
 
 #TOML_SUPPORTED: bool = False
 # try:
@@ -102,4 +98,5 @@ class Config(ConfigElem):
         if not YAML_SUPPORTED:
             raise ValueError("pyyaml module missing")
 
+        import yaml
         return cls(yaml.safe_load(data))
\ No newline at end of file
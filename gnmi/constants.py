@@ -9,6 +9,11 @@ import grpc
 DEFAULT_GRPC_PORT: Final[int] = 6030
 DEFAULT_GRPC_HOST: Final[str] = "localhost"
 
+# defaults of the batched Get, a chunk is closed at whichever limit comes first
+GET_CHUNK_PATHS: Final[int] = 100
+GET_CHUNK_BYTES: Final[int] = 64 * 1024
+GET_CONCURRENCY: Final[int] = 8
+
 GNMIRC_FILES: Final[List[str]] =  [".gnmirc", "_gnmirc"]
 
 GRPC_CODE_MAP: Final[dict] = {x.value[0]: x for x in grpc.StatusCode}
@@ -24,4 +29,15 @@ DATA_TYPE_MAP: Final[List[str]] = [
     "config",
     "state",
     "operational"
-]
\ No newline at end of file
+]
+
+# status codes worth retrying a subscription for, anything else (auth,
+# invalid paths, unimplemented) will fail the same way again
+RETRYABLE_STATUS_CODES: Final[List[grpc.StatusCode]] = [
+    grpc.StatusCode.ABORTED,
+    grpc.StatusCode.CANCELLED,
+    grpc.StatusCode.INTERNAL,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.UNKNOWN,
+]
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.dedup
+~~~~~~~~~~~~~~~~
+
+Client side suppression of redundant updates
+
+Targets may ignore the ``suppress_redundant`` subscription option, and
+sample subscriptions resend unchanged values every interval. The
+:class:`Deduplicator` drops updates whose value equals the last value seen
+for the same path.
+
+"""
+
+from typing import Any, Dict, Generator, Iterable, Optional, Tuple
+
+import gnmi.proto.gnmi_pb2 as pb
+from gnmi.messages import Notification_, SubscribeResponse_
+from gnmi.path import MULTI_WILDCARD, Elem, PathKey, elem_matches
+
+
+class Deduplicator(object):
+    r"""Drop updates whose value did not change
+
+    Values are remembered by the hash of their serialized form and paths by
+    their hash and last element, grouped under their parent path, which is
+    kept once per group so a delete forgets only the paths of the deleted
+    subtree. At most `max_paths` paths are remembered, when the limit is
+    reached the paths whose value changed least recently are forgotten, so
+    their next update is passed through.
+
+    Usage::
+
+        >>> dedup = Deduplicator(heartbeat=60 * 10**9)
+        >>> for resp in dedup.filter(sess.subscribe(paths, {"submode": "sample"})):
+        ...     print(resp.update)
+
+    :param max_paths: maximum number of paths remembered
+    :type max_paths: int
+    :param heartbeat: nanoseconds, by notification timestamps, after which an
+        unchanged value is passed through anyway, ``None`` to never pass
+        unchanged values
+    :type heartbeat: int
+    """
+
+    def __init__(self, max_paths: int = 1000000,
+                 heartbeat: Optional[int] = None):
+        if max_paths < 1:
+            raise ValueError("Invalid max paths: %d" % max_paths)
+
+        self.max_paths = max_paths
+        self.heartbeat = heartbeat
+        self.passed = 0
+        self.suppressed = 0
+        self.evicted = 0
+
+        # value hashes by path hash, in the order they last changed
+        self._values: Dict[int, int] = {}
+        # timestamps of the last update passed, by path hash
+        self._passed_at: Dict[int, int] = {}
+        # parent and the last elements of its child paths by path hash, by
+        # parent hash
+        self._groups: Dict[int, Tuple[PathKey, Dict[int, Elem]]] = {}
+        # parent hash by path hash
+        self._parents: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def reset(self) -> None:
+        r"""Forget every path, e.g. when a subscription is re-established"""
+        self._values.clear()
+        self._passed_at.clear()
+        self._groups.clear()
+        self._parents.clear()
+
+    def _forget(self, path: int) -> None:
+        del self._values[path]
+        self._passed_at.pop(path, None)
+        parent = self._parents.pop(path)
+        children = self._groups[parent][1]
+        del children[path]
+        if not children:
+            del self._groups[parent]
+
+    def _delete(self, deleted: PathKey) -> None:
+        # the deleted path is matched like a pattern, so list elements
+        # without keys and wildcards delete every matching entry
+        below = PathKey._make(deleted.origin,
+                              deleted.elems + ((MULTI_WILDCARD, ()),))
+        above = deleted[:-1]
+
+        for parent, children in list(self._groups.values()):
+            if below.matches(parent):
+                paths = list(children)
+            elif len(deleted) and above.matches(parent):
+                paths = [p for p, elem in children.items()
+                         if elem_matches(deleted[-1], elem)]
+            else:
+                continue
+            for path in paths:
+                self._forget(path)
+
+    def _changed(self, key: PathKey, value: int, timestamp: int) -> bool:
+        values = self._values
+        path = hash(key)
+        previous = values.get(path)
+
+        if previous == value:
+            if self.heartbeat is None or \
+                    timestamp - self._passed_at.get(path, 0) < self.heartbeat:
+                return False
+        elif previous is not None:
+            # moved to the end, the least recently changed path is first
+            del values[path]
+            values[path] = value
+        else:
+            if len(values) >= self.max_paths:
+                self._forget(next(iter(values)))
+                self.evicted += 1
+            values[path] = value
+
+            parent = key[:-1]
+            group = self._groups.get(hash(parent))
+            if group is None:
+                group = self._groups[hash(parent)] = (parent, {})
+            # the root path has no last element, no name matches it
+            group[1][path] = key[-1] if len(key) else ("", ())
+            self._parents[path] = hash(parent)
+
+        if self.heartbeat is not None:
+            self._passed_at[path] = timestamp
+        return True
+
+    def apply(self, notification: Any) -> Optional[Any]:
+        r"""Remove the redundant updates of a notification
+
+        :param notification: the notification
+        :type notification: gnmi.messages.Notification_
+        :rtype: the notification, a copy without the redundant updates, or
+            ``None`` when nothing is left
+        """
+        raw = notification.raw
+        prefix = notification.prefix.key
+
+        for delete in raw.delete:
+            self._delete(prefix + PathKey.from_pb(delete))
+
+        timestamp = raw.timestamp
+        kept = []
+
+        for update in raw.update:
+            path = prefix + PathKey.from_pb(update.path)
+            if update.HasField("val"):
+                value = hash(update.val.SerializeToString(deterministic=True))
+            else:
+                value = hash(update.value.SerializeToString(deterministic=True))
+
+            if self._changed(path, value, timestamp):
+                kept.append(update)
+
+        self.passed += len(kept)
+        self.suppressed += len(raw.update) - len(kept)
+
+        if len(kept) == len(raw.update):
+            return notification
+        if not kept and not raw.delete:
+            return None
+
+        filtered = pb.Notification(timestamp=timestamp, atomic=raw.atomic,
+                                   update=kept, delete=raw.delete)
+        if raw.HasField("prefix"):
+            filtered.prefix.CopyFrom(raw.prefix)
+        return Notification_(filtered)
+
+    def filter(self, responses: Iterable[Any]) -> Generator[Any, None, None]:
+        r"""Yield `responses` without their redundant updates
+
+        Sync responses are passed through. Responses left without updates
+        or deletes are dropped.
+
+        :param responses: subscribe responses, e.g. from
+            :meth:`gnmi.session.Session.subscribe`, or notifications
+        :type responses: Iterable
+        :rtype: Generator
+        """
+        for response in responses:
+            if hasattr(response, "sync_response"):
+                if response.sync_response or \
+                        not response.raw.HasField("update"):
+                    yield response
+                    continue
+
+                notification = self.apply(response.update)
+                if notification is None:
+                    continue
+                if notification is not response.update:
+                    response = SubscribeResponse_(
+                        pb.SubscribeResponse(update=notification.raw))
+                yield response
+            else:
+                notification = self.apply(response)
+                if notification is not None:
+                    yield notification
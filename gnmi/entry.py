@@ -3,31 +3,44 @@
 # Arista Networks, Inc. Confidential and Proprietary.
 
 import argparse
+import base64
 import json
-import os
 import signal
 import sys
+from typing import TYPE_CHECKING, Any
 
-from grpc import __version__ as grpc_version
-from google.protobuf import __version__ as pb_version
-
+# grpc, protobuf and the session are imported once the arguments are parsed,
+# so `--version` and `--help` stay fast
 from gnmi.config import Config
-from gnmi.messages import Notification_
-from gnmi.session import Session
 from gnmi.structures import CertificateStore, GetOptions, GrpcOptions, SubscribeOptions
 from gnmi.exceptions import GrpcDeadlineExceeded
 from gnmi.target import Target
+from gnmi.environments import GNMI_CERT_CACHE
 from gnmi import util
 import gnmi
 
+if TYPE_CHECKING:
+    from gnmi.messages import Notification_, Update_
+
 
 def signal_handler(signal, frame):
     sys.exit(0)
 
 signal.signal(signal.SIGINT, signal_handler)
 
+def _grpc_version() -> str:
+    # read from the package metadata, importing grpc loads the whole runtime.
+    # importlib.metadata is slow to import itself, only --version needs it
+    import importlib.metadata
+    try:
+        return importlib.metadata.version("grpcio")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
 def format_version():
-    elems = (gnmi.__version__, pb_version, grpc_version)
+    from google.protobuf import __version__ as pb_version
+
+    elems = (gnmi.__version__, pb_version, _grpc_version())
     return "gnmipy %s [protobuf %s, grpcio %s]" % elems
 
 def parse_args():
@@ -39,6 +52,8 @@ def parse_args():
     parser.add_argument("operation", type=str, choices=['capabilities', 'get', 'subscribe'],
         help="gNMI operation [capabilities, get, subscribe]")
     parser.add_argument("--pretty", action="store_true", default=False, help="pretty print notifications")
+    parser.add_argument("--flatten", action="store_true", default=False,
+        help="expand JSON values into one update per leaf")
     parser.add_argument("-c", "--config", type=str, default=None,
         help="Path to gNMI config file")
     
@@ -50,6 +65,14 @@ def parse_args():
     parser.add_argument("--insecure", action="store_true", help="disable TLS")
     parser.add_argument("--host-override", default=None,
         help="Override gRPC server hostname")
+    parser.add_argument("--cert-cache", default=GNMI_CERT_CACHE, type=str,
+        help="directory caching server certificates trusted on first use "
+             "(default: %(default)s)")
+    parser.add_argument("--no-cert-cache", action="store_true",
+        help="fetch the server certificate on every run")
+    parser.add_argument("--no-cert-pin", action="store_true",
+        help="accept a server certificate that changed since it was cached, "
+             "with a warning")
 
     group = parser.add_argument_group()
     group.add_argument("--debug-grpc", action="store_true",
@@ -84,6 +107,9 @@ def parse_args():
                        help="allow aggregation")
     group.add_argument("--suppress", action="store_true",
                        help="suppress redundant")
+    group.add_argument("--dedup", action="store_true", default=False,
+                       help=("drop updates whose value did not change on the client, "
+                             "unchanged values are still shown every --heartbeat"))
     group.add_argument("--mode", default=None, type=str, choices=['stream', 'once', 'poll'],
                        help="Specify subscription mode")
     group.add_argument("--submode", default=None, type=str, choices=['target-defined', 'on-change', 'sample'],
@@ -155,20 +181,45 @@ def make_config(args) -> Config:
 
     return Config(data)
 
-def write_notification(n: Notification_, pretty: bool = False) -> None:
+def _output_value(update: 'Update_', val: Any) -> Any:
+    from gnmi import values
+
+    if isinstance(val, values.LazyJSON):
+        return val.value
+
+    if isinstance(val, (bytes, memoryview)):
+        if values.get_bytes_mode() == "base64" and \
+                update.raw.val.WhichOneof("value") == "bytes_val":
+            # already encoded by the decoder
+            return bytes(val).decode("ascii")
+        return base64.b64encode(val).decode("ascii")
+
+    return val
+
+def write_notification(n: 'Notification_', pretty: bool = False,
+                       flatten: bool = False) -> None:
     notif = {}
 
     updates = []
     for u in n.update:
-        
-        val = u.get_value()
-        if isinstance(val, bytes):
-            val = val.decode("utf-8")
 
-        updates.append({
-            "path": str(u.path),
-            "value": val
-        })
+        if flatten:
+            try:
+                leaves = list(u.flatten())
+            except ValueError as err:
+                # shown as received rather than with colliding paths
+                print("warning: %s: %s" % (u.path, err), file=sys.stderr)
+                leaves = [(str(u.path), u.get_value())]
+        else:
+            leaves = [(str(u.path), u.get_value())]
+
+        for path, val in leaves:
+            val = _output_value(u, val)
+
+            updates.append({
+                "path": path,
+                "value": val
+            })
 
     deletes = []
     for d in n.delete:
@@ -202,6 +253,10 @@ def write_notification(n: Notification_, pretty: bool = False) -> None:
 
 def main():
     args = parse_args()
+
+    from gnmi.certcache import CertificateCache
+    from gnmi.session import Session
+    from gnmi import values
     config: Config
     rc: Config = util.load_rc()
 
@@ -212,6 +267,9 @@ def main():
     if args.debug_grpc:
         util.enable_grpc_debuging()
 
+    # binary values are base64 encoded once, when written
+    values.set_bytes_mode("memoryview")
+
     cs = CertificateStore()
     if args.tls_ca != "":
         tls_ca = b""
@@ -233,8 +291,11 @@ def main():
 
     grpc_options={}
 
+    cert_cache = CertificateCache(None if args.no_cert_cache else args.cert_cache,
+                                  pin=not args.no_cert_pin)
+
     sess = Session(target, metadata=config.metadata, insecure=args.insecure,
-        certificates=cs, grpc_options=grpc_options)
+        certificates=cs, grpc_options=grpc_options, cert_cache=cert_cache)
 
     if config.get("Capabilities"):
         response = sess.capabilities()
@@ -251,18 +312,23 @@ def main():
         paths = config.Get.paths
         response = sess.get(paths, options)
         for notif in response:
-            write_notification(notif, args.pretty)
+            write_notification(notif, args.pretty, args.flatten)
 
     elif config.get("Subscribe") and config["Subscribe"].paths:
         sub_opts: SubscribeOptions = config.Subscribe.options
         paths = config.Subscribe.paths
         try:
-            for resp in sess.subscribe(paths, options=sub_opts):
+            responses = sess.subscribe(paths, options=sub_opts)
+            if args.dedup:
+                from gnmi.dedup import Deduplicator
+                heartbeat = sub_opts.get("heartbeat") if sub_opts else None
+                responses = Deduplicator(heartbeat=heartbeat).filter(responses)
+            for resp in responses:
                 if resp.sync_response:
                     if args.once:
                         break
                     continue
-                write_notification(resp.update, args.pretty)
+                write_notification(resp.update, args.pretty, args.flatten)
         except GrpcDeadlineExceeded:
             return
 
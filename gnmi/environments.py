@@ -8,4 +8,24 @@ import pathlib
 _HOME = pathlib.Path.home()
 
 GNMI_RC_PATH = os.environ.get("RC_PATH", _HOME)
-GNMI_NO_DEPRECATED = True if os.environ.get("GNMI_NO_DEPRECATED") else False
\ No newline at end of file
+GNMI_NO_DEPRECATED = True if os.environ.get("GNMI_NO_DEPRECATED") else False
+
+# directory of the server certificate cache, empty to keep it in memory only
+GNMI_CERT_CACHE = os.environ.get("GNMI_CERT_CACHE",
+                                 str(_HOME / ".cache" / "gnmi-py" / "certs"))
+
+# refuse server certificates that changed since they were cached, "0" only
+# warns
+GNMI_CERT_PIN = os.environ.get("GNMI_CERT_PIN", "1") != "0"
+
+# number of paths kept by each of the path parsing and rendering caches,
+# 0 disables them
+GNMI_PATH_CACHE_SIZE = int(os.environ.get("GNMI_PATH_CACHE_SIZE", 4096))
+
+# decoder of JSON values, one of auto, orjson or json
+GNMI_JSON_BACKEND = os.environ.get("GNMI_JSON_BACKEND", "auto")
+# keep JSON values encoded until they are accessed
+GNMI_JSON_LAZY = True if os.environ.get("GNMI_JSON_LAZY") else False
+
+# how bytes values are returned, one of base64, raw or memoryview
+GNMI_BYTES_MODE = os.environ.get("GNMI_BYTES_MODE", "base64")
@@ -6,7 +6,22 @@ class GrpcError(Exception):
     def __init__(self, status):
         super(GrpcError, self).__init__("%s: %s" %
                                         (status.code, status.details))
+        self.status = status
 
 class GrpcDeadlineExceeded(GrpcError): ...
 
 class GnmiDeprecationError(Exception): ...
+
+class GnmiCertificateError(Exception): ...
+
+class GnmiBatchError(Exception):
+    r"""Some requests of a batched operation failed
+
+    `errors` holds ``(request items, GrpcError)`` per failed request and
+    `response` the merged result of the requests that succeeded.
+    """
+    def __init__(self, errors, response=None):
+        super(GnmiBatchError, self).__init__("%d of the batched requests failed: %s" %
+                                             (len(errors), errors[0][1]))
+        self.errors = errors
+        self.response = response
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.flatten
+~~~~~~~~~~~~~~~~
+
+Flatten JSON encoded subtrees into leaf level ``(path, value)`` pairs
+
+JSON objects become containers and arrays of objects become YANG list
+entries, keyed by the leaves named in `list_keys`. Entries of other lists
+are keyed when they follow the OpenConfig layout, with ``config`` or
+``state`` containers, where the leaves directly in the entry are exactly
+the list keys. Otherwise the keys cannot be told from the data, guessed keys
+would not match the paths of the target and entries without keys would all
+share the same paths, so a ``ValueError`` asks for the list in `list_keys`.
+Arrays of scalars are leaf-lists and kept as one value.
+
+"""
+
+from typing import Any, Dict, Generator, Iterable, Optional, Tuple
+
+from gnmi import util
+
+ListKeys = Dict[str, Iterable[str]]
+
+_OPENCONFIG_CONTAINERS = frozenset(("config", "state"))
+
+
+def _key_string(value: Any) -> str:
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    return str(value)
+
+
+def _is_list(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and \
+        all(isinstance(v, dict) for v in value)
+
+
+def _entry_keys(name: str, entry: dict, list_keys: Optional[ListKeys]) -> Tuple:
+    names = None
+    if list_keys:
+        names = list_keys.get(name)
+        if names is None and ":" in name:
+            # members may be qualified with the module name
+            names = list_keys.get(name.split(":", 1)[1])
+
+    if names is None:
+        if not any(isinstance(v, dict) and
+                   k.split(":")[-1] in _OPENCONFIG_CONTAINERS
+                   for k, v in entry.items()):
+            raise ValueError("Keys of list %r are unknown, pass them in "
+                             "list_keys" % name)
+        names = [k for k, v in entry.items()
+                 if not isinstance(v, (dict, list))]
+
+    return tuple(sorted((k, _key_string(entry[k])) for k in names if k in entry))
+
+
+class _StringPaths(object):
+    base: Any = ""
+
+    @staticmethod
+    def child(path: str, name: str) -> str:
+        return path + "/" + util.escape_string(name, "/[")
+
+    @staticmethod
+    def entry(path: str, keys: Tuple) -> str:
+        for key, val in keys:
+            path += "[" + util.escape_string(key, "=]") + "=" + \
+                util.escape_string(val, "]") + "]"
+        return path
+
+
+class _TuplePaths(object):
+    base: Any = ()
+
+    @staticmethod
+    def child(path: tuple, name: str) -> tuple:
+        return path + ((name, ()),)
+
+    @staticmethod
+    def entry(path: tuple, keys: Tuple) -> tuple:
+        name, _keys = path[-1]
+        return path[:-1] + ((name, keys),)
+
+
+def _walk(value: Any, path: Any, name: str, paths: Any,
+          list_keys: Optional[ListKeys]) -> Generator[Tuple[Any, Any], None, None]:
+    if isinstance(value, dict):
+        for member, child in value.items():
+            yield from _walk(child, paths.child(path, member), member, paths,
+                             list_keys)
+    elif _is_list(value):
+        for entry in value:
+            keys = _entry_keys(name, entry, list_keys)
+            yield from _walk(entry, paths.entry(path, keys), name, paths,
+                             list_keys)
+    else:
+        yield path, value
+
+
+def flatten(value: Any, path: Any = None, list_keys: Optional[ListKeys] = None,
+            as_tuple: bool = False) -> Generator[Tuple[Any, Any], None, None]:
+    r"""Flatten a decoded JSON value into ``(path, value)`` leaves
+
+    Usage::
+
+        >>> value = {"interface": [{"name": "Et1", "state": {"mtu": 1500}}]}
+        >>> list(flatten(value, "/interfaces"))
+        [('/interfaces/interface[name=Et1]/name', 'Et1'),
+         ('/interfaces/interface[name=Et1]/state/mtu', 1500)]
+
+    :param value: decoded JSON value
+    :type value: Any
+    :param path: path of `value`, a string or a tuple as yielded by
+        :meth:`gnmi.messages.Notification_.iter_leaves`
+    :type path: Union[str, tuple]
+    :param list_keys: key leaf names by list name
+    :type list_keys: Dict[str, Iterable[str]]
+    :param as_tuple: yield hashable tuples instead of strings
+    :type as_tuple: bool
+    :rtype: Generator[Tuple[Any, Any], None, None]
+    :raises ValueError: when the keys of a list are not in `list_keys` and
+        cannot be told from the data
+    """
+    paths = _TuplePaths if as_tuple else _StringPaths
+    if path is None:
+        path = paths.base
+    return _flatten(value, path, _last_name(path, as_tuple), list_keys,
+                    as_tuple)
+
+
+def _last_name(path: Any, as_tuple: bool) -> str:
+    if not path:
+        return ""
+    if as_tuple:
+        return path[-1][0]
+    elems = util.parse_path(util.split_origin(path)[1])
+    return elems[-1]["name"] if elems else ""
+
+
+def _flatten(value: Any, path: Any, name: str, list_keys: Optional[ListKeys],
+             as_tuple: bool) -> Generator[Tuple[Any, Any], None, None]:
+    if hasattr(value, "decoded"):
+        # gnmi.values.LazyJSON
+        value = value.value
+    paths = _TuplePaths if as_tuple else _StringPaths
+    return _walk(value, path, name, paths, list_keys)
@@ -9,26 +9,25 @@ gNMI messags wrappers
 
 """
 
-import base64
 import collections
 import functools
 import itertools
 import json
-import re
 import warnings
 import enum
 from abc import ABCMeta, abstractmethod
 from datetime import datetime
-from decimal import Decimal
 from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
 import google.protobuf as _
 import grpc
 
-from gnmi.environments import GNMI_NO_DEPRECATED, GNMI_RC_PATH
+from gnmi.environments import GNMI_NO_DEPRECATED, GNMI_PATH_CACHE_SIZE, GNMI_RC_PATH
 from gnmi.exceptions import GnmiDeprecationError
 from gnmi.proto import gnmi_pb2 as pb  # type: ignore
-from gnmi import util
+from gnmi import util, values
+from gnmi.flatten import _flatten
+from gnmi.path import PathKey
 
 warnings.simplefilter("once", category=(PendingDeprecationWarning, DeprecationWarning))
 
@@ -44,6 +43,14 @@ def deprecated(msg, klass=DeprecationWarning):
     return decorator
 
 class BaseMessage(metaclass=ABCMeta):
+    r"""Base of the message wrappers
+
+    Wrappers use ``__slots__``, values derived from ``raw`` are computed once
+    per instance. The wrapped message should not be modified after the
+    wrapper has been created.
+    """
+
+    __slots__ = ("raw",)
 
     def __init__(self, message):
         self.raw = message
@@ -53,6 +60,8 @@ class BaseMessage(metaclass=ABCMeta):
 
 class IterableMessage(BaseMessage):
 
+    __slots__ = ()
+
     @abstractmethod
     def __iter__(self):
         return iter([])
@@ -67,21 +76,200 @@ class IterableMessage(BaseMessage):
         return collected
 
 
+def _path_string(origin: str, elems) -> str:
+    path = ""
+    for elem in elems:
+        path += "/" + util.escape_string(elem.name, "/[")
+        for key, val in sorted(elem.key.items()):
+            path += "[" + util.escape_string(key, "=]") + "=" + \
+                util.escape_string(val, "]") + "]"
+
+    if origin:
+        path = origin + ":" + path
+    return path
+
+def _path_tuple(elems) -> tuple:
+    return tuple((e.name, tuple(sorted(e.key.items()))) for e in elems)
+
+def _parse_path_uncached(path: str) -> pb.Path:
+    if not path:
+        return pb.Path(origin=None, elem=[]) # type: ignore
+
+    elems: list = []
+    origin, path = util.split_origin(path)
+
+    for elem in util.parse_path(path):
+        elems.append(pb.PathElem(name=elem["name"], key=elem["keys"])) # type: ignore
+
+    return pb.Path(origin=origin, elem=elems) # type: ignore
+
+def _render_path_uncached(path: pb.Path) -> str:
+    string = _path_string("", path.elem)
+
+    if not string and path.element:
+        warnings.warn("Field 'element' has been deprecated and may be removed in the future",
+            DeprecationWarning, stacklevel=3)
+        string = "/".join(path.element)
+
+    if path.origin:
+        string = path.origin + ":" + string
+    return string
+
+def _render_path_bytes(data: bytes) -> str:
+    return _render_path_uncached(pb.Path.FromString(data))
+
+_parse_cache = None
+_render_cache = None
+
+def set_path_cache_size(maxsize: int = GNMI_PATH_CACHE_SIZE) -> None:
+    r"""Set the size of the path parsing and rendering caches
+
+    Both caches are LRU bounded to `maxsize` entries each, ``0`` disables
+    caching. The caches are emptied and their statistics reset.
+
+    :param maxsize: maximum number of cached paths
+    :type maxsize: int
+    """
+    global _parse_cache, _render_cache
+
+    if maxsize < 0:
+        raise ValueError("Invalid path cache size: %d" % maxsize)
+
+    if maxsize:
+        _parse_cache = functools.lru_cache(maxsize=maxsize)(_parse_path_uncached)
+        _render_cache = functools.lru_cache(maxsize=maxsize)(_render_path_bytes)
+    else:
+        _parse_cache = _render_cache = None
+
+def path_cache_info() -> Dict[str, Any]:
+    r"""Hit and miss statistics of the path caches
+
+    Usage::
+
+        >>> path_cache_info()
+        {'parse': CacheInfo(hits=10, misses=2, maxsize=4096, currsize=2),
+         'render': CacheInfo(hits=0, misses=0, maxsize=4096, currsize=0)}
+
+    :rtype: Dict[str, Any]
+    """
+    return {
+        "parse": _parse_cache.cache_info() if _parse_cache else None,
+        "render": _render_cache.cache_info() if _render_cache else None,
+    }
+
+def _parse_path(path: str) -> pb.Path:
+    if _parse_cache is None:
+        return _parse_path_uncached(path)
+    # paths are mutable, hand out a copy of the cached message
+    parsed = pb.Path()
+    parsed.CopyFrom(_parse_cache(path))
+    return parsed
+
+def _render_path(path: pb.Path) -> str:
+    if _render_cache is None:
+        return _render_path_uncached(path)
+    return _render_cache(path.SerializeToString(deterministic=True))
+
+set_path_cache_size()
+
 class Notification_(IterableMessage):
     r"""Represents a gnmi.Notification message
 
     """
+
+    __slots__ = ("_prefix",)
     
     def __iter__(self) -> Generator[Union['Update_', 'Path_'], None, None]:
         return itertools.chain(self.update, self.delete)
 
+    def iter_leaves(self, as_tuple: bool = False,
+                    decode: bool = True) -> Generator[Tuple[Any, Any], None, None]:
+        r"""Iterate over ``(path, value)`` pairs of the updates
+
+        Reads the underlying protobuf directly without building the
+        ``Update_``/``Path_``/``TypedValue_`` wrappers, the prefix is joined
+        to each path.
+
+        Usage::
+
+            >>> for path, value in notification.iter_leaves():
+            ...     print(path, value)
+            /interfaces/interface[name=Ethernet1]/state/counters/in-octets 2341
+
+        :param as_tuple: yield paths as hashable tuples of
+            ``(name, ((key, value), ...))`` instead of strings, the origin
+            is not included
+        :type as_tuple: bool
+        :param decode: decode values, otherwise yield the ``pb.TypedValue``
+            of each update
+        :type decode: bool
+        :rtype: Generator[Tuple[Any, Any], None, None]
+        """
+        raw = self.raw
+        prefix = raw.prefix
+        prefix_elems = list(prefix.elem)
+
+        if as_tuple:
+            base = _path_tuple(prefix_elems)
+        else:
+            base = _path_string("", prefix_elems)
+
+        for update in raw.update:
+            path = update.path
+            if as_tuple:
+                key = base + _path_tuple(path.elem)
+            else:
+                key = base + _path_string("", path.elem)
+                origin = prefix.origin or path.origin
+                if origin:
+                    key = origin + ":" + key
+
+            if not decode:
+                yield key, update.val
+            elif update.HasField("val"):
+                yield key, values.decode(update.val)
+            elif update.HasField("value"):
+                yield key, Value_(update.value).extract_val()
+            else:
+                yield key, None
+
+    def flatten(self, list_keys: Optional[Dict[str, Any]] = None,
+                as_tuple: bool = False) -> Generator[Tuple[Any, Any], None, None]:
+        r"""Iterate over leaf level ``(path, value)`` pairs of the updates
+
+        Like :meth:`iter_leaves` but JSON encoded subtrees are expanded into
+        their leaves, see :mod:`gnmi.flatten`.
+
+        Usage::
+
+            >>> for path, value in notification.flatten({"interface": ["name"]}):
+            ...     print(path, value)
+            /interfaces/interface[name=Ethernet1]/state/mtu 1500
+
+        :param list_keys: key leaf names by list name
+        :type list_keys: Dict[str, Iterable[str]]
+        :param as_tuple: yield paths as hashable tuples
+        :type as_tuple: bool
+        :rtype: Generator[Tuple[Any, Any], None, None]
+        """
+        prefix = self.raw.prefix.elem
+        for update, (path, value) in zip(self.raw.update,
+                                         self.iter_leaves(as_tuple)):
+            elems = update.path.elem or prefix
+            name = elems[-1].name if elems else ""
+            yield from _flatten(value, path, name, list_keys, as_tuple)
+
     @property
     def atomic(self) -> bool:
         return self.raw.atomic
 
     @property
     def prefix(self) -> 'Path_':
-        return Path_(self.raw.prefix)
+        try:
+            return self._prefix
+        except AttributeError:
+            self._prefix = Path_(self.raw.prefix)
+            return self._prefix
     
     @property
     def timestamp(self) -> int:
@@ -108,6 +296,8 @@ class Update_(BaseMessage):
 
     """
 
+    __slots__ = ("_path", "_val")
+
     _TYPED_VALUE_MAP = {
         bool: 'bool_val',
         dict: 'json_ietf_val',
@@ -127,12 +317,21 @@ class Update_(BaseMessage):
     
     @property
     def path(self) -> 'Path_':
-        return Path_(self.raw.path)
+        try:
+            return self._path
+        except AttributeError:
+            self._path = Path_(self.raw.path)
+            return self._path
 
     @property
     def val(self) -> Optional['TypedValue_']:
-        if self.raw.HasField('val'):
-            return TypedValue_(self.raw.val)
+        try:
+            return self._val
+        except AttributeError:
+            self._val = None
+            if self.raw.HasField('val'):
+                self._val = TypedValue_(self.raw.val)
+            return self._val
     
     @property
     def value(self) -> Optional['Value_']:
@@ -143,11 +342,34 @@ class Update_(BaseMessage):
     def duplicates(self) -> int:
         return self.raw.duplicates
 
+    def flatten(self, list_keys: Optional[Dict[str, Any]] = None,
+                as_tuple: bool = False) -> Generator[Tuple[Any, Any], None, None]:
+        r"""Iterate over leaf level ``(path, value)`` pairs of the update
+
+        Paths are relative to the notification prefix, see
+        :meth:`Notification_.flatten`.
+
+        :param list_keys: key leaf names by list name
+        :type list_keys: Dict[str, Iterable[str]]
+        :param as_tuple: yield paths as hashable tuples
+        :type as_tuple: bool
+        :rtype: Generator[Tuple[Any, Any], None, None]
+        """
+        elems = self.raw.path.elem
+        if as_tuple:
+            path = _path_tuple(elems)
+        else:
+            path = self.path.to_string()
+        name = elems[-1].name if elems else ""
+        return _flatten(self.get_value(), path, name, list_keys, as_tuple)
+
     def get_value(self) -> Union['TypedValue_', 'Value_']:
-        if self.val:
-            return self.val.extract_val()
-        elif self.value:
-            return self.value.extract_val()
+        val = self.val
+        if val is not None:
+            return val.extract_val()
+        value = self.value
+        if value is not None:
+            return value.extract_val()
 
     @classmethod
     def from_keyval(cls, keyval: Tuple[str, Any], forced_type: str = "") -> 'Update_':
@@ -173,6 +395,8 @@ class Update_(BaseMessage):
 
 class TypedValue_(BaseMessage):
 
+    __slots__ = ("_value",)
+
     @property
     def value(self) -> Any:
         return self.extract_val()
@@ -181,50 +405,29 @@ class TypedValue_(BaseMessage):
         return str(self.extract_val())
 
     def extract_val(self) -> Any:
-        val = None
-        if self.raw.HasField("any_val"):
-            val = self.raw.any_val
-        elif self.raw.HasField("ascii_val"):
-            val = self.raw.ascii_val
-        elif self.raw.HasField("bool_val"):
-            val = self.raw.bool_val
-        elif self.raw.HasField("bytes_val"):
-            val = base64.b64encode(self.raw.bytes_val)
-        elif self.raw.HasField("decimal_val"):
-            val = self.raw.decimal_val
-            val = Decimal(str(val.digits / 10**val.precision))
-        elif self.raw.HasField("float_val"):
-            val = self.raw.float_val
-        elif self.raw.HasField("int_val"):
-            val = self.raw.int_val
-        elif self.raw.HasField("json_ietf_val"):
-            val = json.loads(self.raw.json_ietf_val)
-        elif self.raw.HasField("json_val"):
-            val = json.loads(self.raw.json_val)
-        elif self.raw.HasField("leaflist_val"):
-            val = []
-            for elem in self.raw.leaflist_val.element:
-                val.append(TypedValue_(elem).extract_val())
-        elif self.raw.HasField("proto_bytes"):
-            val = self.raw.proto_bytes
-        elif self.raw.HasField("string_val"):
-            val = self.raw.string_val
-        elif self.raw.HasField("uint_val"):
-            val = self.raw.uint_val
-        else:
-            raise ValueError("Unhandled typed value %s" % self.raw)
-
-        return val
+        try:
+            return self._value
+        except AttributeError:
+            self._value = values.decode(self.raw)
+            return self._value
 
 class Path_(IterableMessage):
     r"""Represents a gnmi.Path message
 
     """
 
-    RE_ORIGIN = re.compile(r"(?:(?P<origin>[\w\-]+)?:)?(?P<path>\S+)$")
-    
+    __slots__ = ("_string", "_key")
+
     def __str__(self):
         return self.to_string()
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Path_):
+            return NotImplemented
+        return self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
     
     def __add__(self, other: 'Path_') -> 'Path_':
         elems = []
@@ -264,47 +467,32 @@ class Path_(IterableMessage):
     def target(self) -> str:
         return self.raw.target
 
-    def to_string(self) -> str:
-
-        path = ""
-        for elem in self.elem:
-            path += "/" + util.escape_string(elem.name, "/")
-            for key, val in elem.key.items():
-                val = util.escape_string(val, "]")
-                path += "[" + key + "=" + val + "]"
+    @property
+    def key(self) -> PathKey:
+        r"""Hashable :class:`gnmi.path.PathKey` of the path"""
+        try:
+            return self._key
+        except AttributeError:
+            self._key = PathKey.from_pb(self.raw)
+            return self._key
 
-        if not path and self.element:
-            path =  "/".join(self.element)
+    def to_string(self) -> str:
+        try:
+            return self._string
+        except AttributeError:
+            self._string = _render_path(self.raw)
+            return self._string
 
-        if self.origin:
-            path = ":".join([self.origin, path])
-        return path
-    
     @classmethod
     def from_string(cls, path: str) -> 'Path_':
-
-        if not path:
-            return cls(pb.Path(origin=None, elem=[])) # type: ignore
-        
-        names: List[str] = []
-        elems: list = []
-        
-        path = path.strip()
-        origin = None
-
-        match = cls.RE_ORIGIN.search(path)
-        origin = match.group("origin")
-        path = match.group("path")
-        
-        for elem in util.parse_path(path):
-            elems.append(pb.PathElem(name=elem["name"], key=elem["keys"])) # type: ignore
-
-        return cls(pb.Path(origin=origin, elem=elems)) # type: ignore
+        return cls(_parse_path(path))
 
 class PathElem_(BaseMessage):
     r"""Represents a gnmi.PathElem message
 
     """
+
+    __slots__ = ()
     
     @property
     def key(self) -> Dict[str, str]:
@@ -319,6 +507,8 @@ class PathElem_(BaseMessage):
 @deprecated("Message 'Value' is deprecated and may be removed in the future")
 class Value_(BaseMessage):
 
+    __slots__ = ()
+
     @property
     def value(self) -> Any:
         return self.extract_val()
@@ -332,9 +522,9 @@ class Value_(BaseMessage):
 
     def extract_val(self) -> Any:
         if self.type.name in ('JSON_IETF', 'JSON') and self.raw.value:
-            return json.load(self.raw.value)
+            return values.decode_json(self.raw.value)
         elif self.type.name in ('BYTES', 'PROTO'):
-            return base64.b64encode(self.raw.value)
+            return values.decode_bytes(self.raw.value)
         elif self.type.name == 'ASCII':
             return str(self.raw.value)
         
@@ -351,6 +541,8 @@ class Encoding_(enum.Enum):
     "google.golang.org/genproto/googleapis/rpc/status"
     "message in the RPC response."))
 class Error_(BaseMessage):
+
+    __slots__ = ()
     
     @property
     def code(self) -> int:
@@ -368,6 +560,8 @@ class SubscribeResponse_(BaseMessage):
     r"""Represents a gnmi.SubscribeResponse message
 
     """
+
+    __slots__ = ("_update",)
     
     @property
     def sync_response(self) -> bool:
@@ -375,7 +569,11 @@ class SubscribeResponse_(BaseMessage):
 
     @property
     def update(self) -> Notification_:
-        return Notification_(self.raw.update)
+        try:
+            return self._update
+        except AttributeError:
+            self._update = Notification_(self.raw.update)
+            return self._update
     notification = update
 
     @property
@@ -385,6 +583,8 @@ class SubscribeResponse_(BaseMessage):
 
 class SetResponse_(IterableMessage):
 
+    __slots__ = ()
+
     def __iter__(self):
         return self.response
 
@@ -410,6 +610,8 @@ class SetResponse_(IterableMessage):
 
 class UpdateResult_(BaseMessage):
 
+    __slots__ = ()
+
     class Operation_(enum.Enum):
         INVALID = 0
         DELETE = 1
@@ -446,6 +648,8 @@ class GetResponse_(IterableMessage):
 
     """
 
+    __slots__ = ()
+
     def __iter__(self):
         return self.notification
 
@@ -465,6 +669,8 @@ class CapabilitiesResponse_(BaseMessage):
 
     """
 
+    __slots__ = ()
+
     @property
     def supported_models(self) -> Generator[dict, None, None]:
         for model in self.raw.supported_models:
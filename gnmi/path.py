@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.path
+~~~~~~~~~~~~~~~~
+
+Compact, immutable and hashable path keys
+
+"""
+
+from typing import Any, Iterable, Iterator, Mapping, Tuple, Union
+
+from gnmi import util
+from gnmi.proto import gnmi_pb2 as pb  # type: ignore
+
+Keys = Tuple[Tuple[str, str], ...]
+Elem = Tuple[str, Keys]
+
+# matches any name or key value
+WILDCARD = "*"
+# matches any number of elements, including none
+MULTI_WILDCARD = "..."
+
+
+def elem_matches(pattern: Elem, elem: Elem) -> bool:
+    r"""Check an element against a pattern element
+
+    The pattern name may be ``*``, key values may be ``*`` and keys missing
+    from the pattern match any value, e.g. ``interface`` matches every entry
+    of the interface list.
+
+    :param pattern: the pattern element
+    :type pattern: Tuple[str, Tuple[Tuple[str, str], ...]]
+    :param elem: the element
+    :type elem: Tuple[str, Tuple[Tuple[str, str], ...]]
+    :rtype: bool
+    """
+    name, keys = pattern
+    if name != WILDCARD and name != elem[0]:
+        return False
+    if not keys:
+        return True
+
+    elem_keys = dict(elem[1])
+    for key, value in keys:
+        if key not in elem_keys:
+            return False
+        if value != WILDCARD and elem_keys[key] != value:
+            return False
+    return True
+
+
+def _elem(elem: Any) -> Elem:
+    if isinstance(elem, str):
+        return (elem, ())
+
+    name, keys = elem
+    if isinstance(keys, Mapping):
+        keys = keys.items()
+    return (name, tuple(sorted(keys)))
+
+
+class PathKey(object):
+    r"""Immutable path usable as a dictionary key
+
+    Elements are stored as tuples of ``(name, ((key, value), ...))`` with the
+    keys sorted, the hash is computed once on creation.
+
+    Usage::
+
+        >>> prefix = PathKey.from_string("/interfaces/interface[name=Et1]")
+        >>> key = prefix + PathKey.from_string("/state/oper-status")
+        >>> str(key)
+        '/interfaces/interface[name=Et1]/state/oper-status'
+        >>> key.elems[1]
+        ('interface', (('name', 'Et1'),))
+
+    :param elems: elements as names or ``(name, keys)`` pairs, where keys is
+        a mapping or an iterable of key, value pairs
+    :type elems: Iterable
+    :param origin: path origin
+    :type origin: str
+    """
+
+    __slots__ = ("_origin", "_elems", "_hash")
+
+    def __init__(self, elems: Iterable[Any] = (), origin: str = ""):
+        self._set(origin or "", tuple(_elem(e) for e in elems))
+
+    def _set(self, origin: str, elems: Tuple[Elem, ...]) -> None:
+        object.__setattr__(self, "_origin", origin)
+        object.__setattr__(self, "_elems", elems)
+        object.__setattr__(self, "_hash", hash((origin, elems)))
+
+    @classmethod
+    def _make(cls, origin: str, elems: Tuple[Elem, ...]) -> "PathKey":
+        # elements are known to be normalized
+        key = cls.__new__(cls)
+        key._set(origin, elems)
+        return key
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("PathKey is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError("PathKey is immutable")
+
+    def __reduce__(self):
+        return (self.__class__._make, (self._origin, self._elems))
+
+    @property
+    def origin(self) -> str:
+        return self._origin
+
+    @property
+    def elems(self) -> Tuple[Elem, ...]:
+        return self._elems
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, PathKey):
+            return NotImplemented
+        return self._hash == other._hash and self._elems == other._elems \
+            and self._origin == other._origin
+
+    def __ne__(self, other: Any) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __len__(self) -> int:
+        return len(self._elems)
+
+    def __iter__(self) -> Iterator[Elem]:
+        return iter(self._elems)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Elem, "PathKey"]:
+        if isinstance(index, slice):
+            return self._make(self._origin, self._elems[index])
+        return self._elems[index]
+
+    def __add__(self, other: "PathKey") -> "PathKey":
+        if not isinstance(other, PathKey):
+            return NotImplemented
+        return self._make(self._origin or other._origin,
+                          self._elems + other._elems)
+
+    def __str__(self) -> str:
+        return self.to_string()
+
+    def __repr__(self) -> str:
+        return "%s(%r)" % (self.__class__.__name__, self.to_string())
+
+    def startswith(self, prefix: "PathKey") -> bool:
+        r"""Check whether the path is below or equal to `prefix`
+
+        :param prefix: the parent path
+        :type prefix: PathKey
+        :rtype: bool
+        """
+        size = len(prefix._elems)
+        return (not prefix._origin or prefix._origin == self._origin) and \
+            self._elems[:size] == prefix._elems
+
+    @property
+    def wildcard(self) -> bool:
+        r"""Whether the path contains wildcards, see :meth:`matches`"""
+        for name, keys in self._elems:
+            if name in (WILDCARD, MULTI_WILDCARD):
+                return True
+            for _, value in keys:
+                if value == WILDCARD:
+                    return True
+        return False
+
+    def matches(self, path: "PathKey") -> bool:
+        r"""Check whether `path` matches this path used as a pattern
+
+        ``*`` matches any name or key value, ``...`` any number of elements
+        and elements without keys match every list entry.
+
+        Usage::
+
+            >>> pattern = PathKey.from_string("/interfaces/interface[name=*]/...")
+            >>> pattern.matches(PathKey.from_string(
+            ...     "/interfaces/interface[name=Et1]/state/counters"))
+            True
+
+        :param path: the path
+        :type path: PathKey
+        :rtype: bool
+        """
+        if self._origin and self._origin != path._origin:
+            return False
+        return _match(self._elems, 0, path._elems, 0)
+
+    def to_string(self) -> str:
+        path = ""
+        for name, keys in self._elems:
+            path += "/" + util.escape_string(name, "/[")
+            for key, val in keys:
+                path += "[" + util.escape_string(key, "=]") + "=" + \
+                    util.escape_string(val, "]") + "]"
+
+        if self._origin:
+            path = self._origin + ":" + path
+        return path
+
+    def to_pb(self) -> pb.Path:
+        return pb.Path(origin=self._origin, elem=[
+            pb.PathElem(name=name, key=dict(keys))
+            for name, keys in self._elems
+        ])
+
+    @classmethod
+    def from_string(cls, path: str) -> "PathKey":
+        origin, path = util.split_origin(path)
+        return cls._make(origin or "", tuple(
+            (e["name"], tuple(sorted(e["keys"].items())))
+            for e in util.parse_path(path)))
+
+    @classmethod
+    def from_pb(cls, path: pb.Path) -> "PathKey":
+        return cls._make(path.origin, tuple(
+            (e.name, tuple(sorted(e.key.items()))) for e in path.elem))
+
+
+def _match(pattern: Tuple[Elem, ...], i: int, elems: Tuple[Elem, ...],
+           j: int) -> bool:
+    while i < len(pattern):
+        if pattern[i][0] == MULTI_WILDCARD:
+            return any(_match(pattern, i + 1, elems, k)
+                       for k in range(j, len(elems) + 1))
+        if j >= len(elems) or not elem_matches(pattern[i], elems[j]):
+            return False
+        i += 1
+        j += 1
+    return j == len(elems)
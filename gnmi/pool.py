@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.pool
+~~~~~~~~~~~~~~~~
+
+Process-wide gRPC channel pool shared by :class:`gnmi.session.Session` and
+the :mod:`gnmi.api` helpers
+
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Hashable, Optional
+
+import grpc
+
+__all__ = ["ChannelPool", "close", "default_pool"]
+
+DEFAULT_IDLE_TIMEOUT: float = 300.0
+
+
+class _Entry(object):
+
+    def __init__(self, channel: grpc.Channel):
+        self.channel = channel
+        self.refs = 0
+        self.last_used = time.monotonic()
+
+
+class ChannelPool(object):
+    r"""Reuses gRPC channels between sessions connecting to the same target
+
+    Channels are keyed by target, credentials and gRPC options, so the TCP
+    connection, TLS handshake and server certificate lookup are paid once per
+    key rather than once per session. A channel no session has used for
+    `idle_timeout` seconds is closed the next time the pool is touched.
+
+    Usage::
+
+        >>> pool = ChannelPool(idle_timeout=60)
+        >>> with Session(target, insecure=True, pool=pool) as sess:
+        ...     sess.get(["/system/config"])
+        >>> pool.close()
+
+    :param idle_timeout: seconds an unused channel is kept open
+    :type idle_timeout: float
+    """
+
+    def __init__(self, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._entries: Dict[Hashable, _Entry] = {}
+        # discarded channels still referenced by sessions, keyed by id()
+        self._retired: Dict[int, _Entry] = {}
+        # keys whose channel is being created, by the lock held meanwhile
+        self._connecting: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def acquire(self, key: Hashable,
+                factory: Callable[[], grpc.Channel]) -> grpc.Channel:
+        r"""Return the channel for `key`, creating it with `factory` if
+        necessary. Each call must be paired with :meth:`release`.
+
+        The factory runs outside of the pool lock, it may block, e.g. to
+        fetch a server certificate, without holding up other targets. Only
+        callers of the same key wait for it.
+        """
+        with self._lock:
+            self._evict_idle()
+            channel = self._take(key)
+            if channel is not None:
+                return channel
+            connecting = self._connecting.get(key)
+            if connecting is None:
+                connecting = self._connecting[key] = threading.Lock()
+
+        with connecting:
+            with self._lock:
+                channel = self._take(key)
+                if channel is not None:
+                    return channel
+
+            try:
+                created = factory()
+            except BaseException:
+                with self._lock:
+                    self._unreserve(key, connecting)
+                raise
+
+            with self._lock:
+                self._unreserve(key, connecting)
+                duplicate = None
+                if key in self._entries:
+                    # lost a race with a caller holding another reservation
+                    duplicate = created
+                else:
+                    self._entries[key] = _Entry(created)
+                channel = self._take(key)
+
+        if duplicate is not None:
+            duplicate.close()
+        return channel  # type: ignore
+
+    def _take(self, key: Hashable) -> Optional[grpc.Channel]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        entry.refs += 1
+        entry.last_used = time.monotonic()
+        return entry.channel
+
+    def _unreserve(self, key: Hashable, connecting: threading.Lock) -> None:
+        if self._connecting.get(key) is connecting:
+            del self._connecting[key]
+
+    def release(self, key: Hashable,
+                channel: Optional[grpc.Channel] = None) -> None:
+        r"""Drop a reference taken by :meth:`acquire`
+
+        Passing the acquired `channel` lets references to a channel that was
+        discarded in the meantime be released correctly.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if channel is not None and \
+                    (entry is None or entry.channel is not channel):
+                retired = self._retired.get(id(channel))
+                if retired is not None:
+                    retired.refs -= 1
+                    if retired.refs <= 0:
+                        del self._retired[id(channel)]
+                        retired.channel.close()
+                return
+            if entry is not None:
+                entry.refs = max(entry.refs - 1, 0)
+                entry.last_used = time.monotonic()
+            self._evict_idle()
+
+    def discard(self, key: Hashable) -> None:
+        r"""Forget the channel for `key`, e.g. after a transport failure, so
+        the next :meth:`acquire` creates a new one. The old channel is closed
+        once every session using it has released it.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None and entry.refs > 0:
+                self._retired[id(entry.channel)] = entry
+                entry = None
+        if entry is not None:
+            entry.channel.close()
+
+    def evict_idle(self) -> int:
+        r"""Close unreferenced channels idle for longer than `idle_timeout`
+
+        :rtype: int number of channels closed
+        """
+        with self._lock:
+            return self._evict_idle()
+
+    def _evict_idle(self) -> int:
+        now = time.monotonic()
+        expired = [key for key, entry in self._entries.items()
+                   if entry.refs == 0 and
+                   now - entry.last_used >= self.idle_timeout]
+        for key in expired:
+            self._entries.pop(key).channel.close()
+        return len(expired)
+
+    def close(self) -> None:
+        r"""Close every pooled channel"""
+        with self._lock:
+            entries = list(self._entries.values()) + \
+                list(self._retired.values())
+            self._entries.clear()
+            self._retired.clear()
+        for entry in entries:
+            entry.channel.close()
+
+
+default_pool = ChannelPool()
+
+
+def close() -> None:
+    r"""Close all channels held by the default pool"""
+    default_pool.close()
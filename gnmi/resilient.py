@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.resilient
+~~~~~~~~~~~~~~~~
+
+Subscriptions that survive transport failures
+
+"""
+
+import random
+import time
+from typing import Generator, List, Optional
+
+from gnmi.constants import RETRYABLE_STATUS_CODES
+from gnmi.exceptions import GrpcDeadlineExceeded, GrpcError
+from gnmi.messages import SubscribeResponse_
+from gnmi.structures import SubscribeOptions
+
+__all__ = ["Backoff", "ResilientResponse_", "ResilientSubscription"]
+
+
+class Backoff(object):
+    r"""Jittered exponential backoff
+
+    The n-th delay is ``min(maximum, initial * multiplier ** n)`` reduced by
+    a random fraction of up to `jitter`, so targets that drop together do
+    not reconnect together.
+
+    :param initial: first delay in seconds
+    :type initial: float
+    :param maximum: upper bound of a delay in seconds
+    :type maximum: float
+    :param multiplier: growth factor between attempts
+    :type multiplier: float
+    :param jitter: fraction of each delay that is randomized, 0 to 1
+    :type jitter: float
+    """
+
+    def __init__(self, initial: float = 0.5, maximum: float = 30.0,
+                 multiplier: float = 2.0, jitter: float = 0.5):
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.attempts = 0
+
+    def next(self) -> float:
+        r"""Return the next delay in seconds"""
+        delay = min(self.maximum,
+                    self.initial * self.multiplier ** self.attempts)
+        self.attempts += 1
+        return delay - random.uniform(0, delay * self.jitter)
+
+    def reset(self) -> None:
+        self.attempts = 0
+
+
+class ResilientResponse_(SubscribeResponse_):
+    r"""A :class:`gnmi.messages.SubscribeResponse_` from a resilient
+    subscription
+
+    `replayed` is ``True`` for notifications in the initial sync after a
+    reconnect whose timestamp is not newer than the last notification seen
+    before the connection dropped, i.e. state the consumer already has.
+    """
+
+    __slots__ = ("replayed",)
+
+    def __init__(self, message, replayed: bool = False):
+        super(ResilientResponse_, self).__init__(message)
+        self.replayed = replayed
+
+
+class _ResumeState(object):
+
+    def __init__(self, paths: list, options: SubscribeOptions,
+                 backoff: Optional[Backoff], max_retries: Optional[int],
+                 resume_updates_only: bool):
+        self.paths = paths
+        self.options = options
+        self.backoff = backoff or Backoff()
+        self.max_retries = max_retries
+        self.resume_updates_only = resume_updates_only
+
+        self.last_timestamp = 0
+        self.reconnects = 0
+        self.synced = False
+        self.errors: List[GrpcError] = []
+        self._failures = 0
+        self._resync_mark: Optional[int] = None
+
+    def _track(self, raw) -> ResilientResponse_:
+        if raw.sync_response:
+            self.synced = True
+            self._failures = 0
+            self.backoff.reset()
+            return ResilientResponse_(raw)
+
+        timestamp = raw.update.timestamp
+        replayed = not self.synced and self._resync_mark is not None and \
+            timestamp <= self._resync_mark
+        if timestamp > self.last_timestamp:
+            self.last_timestamp = timestamp
+        return ResilientResponse_(raw, replayed)
+
+    def _retry_delay(self, err: GrpcError) -> float:
+        # deadlines come from the caller's own timeout option
+        if isinstance(err, GrpcDeadlineExceeded) or \
+                err.status.code not in RETRYABLE_STATUS_CODES:
+            raise err
+
+        self._failures += 1
+        if self.max_retries is not None and self._failures > self.max_retries:
+            raise err
+
+        self.errors.append(err)
+        return self.backoff.next()
+
+    def _resume(self) -> None:
+        self.reconnects += 1
+        self.synced = False
+        self._resync_mark = self.last_timestamp
+        if self.resume_updates_only:
+            self.options = dict(self.options, updates_only=True)  # type: ignore
+
+
+class ResilientSubscription(_ResumeState):
+    r"""Subscribe and transparently reconnect on transport failures
+
+    Retryable errors (see :data:`gnmi.constants.RETRYABLE_STATUS_CODES`)
+    re-create the session channel after a :class:`Backoff` delay and
+    re-subscribe; the backoff is reset once a reconnect reaches
+    ``sync_response``. After `max_retries` consecutive failures the last
+    error is raised. Responses carry a ``replayed`` flag marking initial sync
+    notifications the consumer saw before the disconnect.
+
+    With `resume_updates_only` re-subscriptions set ``updates_only`` so the
+    target skips the initial sync altogether. That makes reconnects cheap but
+    changes made while disconnected are not sent.
+
+    Usage::
+
+        >>> sub = ResilientSubscription(sess, ["/interfaces"],
+        ...     backoff=Backoff(initial=1, maximum=60))
+        >>> for resp in sub:
+        ...     if resp.sync_response or resp.replayed:
+        ...         continue
+        ...     for update in resp.update:
+        ...         print(update.path, update.get_value())
+
+    :param session: gNMI session
+    :type session: gnmi.session.Session
+    :param paths: List of paths
+    :type paths: list
+    :param options: Subscribe options
+    :type options: gnmi.structures.SubscribeOptions
+    :param backoff: reconnect delays
+    :type backoff: gnmi.resilient.Backoff
+    :param max_retries: consecutive failures before giving up, unbounded
+        if ``None``
+    :type max_retries: int
+    :param resume_updates_only: skip the initial sync on reconnect
+    :type resume_updates_only: bool
+    """
+
+    def __init__(self, session, paths: list,
+                 options: SubscribeOptions = {},
+                 backoff: Optional[Backoff] = None,
+                 max_retries: Optional[int] = None,
+                 resume_updates_only: bool = False):
+        super(ResilientSubscription, self).__init__(
+            paths, options, backoff, max_retries, resume_updates_only)
+        self.session = session
+
+    def __iter__(self) -> Generator[ResilientResponse_, None, None]:
+        while True:
+            try:
+                for resp in self.session.subscribe(self.paths, self.options):
+                    yield self._track(resp.raw)
+                return
+            except GrpcError as err:
+                delay = self._retry_delay(err)
+
+            time.sleep(delay)
+            self.session.reconnect()
+            self._resume()
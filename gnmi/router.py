@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.router
+~~~~~~~~~~~~~~~~
+
+Dispatch updates to handlers registered for path patterns
+
+Patterns are compiled into a trie of path elements, matching a path walks the
+trie once, so its cost depends on the depth of the path and not on the
+number of registered handlers. Pattern semantics are those of
+:meth:`gnmi.path.PathKey.matches`, a pattern only matches paths of the same
+depth unless it contains ``...``, e.g. ``/interfaces/...`` for a subtree.
+
+"""
+
+import collections
+import functools
+import itertools
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from gnmi import values
+from gnmi.path import MULTI_WILDCARD, WILDCARD, Keys, PathKey, elem_matches
+
+RoutedUpdate = collections.namedtuple(
+    "RoutedUpdate", ("path", "value", "timestamp", "deleted"))
+RoutedUpdate.__doc__ = "An update, or a delete, passed to router handlers"
+
+Handler = Callable[[RoutedUpdate], Any]
+
+
+class _Entries(object):
+    # children of a node with the same name
+
+    __slots__ = ("literal", "wildcard")
+
+    def __init__(self):
+        # nodes by key names then key values, for patterns without wildcards
+        self.literal: Dict[Tuple[str, ...], Dict[Tuple[str, ...], "_Node"]] = {}
+        # patterns with wildcard key values
+        self.wildcard: List[Tuple[Keys, "_Node"]] = []
+
+    def get(self, keys: Keys) -> Optional["_Node"]:
+        if any(v == WILDCARD for _, v in keys):
+            for pattern, node in self.wildcard:
+                if pattern == keys:
+                    return node
+            return None
+        names = tuple(k for k, _ in keys)
+        return self.literal.get(names, {}).get(tuple(v for _, v in keys))
+
+    def add(self, keys: Keys) -> "_Node":
+        node = _Node()
+        if any(v == WILDCARD for _, v in keys):
+            self.wildcard.append((keys, node))
+        else:
+            names = tuple(k for k, _ in keys)
+            self.literal.setdefault(names, {})[tuple(v for _, v in keys)] = node
+        return node
+
+    def match(self, name: str, keys: Keys, found: List["_Node"]) -> None:
+        if self.literal:
+            elem_keys = dict(keys)
+            for names, nodes in self.literal.items():
+                try:
+                    node = nodes.get(tuple(elem_keys[n] for n in names))
+                except KeyError:
+                    continue
+                if node is not None:
+                    found.append(node)
+
+        for pattern, node in self.wildcard:
+            if elem_matches((name, pattern), (name, keys)):
+                found.append(node)
+
+
+class _Node(object):
+
+    __slots__ = ("children", "wildcard", "multi", "handlers", "is_multi")
+
+    def __init__(self, is_multi: bool = False):
+        self.children: Dict[str, _Entries] = {}
+        self.wildcard: Optional[_Entries] = None
+        self.multi: Optional[_Node] = None
+        self.handlers: List[Tuple[int, Handler]] = []
+        self.is_multi = is_multi
+
+
+def _closure(nodes: List[_Node]) -> List[_Node]:
+    # add the nodes reachable through '...' matching no element
+    result: List[_Node] = []
+    seen = set()
+    stack = list(reversed(nodes))
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        result.append(node)
+        if node.multi is not None:
+            stack.append(node.multi)
+    return result
+
+
+class Router(object):
+    r"""Route updates to the handlers of matching path patterns
+
+    Handlers are called with a :class:`RoutedUpdate`, in the order they were
+    registered. Values are only decoded for updates with at least one
+    handler.
+
+    Usage::
+
+        >>> router = Router()
+        >>> @router.route("/interfaces/interface[name=*]/state/counters/...")
+        ... def counters(update):
+        ...     print(update.path, update.value)
+        >>> router.consume(sess.subscribe(paths))
+
+    :param cache_size: number of paths whose matching handlers are cached,
+        ``0`` disables the cache
+    :type cache_size: int
+    """
+
+    def __init__(self, cache_size: int = 4096):
+        self._roots: Dict[str, _Node] = {}
+        self._lock = threading.RLock()
+        self._sequence = itertools.count()
+        self._cache_size = cache_size
+        self._reset_cache()
+
+    def _reset_cache(self) -> None:
+        if self._cache_size:
+            self._cached = functools.lru_cache(maxsize=self._cache_size)(
+                self._match)
+        else:
+            self._cached = self._match
+
+    def add(self, pattern: Union[PathKey, str], handler: Handler) -> Tuple[PathKey, Handler]:
+        r"""Register a handler for a path pattern
+
+        :param pattern: the pattern
+        :type pattern: Union[PathKey, str]
+        :param handler: callable taking a :class:`RoutedUpdate`
+        :type handler: Callable
+        :rtype: Tuple[PathKey, Callable]
+        :returns: a handle for :meth:`remove`
+        """
+        key = pattern if isinstance(pattern, PathKey) else PathKey.from_string(pattern)
+
+        with self._lock:
+            node = self._roots.get(key.origin)
+            if node is None:
+                node = self._roots[key.origin] = _Node()
+
+            for name, keys in key.elems:
+                if name == MULTI_WILDCARD:
+                    if node.multi is None:
+                        node.multi = _Node(is_multi=True)
+                    node = node.multi
+                    continue
+
+                if name == WILDCARD:
+                    if node.wildcard is None:
+                        node.wildcard = _Entries()
+                    entries = node.wildcard
+                else:
+                    entries = node.children.get(name)
+                    if entries is None:
+                        entries = node.children[name] = _Entries()
+
+                child = entries.get(keys)
+                if child is None:
+                    child = entries.add(keys)
+                node = child
+
+            node.handlers.append((next(self._sequence), handler))
+            self._reset_cache()
+
+        return key, handler
+
+    def route(self, pattern: Union[PathKey, str]) -> Callable[[Handler], Handler]:
+        r"""Decorator registering the function as a handler of `pattern`"""
+        def decorator(handler: Handler) -> Handler:
+            self.add(pattern, handler)
+            return handler
+        return decorator
+
+    def remove(self, handle: Tuple[PathKey, Handler]) -> bool:
+        r"""Unregister a handler
+
+        :param handle: as returned by :meth:`add`
+        :type handle: Tuple[PathKey, Callable]
+        :rtype: bool
+        :returns: ``False`` if the handler was not registered
+        """
+        key, handler = handle
+        with self._lock:
+            node = self._roots.get(key.origin)
+            for name, keys in key.elems:
+                if node is None:
+                    return False
+                if name == MULTI_WILDCARD:
+                    node = node.multi
+                    continue
+                entries = node.wildcard if name == WILDCARD else \
+                    node.children.get(name)
+                node = entries.get(keys) if entries is not None else None
+
+            if node is None:
+                return False
+
+            for i, (_, registered) in enumerate(node.handlers):
+                if registered is handler:
+                    del node.handlers[i]
+                    self._reset_cache()
+                    return True
+        return False
+
+    def match(self, path: Union[PathKey, str]) -> List[Handler]:
+        r"""Handlers of the patterns matching `path`
+
+        :param path: the path
+        :type path: Union[PathKey, str]
+        :rtype: List[Callable]
+        """
+        key = path if isinstance(path, PathKey) else PathKey.from_string(path)
+        return list(self._cached(key))
+
+    def _match(self, key: PathKey) -> Tuple[Handler, ...]:
+        with self._lock:
+            roots = [self._roots.get("")]
+            if key.origin:
+                roots.append(self._roots.get(key.origin))
+            states = _closure([r for r in roots if r is not None])
+
+            for name, keys in key.elems:
+                if not states:
+                    return ()
+                found: List[_Node] = []
+                for node in states:
+                    if node.is_multi:
+                        found.append(node)
+                    entries = node.children.get(name)
+                    if entries is not None:
+                        entries.match(name, keys, found)
+                    if node.wildcard is not None:
+                        node.wildcard.match(name, keys, found)
+                states = _closure(found)
+
+            handlers = sorted(h for node in states for h in node.handlers)
+            return tuple(handler for _, handler in handlers)
+
+    def dispatch(self, response: Any) -> int:
+        r"""Route the updates and deletes of a response or notification
+
+        :param response: a subscribe response or a notification
+        :type response: Union[gnmi.messages.SubscribeResponse_, gnmi.messages.Notification_]
+        :rtype: int
+        :returns: number of handler calls
+        """
+        if hasattr(response, "sync_response"):
+            if response.sync_response or not response.raw.HasField("update"):
+                return 0
+            notification = response.update
+        else:
+            notification = response
+
+        raw = notification.raw
+        prefix = notification.prefix.key
+        timestamp = raw.timestamp
+        calls = 0
+
+        for path in notification.delete:
+            key = prefix + path.key
+            for handler in self._cached(key):
+                handler(RoutedUpdate(key, None, timestamp, True))
+                calls += 1
+
+        for update in raw.update:
+            key = prefix + PathKey.from_pb(update.path)
+            handlers = self._cached(key)
+            if not handlers:
+                continue
+
+            if update.HasField("val"):
+                value = values.decode(update.val)
+            else:
+                value = values.extract_values([update])[0]
+
+            routed = RoutedUpdate(key, value, timestamp, False)
+            for handler in handlers:
+                handler(routed)
+            calls += len(handlers)
+
+        return calls
+
+    def consume(self, responses: Iterable[Any]) -> int:
+        r"""Dispatch `responses` until they are exhausted
+
+        :param responses: subscribe responses, e.g. from
+            :meth:`gnmi.session.Session.subscribe`, or get responses
+        :type responses: Iterable
+        :rtype: int
+        :returns: number of handler calls
+        """
+        calls = 0
+        for response in responses:
+            if hasattr(response, "sync_response") or \
+                    not hasattr(response, "notification"):
+                calls += self.dispatch(response)
+            else:
+                for notification in response.notification:
+                    calls += self.dispatch(notification)
+        return calls
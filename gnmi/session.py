@@ -14,29 +14,30 @@ import google.protobuf as _
 from gnmi.proto import gnmi_pb2 as pb  # type: ignore
 from gnmi.proto import gnmi_pb2_grpc  # type: ignore
 
-from typing import Generator, Optional, Union
+from typing import TYPE_CHECKING, Generator, Hashable, List, Optional, Union
 
-import ssl
+import queue
+import threading
 
-from gnmi import util
+from gnmi import certcache, util
 from gnmi.messages import CapabilitiesResponse_, GetResponse_, Path_, Status_
-from gnmi.messages import Update_
+from gnmi.messages import Notification_, Update_
 from gnmi.messages import SubscribeResponse_, SetResponse_
 from gnmi.structures import Metadata, CertificateStore, Options
 from gnmi.structures import GetOptions, GrpcOptions, SubscribeOptions
 from gnmi.constants import MODE_MAP, DATA_TYPE_MAP
-from gnmi.exceptions import GrpcError, GrpcDeadlineExceeded
+from gnmi.constants import GET_CHUNK_BYTES, GET_CHUNK_PATHS, GET_CONCURRENCY
+from gnmi.exceptions import GnmiBatchError, GrpcError, GrpcDeadlineExceeded
 from gnmi.target import Target
 
+if TYPE_CHECKING:
+    from gnmi.certcache import CertificateCache
+    from gnmi.pool import ChannelPool
 
-class Session(object):
-    r"""Represents a gNMI session
-
-    Basic Usage:: 
 
-        In [1]: from gnmi.session import Session
-        In [2]: sess = Session(("veos3", 6030), 
-        ...:     metadata=[("username", "admin"), ("password", "")])
+class BaseSession(object):
+    r"""Shared state and request builders for :class:`Session` and
+    :class:`gnmi.aio.AsyncSession`
 
     """
 
@@ -45,43 +46,61 @@ class Session(object):
                  metadata: Metadata = {},
                  insecure: bool = False,
                  certificates: CertificateStore = {},
-                 grpc_options: GrpcOptions = {}):
+                 grpc_options: GrpcOptions = {},
+                 cert_cache: Optional['CertificateCache'] = None):
 
-       
+        self._cert_cache = cert_cache or certcache.default_cache
         self._certificates = certificates
         self._grpc_options = grpc_options
         self._insecure = insecure
         self.target = target
         self.metadata = util.prepare_metadata(metadata)
 
-        self._channel = self._new_channel()
-
-        self._stub = gnmi_pb2_grpc.gNMIStub(self._channel)  # type: ignore
-
-    # @property
-    # def hostaddr(self):
-    #     return "%s:%d" % self.target
-
-    def _new_channel(self):
-        if self._insecure:
-            return grpc.insecure_channel(str(self.target))
+    def _channel_credentials(self, server_certificate: Optional[bytes] = None):
+        if not self._certificates.get("root_certificates"):
+            return grpc.ssl_channel_credentials(server_certificate)
+
+        root_cert = self._certificates.get("root_certificates") or None
+        chain = self._certificates.get("certificate_chain") or None
+        private_key = self._certificates.get("private_key") or None
+
+        return grpc.ssl_channel_credentials(
+                root_certificates=root_cert,
+                private_key=private_key,
+                certificate_chain=chain)
+
+    def _channel_options(self) -> List[tuple]:
+        options = {}
+        if self.target.path is not None and not self._insecure:
+            # gRPC checks the socket path against the server certificate,
+            # local servers are expected to present one for 'localhost'
+            options["grpc.ssl_target_name_override"] = "localhost"
+
+        for key, value in self._grpc_options.items():
+            if key == "server_host_override":
+                # name the target's certificate is checked against
+                key = "grpc.ssl_target_name_override"
+            options[key] = value
+        return list(options.items())
+
+    def _channel_key(self) -> Hashable:
+        certificates = tuple(sorted(self._certificates.items()))
+        grpc_options = tuple(sorted(self._grpc_options.items()))
+        return (str(self.target), self._insecure, certificates, grpc_options)
+
+    def _needs_server_certificate(self) -> bool:
+        return not self._insecure and \
+            not self._certificates.get("root_certificates")
+
+    def _fetch_server_certificate(self) -> bytes:
+        return self._cert_cache.get(self.target)
+
+    def _expire_server_certificate(self) -> None:
+        # the target may have rotated its certificate, check it again rather
+        # than failing handshakes until the cached entry expires
+        if self._needs_server_certificate():
+            self._cert_cache.expire(self.target)
 
-        elif not self._certificates.get("root_certificates"):
-            creds = grpc.ssl_channel_credentials(
-                ssl.get_server_certificate(self.target.addr).encode())
-        else:
-            root_cert = self._certificates.get("root_certificates") or None
-            chain = self._certificates.get("certificate_chain") or None
-            private_key = self._certificates.get("private_key") or None
-
-            creds = grpc.ssl_channel_credentials(
-                    root_certificates=root_cert,
-                    private_key=private_key,
-                    certificate_chain=chain)
-    
-        return grpc.secure_channel(self.addr, creds,
-            options=list(self._grpc_options.items()))
-    
     def _build_update(self, update):
         if isinstance(update, (Update_, Path_)):
             update = update
@@ -107,6 +126,218 @@ class Session(object):
             return path
         else:
             raise ValueError("Failed to parse path: %s" % str(path))
+
+    def _get_request(self, paths: list, options: GetOptions) -> pb.GetRequest:
+        prefix = self._parse_path(options.get("prefix"))
+        encoding = util.get_gnmi_constant(options.get("encoding") or "json")
+        type_ = DATA_TYPE_MAP.index(options.get("type") or "all")
+        
+        paths = [self._parse_path(path) for path in paths]
+        
+        return pb.GetRequest(path=paths, prefix=prefix, encoding=encoding,
+                             type=type_)  # type: ignore
+
+    def _get_chunks(self, paths: list, max_paths: int,
+                    max_bytes: int) -> List[List[pb.Path]]:
+        chunks: List[List[pb.Path]] = []
+        chunk: List[pb.Path] = []
+        size = 0
+
+        for path in paths:
+            path = self._parse_path(path)
+            path_size = path.ByteSize()
+            if chunk and (len(chunk) >= max_paths or size + path_size > max_bytes):
+                chunks.append(chunk)
+                chunk, size = [], 0
+            chunk.append(path)
+            size += path_size
+
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    @staticmethod
+    def _merge_get_responses(responses: List[pb.GetResponse]) -> GetResponse_:
+        merged = pb.GetResponse()
+        for response in responses:
+            merged.notification.extend(response.notification)
+        return GetResponse_(merged)
+
+    def _set_request(self, deletes: list, replacements: list, updates: list,
+                     options: Options) -> pb.SetRequest:
+        prefix = self._parse_path(options.get("prefix"))
+        
+        setargs = dict(prefix=prefix, delete=[], replace=[], update=[])
+
+        for delete in deletes:
+            setargs["delete"].append(self._build_update(delete))
+        for replace in replacements:
+            setargs["replace"].append(self._build_update(replace))
+        for update in updates:
+            setargs["update"].append(self._build_update(update))
+
+        return pb.SetRequest(**setargs)
+
+    def _poll_subscription_list(self, paths: list,
+                                options: SubscribeOptions) -> pb.SubscriptionList:
+        return self._subscription_list(paths, dict(options, mode="poll"))  # type: ignore
+
+    def _subscription_list(self, paths: list,
+                           options: SubscribeOptions) -> pb.SubscriptionList:
+        aggregate = bool(options.get("aggregate"))
+        encoding = util.get_gnmi_constant(options.get("encoding") or "json")
+        heartbeat = options.get("heartbeat")
+        interval = options.get("interval")
+        mode = MODE_MAP.index(options.get("mode") or "stream")
+        prefix = self._parse_path(options.get("prefix"))
+        qos = pb.QOSMarking(marking=options.get("qos", 0))
+        submode = util.get_gnmi_constant(options.get("submode") or "on-change")
+        suppress = bool(options.get("suppress"))
+        updates_only = bool(options.get("updates_only"))
+        use_alias = bool(options.get("use_alias"))
+
+        subs = []
+        for path in paths:
+            path = self._parse_path(path)
+            sub = pb.Subscription(path=path, mode=submode,
+                                  suppress_redundant=suppress,
+                                  sample_interval=interval,
+                                  heartbeat_interval=heartbeat)
+            subs.append(sub)
+
+        return pb.SubscriptionList(prefix=prefix, mode=mode,
+                                   allow_aggregation=aggregate,
+                                   encoding=encoding, subscription=subs,
+                                   qos=qos, updates_only=updates_only)
+
+    @staticmethod
+    def _rpc_error(rpcerr: grpc.RpcError) -> GrpcError:
+        status = Status_.from_call(rpcerr)
+        return GrpcError(status)
+
+    @staticmethod
+    def _subscribe_error(rpcerr: grpc.RpcError) -> GrpcError:
+        status = Status_.from_call(rpcerr)
+
+        # server sometimes sends: 
+        #    gnmi.exceptions.GrpcError: StatusCode.UNKNOWN: context deadline exceeded
+        if status.code.name == "DEADLINE_EXCEEDED" or status.details == "context deadline exceeded":
+            return GrpcDeadlineExceeded(status)
+        else:
+            return GrpcError(status)
+
+
+class Session(BaseSession):
+    r"""Represents a gNMI session
+
+    Without root certificates the certificate presented by the target is
+    trusted on first use and kept in `cert_cache`, by default
+    :data:`gnmi.certcache.default_cache`.
+
+    Basic Usage:: 
+
+        In [1]: from gnmi.session import Session
+        In [2]: sess = Session(("veos3", 6030), 
+        ...:     metadata=[("username", "admin"), ("password", "")])
+
+    """
+
+    def __init__(self,
+                 target: Target,
+                 metadata: Metadata = {},
+                 insecure: bool = False,
+                 certificates: CertificateStore = {},
+                 grpc_options: GrpcOptions = {},
+                 pool: Optional['ChannelPool'] = None,
+                 cert_cache: Optional['CertificateCache'] = None):
+
+        super(Session, self).__init__(target, metadata=metadata,
+                                      insecure=insecure,
+                                      certificates=certificates,
+                                      grpc_options=grpc_options,
+                                      cert_cache=cert_cache)
+
+        self._pool = pool
+        self._channel = None
+        self._channel_stub = None
+        self._channel_lock = threading.Lock()
+
+    def __enter__(self) -> 'Session':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def _stub(self) -> gnmi_pb2_grpc.gNMIStub:
+        # the channel is opened by the first RPC rather than the constructor
+        stub = self._channel_stub
+        if stub is None:
+            with self._channel_lock:
+                if self._channel_stub is None:
+                    self._connect()
+                stub = self._channel_stub
+        return stub
+
+    def _connect(self) -> None:
+        if self._pool is not None:
+            self._channel = self._pool.acquire(self._channel_key(),
+                                               self._new_channel)
+        else:
+            self._channel = self._new_channel()
+
+        self._channel_stub = gnmi_pb2_grpc.gNMIStub(self._channel)  # type: ignore
+
+    def close(self) -> None:
+        r"""Release the channel
+
+        Pooled channels are handed back to the pool which closes them once
+        idle, otherwise the channel is closed immediately. A later RPC opens
+        a new channel.
+        """
+        with self._channel_lock:
+            if self._channel is None:
+                return
+            if self._pool is not None:
+                self._pool.release(self._channel_key(), self._channel)
+            else:
+                self._channel.close()
+            self._channel = None
+            self._channel_stub = None
+
+    def reconnect(self) -> None:
+        r"""Drop the channel, the next RPC opens a new one
+
+        A pooled channel is discarded from the pool so other sessions sharing
+        it pick up the new channel too. A server certificate trusted on first
+        use is fetched again, in case the target rotated it.
+        """
+        self._expire_server_certificate()
+        with self._channel_lock:
+            if self._channel is None:
+                return
+            if self._pool is not None:
+                key = self._channel_key()
+                self._pool.discard(key)
+                self._pool.release(key, self._channel)
+            else:
+                self._channel.close()
+            self._channel = None
+            self._channel_stub = None
+
+    def _new_channel(self):
+        if self._insecure:
+            return grpc.insecure_channel(self.target.grpc_target,
+                options=self._channel_options())
+
+        server_cert = None
+        if self._needs_server_certificate():
+            server_cert = self._fetch_server_certificate()
+
+        creds = self._channel_credentials(server_cert)
+    
+        return grpc.secure_channel(self.target.grpc_target, creds,
+            options=self._channel_options())
     
     def capabilities(self) -> CapabilitiesResponse_:
         r"""Discover capabilities of the target
@@ -143,8 +374,7 @@ class Session(object):
         try:
             response = self._stub.Capabilities(_cr, metadata=self.metadata)
         except grpc.RpcError as rpcerr:
-            status = Status_.from_call(rpcerr)
-            raise GrpcError(status)
+            raise self._rpc_error(rpcerr)
 
         return CapabilitiesResponse_(response)
 
@@ -179,23 +409,71 @@ class Session(object):
         """
 
         response: Optional[GetResponse_] = None
-        prefix = self._parse_path(options.get("prefix"))
-        encoding = util.get_gnmi_constant(options.get("encoding") or "json")
-        type_ = DATA_TYPE_MAP.index(options.get("type") or "all")
-        
-        paths = [self._parse_path(path) for path in paths]
-        
-        _gr = pb.GetRequest(path=paths, prefix=prefix, encoding=encoding,
-                            type=type_)  # type: ignore
+        _gr = self._get_request(paths, options)
 
         try:
             response = self._stub.Get(_gr, metadata=self.metadata)
         except grpc.RpcError as rpcerr:
-            status = Status_.from_call(rpcerr)
-            raise GrpcError(status)
+            raise self._rpc_error(rpcerr)
 
         return GetResponse_(response)
 
+    def get_batched(self, paths: list, options: GetOptions = {},
+                    max_paths: int = GET_CHUNK_PATHS,
+                    max_bytes: int = GET_CHUNK_BYTES,
+                    concurrency: int = GET_CONCURRENCY) -> GetResponse_:
+        r"""Get a large number of paths in concurrent chunks
+
+        Paths are split into requests of at most `max_paths` paths and
+        `max_bytes` of encoded paths, up to `concurrency` of them are in
+        flight on the session channel at a time. Notifications are merged in
+        the order of `paths`.
+
+        Usage::
+
+            In [12]: resp = sess.get_batched(leaves, {"encoding": "json"},
+                ...:     max_paths=200, concurrency=16)
+
+        :param paths: List of paths
+        :type paths: list
+        :param options:
+        :type options: gnmi.structures.GetOptions
+        :param max_paths: paths per request
+        :type max_paths: int
+        :param max_bytes: encoded size of the paths per request
+        :type max_bytes: int
+        :param concurrency: requests in flight
+        :type concurrency: int
+        :raises gnmi.exceptions.GnmiBatchError: if any chunk failed, the
+            error holds the merged response of the others
+        :rtype: gnmi.messages.GetResponse_
+        """
+        chunks = self._get_chunks(paths, max_paths, max_bytes)
+        results: List[Optional[pb.GetResponse]] = [None] * len(chunks)
+        errors = []
+        inflight: list = []
+
+        def _collect(index, future):
+            try:
+                results[index] = future.result()
+            except grpc.RpcError as rpcerr:
+                errors.append((chunks[index], self._rpc_error(rpcerr)))
+
+        for index, chunk in enumerate(chunks):
+            if len(inflight) >= concurrency:
+                _collect(*inflight.pop(0))
+            _gr = self._get_request(chunk, options)
+            inflight.append((index, self._stub.Get.future(
+                _gr, metadata=self.metadata)))
+
+        for index, future in inflight:
+            _collect(index, future)
+
+        response = self._merge_get_responses([r for r in results if r is not None])
+        if errors:
+            raise GnmiBatchError(errors, response)
+        return response
+
     def set(self, deletes: list = [], replacements: list = [], updates: list = [],
             options: Options = {}) -> SetResponse_:
         r"""Set set, update or delete value from specified path
@@ -218,25 +496,12 @@ class Session(object):
         
         response: Optional[SetResponse_] = None
 
-        prefix = self._parse_path(options.get("prefix"))
-        
-        setargs = dict(prefix=prefix, delete=[], replace=[], update=[])
-
-        for delete in deletes:
-            setargs["delete"].append(self._build_update(delete))
-        for replace in replacements:
-            setargs["replace"].append(self._build_update(replace))
-        for update in updates:
-            setargs["update"].append(self._build_update(update))
-
-
-        _sr = pb.SetRequest(**setargs)
+        _sr = self._set_request(deletes, replacements, updates, options)
 
         try:
             response = SetResponse_(self._stub.Set(_sr, metadata=self.metadata))
         except grpc.RpcError as rpcerr:
-            status = Status_.from_call(rpcerr)
-            raise GrpcError(status)
+            raise self._rpc_error(rpcerr)
         
         return response
 
@@ -290,43 +555,99 @@ class Session(object):
         :rtype: gnmi.messages.SubscribeResponse_
         """
 
-        aggregate = bool(options.get("aggregate"))
-        encoding = util.get_gnmi_constant(options.get("encoding") or "json")
-        heartbeat = options.get("heartbeat")
-        interval = options.get("interval")
-        mode = MODE_MAP.index(options.get("mode") or "stream")
-        prefix = self._parse_path(options.get("prefix"))
-        qos = pb.QOSMarking(marking=options.get("qos", 0))
-        submode = util.get_gnmi_constant(options.get("submode") or "on-change")
-        suppress = bool(options.get("suppress"))
         timeout = options.get("timeout")
-        use_alias = bool(options.get("use_alias"))
-
-        subs = []
-        for path in paths:
-            path = self._parse_path(path)
-            sub = pb.Subscription(path=path, mode=submode,
-                                  suppress_redundant=suppress,
-                                  sample_interval=interval,
-                                  heartbeat_interval=heartbeat)
-            subs.append(sub)
+        sub_list = self._subscription_list(paths, options)
 
         def _sr():
-            sub_list = pb.SubscriptionList(prefix=prefix, mode=mode,
-                                           allow_aggregation=aggregate,
-                                           encoding=encoding, subscription=subs,
-                                           qos=qos)
             yield pb.SubscribeRequest(subscribe=sub_list)
 
         try:
             for r in self._stub.Subscribe(_sr(), timeout, metadata=self.metadata):
                 yield SubscribeResponse_(r)
         except grpc.RpcError as rpcerr:
-            status = Status_.from_call(rpcerr)
+            raise self._subscribe_error(rpcerr)
+
+    def poll(self, paths: list,
+             options: SubscribeOptions = {}) -> 'PollSubscription':
+        r"""Open a POLL mode subscription
 
-            # server sometimes sends: 
-            #    gnmi.exceptions.GrpcError: StatusCode.UNKNOWN: context deadline exceeded
-            if status.code.name == "DEADLINE_EXCEEDED" or status.details == "context deadline exceeded":
-                raise GrpcDeadlineExceeded(status)
+        The stream stays open until the handle is closed, each call to
+        :meth:`PollSubscription.poll` returns a fresh snapshot.
+
+        Usage::
+
+            In [62]: with sess.poll(["/system/memory/state"]) as sub:
+                ...:     for _ in range(3):
+                ...:         for notif in sub.poll():
+                ...:             for update in notif.update:
+                ...:                 print(str(update.path), update.get_value())
+                ...:         time.sleep(10)
+
+        :param paths: List of paths
+        :type paths: list
+        :param options: ``mode`` is forced to ``poll``
+        :type options: gnmi.structures.SubscribeOptions
+        :rtype: gnmi.session.PollSubscription
+        """
+        return PollSubscription(self, paths, options)
+
+
+class PollSubscription(object):
+    r"""Handle of an open POLL mode subscription
+
+    The first :meth:`poll` returns the initial sync the target sends when
+    the subscription is created, every following call sends a ``Poll``
+    request and returns the notifications up to the next ``sync_response``.
+    """
+
+    _CLOSE = object()
+
+    def __init__(self, session: Session, paths: list,
+                 options: SubscribeOptions = {}):
+        self.session = session
+        self._lock = threading.Lock()
+        self._requests: queue.Queue = queue.Queue()
+        self._initial = True
+        self.polls = 0
+
+        sub_list = session._poll_subscription_list(paths, options)
+        self._requests.put(pb.SubscribeRequest(subscribe=sub_list))
+
+        self._call = session._stub.Subscribe(
+            iter(self._requests.get, self._CLOSE),
+            metadata=session.metadata)
+
+    def __enter__(self) -> 'PollSubscription':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def poll(self) -> List[Notification_]:
+        r"""Trigger a poll and wait for the target to answer it
+
+        :rtype: list of gnmi.messages.Notification_
+        """
+        with self._lock:
+            if self._initial:
+                self._initial = False
             else:
-                raise GrpcError(status)
+                self._requests.put(pb.SubscribeRequest(poll=pb.Poll()))
+            self.polls += 1
+
+            notifications = []
+            try:
+                for r in self._call:
+                    if r.sync_response:
+                        return notifications
+                    notifications.append(Notification_(r.update))
+            except grpc.RpcError as rpcerr:
+                raise self.session._subscribe_error(rpcerr)
+
+            # stream ended without a sync_response
+            return notifications
+
+    def close(self) -> None:
+        r"""Close the request stream and cancel the subscription"""
+        self._requests.put(self._CLOSE)
+        self._call.cancel()
@@ -32,6 +32,21 @@ class Target:
             return self.location
         
         return None
+
+    @property
+    def grpc_target(self) -> str:
+        """Address in the form gRPC expects it, see
+        https://github.com/grpc/grpc/blob/master/doc/naming.md
+        """
+        if self.path is not None:
+            return f"unix:{self.path}"
+
+        if self.scheme in (None, "", "http", "https", "grpc", "grpcs"):
+            if self.port > 0:
+                return f"{self.location}:{self.port}"
+            return self.location
+
+        return str(self)
     
     @classmethod
     def from_url(cls, url: str) -> "Target":
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.timeseries
+~~~~~~~~~~~~~~~~
+
+Bounded in-memory time-series of numeric leaves
+
+Samples are kept in preallocated NumPy arrays, one row of `capacity`
+``(timestamp, value)`` slots per path used as a ring buffer, so memory only
+grows with the number of paths. Requires NumPy.
+
+"""
+
+import warnings
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from gnmi import values
+
+_NUMERIC_FIELDS = frozenset(("int_val", "uint_val", "float_val", "double_val",
+                             "bool_val"))
+
+_AGGREGATES = {
+    "mean": np.nanmean,
+    "min": np.nanmin,
+    "max": np.nanmax,
+    "sum": np.nansum,
+}
+
+
+class TimeSeriesStore(object):
+    r"""Keep the last `capacity` samples of each numeric leaf
+
+    Usage::
+
+        >>> store = TimeSeriesStore(capacity=3600)
+        >>> store.consume(sess.subscribe(paths, {"submode": "sample"}))
+        >>> timestamps, values = store.last(["/a", "/b"])
+        >>> store.window(store.paths, start=now - 60 * 10**9, how="max")
+
+    Notification paths are full path strings, as yielded by
+    :meth:`gnmi.messages.Notification_.iter_leaves`. Values other than
+    integers, floats, booleans and Decimal64 are ignored.
+
+    :param capacity: samples kept per path
+    :type capacity: int
+    :param dtype: NumPy dtype of the values
+    :type dtype: str
+    :param max_paths: maximum number of paths, samples of further paths are
+        dropped and counted in `dropped`
+    :type max_paths: int
+    """
+
+    def __init__(self, capacity: int = 1024, dtype: str = "float64",
+                 max_paths: Optional[int] = None):
+        if capacity < 1:
+            raise ValueError("Invalid capacity: %d" % capacity)
+
+        self.capacity = capacity
+        self.dtype = np.dtype(dtype)
+        self.max_paths = max_paths
+        self.dropped = 0
+
+        self._index: Dict[Hashable, int] = {}
+        self.paths: List[Hashable] = []
+
+        rows = 16 if max_paths is None else min(16, max_paths)
+        self._timestamps = np.zeros((rows, capacity), dtype="int64")
+        self._values = np.zeros((rows, capacity), dtype=self.dtype)
+        # number of samples ever written per path, the next slot is
+        # written % capacity
+        self._written = np.zeros(rows, dtype="int64")
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __contains__(self, path: Hashable) -> bool:
+        return path in self._index
+
+    @property
+    def nbytes(self) -> int:
+        return self._timestamps.nbytes + self._values.nbytes + \
+            self._written.nbytes
+
+    def _row(self, path: Hashable) -> Optional[int]:
+        row = self._index.get(path)
+        if row is not None:
+            return row
+
+        row = len(self.paths)
+        if self.max_paths is not None and row >= self.max_paths:
+            return None
+
+        if row == len(self._written):
+            self._grow()
+
+        self._index[path] = row
+        self.paths.append(path)
+        return row
+
+    def _grow(self) -> None:
+        rows = len(self._written) * 2
+        if self.max_paths is not None:
+            rows = min(rows, self.max_paths)
+        extra = rows - len(self._written)
+
+        self._timestamps = np.concatenate(
+            (self._timestamps, np.zeros((extra, self.capacity), dtype="int64")))
+        self._values = np.concatenate(
+            (self._values, np.zeros((extra, self.capacity), dtype=self.dtype)))
+        self._written = np.concatenate(
+            (self._written, np.zeros(extra, dtype="int64")))
+
+    def add(self, path: Hashable, timestamp: int, value: Any) -> bool:
+        r"""Add a sample
+
+        :param path: the path
+        :type path: Hashable
+        :param timestamp: timestamp in nanoseconds
+        :type timestamp: int
+        :param value: numeric value
+        :type value: Any
+        :rtype: bool
+        :returns: ``False`` when the sample was dropped
+        """
+        row = self._row(path)
+        if row is None:
+            self.dropped += 1
+            return False
+
+        written = self._written[row]
+        slot = written % self.capacity
+        self._timestamps[row, slot] = timestamp
+        self._values[row, slot] = value
+        self._written[row] = written + 1
+        return True
+
+    def add_notification(self, notification: Any) -> int:
+        r"""Add the numeric updates of a notification
+
+        :param notification: the notification
+        :type notification: gnmi.messages.Notification_
+        :rtype: int
+        :returns: number of samples added
+        """
+        timestamp = notification.raw.timestamp
+        added = 0
+
+        for path, value in notification.iter_leaves(decode=False):
+            field = value.WhichOneof("value")
+            if field in _NUMERIC_FIELDS:
+                sample = getattr(value, field)
+            elif field == "decimal_val":
+                sample = values._decimal_float(value.decimal_val)
+            else:
+                continue
+            added += self.add(path, timestamp, sample)
+
+        return added
+
+    def consume(self, responses: Iterable[Any]) -> int:
+        r"""Add the notifications of `responses` until they are exhausted
+
+        :param responses: notifications, get or subscribe responses, e.g.
+            from :meth:`gnmi.session.Session.subscribe`
+        :type responses: Iterable
+        :rtype: int
+        :returns: number of samples added
+        """
+        added = 0
+        for response in responses:
+            if hasattr(response, "sync_response"):
+                if response.sync_response or \
+                        not response.raw.HasField("update"):
+                    continue
+                notifications = [response.update]
+            elif hasattr(response, "notification"):
+                notifications = response.notification
+            else:
+                notifications = [response]
+
+            for notification in notifications:
+                added += self.add_notification(notification)
+        return added
+
+    def _rows(self, paths: Sequence[Hashable]) -> np.ndarray:
+        return np.array([self._index.get(p, -1) for p in paths], dtype="int64")
+
+    def series(self, path: Hashable, start: Optional[int] = None,
+               end: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        r"""Samples of a path in the order they were added
+
+        :param path: the path
+        :type path: Hashable
+        :param start: only samples at or after this timestamp
+        :type start: int
+        :param end: only samples before this timestamp
+        :type end: int
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        :returns: timestamps and values
+        """
+        row = self._index.get(path)
+        if row is None:
+            return (np.empty(0, dtype="int64"), np.empty(0, dtype=self.dtype))
+
+        written = int(self._written[row])
+        if written <= self.capacity:
+            order = slice(0, written)
+            timestamps = self._timestamps[row, order]
+            vals = self._values[row, order]
+        else:
+            shift = -(written % self.capacity)
+            timestamps = np.roll(self._timestamps[row], shift)
+            vals = np.roll(self._values[row], shift)
+
+        if start is not None or end is not None:
+            mask = np.ones(len(timestamps), dtype=bool)
+            if start is not None:
+                mask &= timestamps >= start
+            if end is not None:
+                mask &= timestamps < end
+            timestamps, vals = timestamps[mask], vals[mask]
+
+        return timestamps.copy(), vals.copy()
+
+    def last(self, paths: Optional[Sequence[Hashable]] = None
+             ) -> Tuple[np.ndarray, np.ndarray]:
+        r"""Latest sample of each path
+
+        Paths without samples have a timestamp of 0 and a value of NaN, or 0
+        for integer dtypes.
+
+        :param paths: the paths, all paths by default
+        :type paths: Sequence[Hashable]
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        :returns: timestamps and values aligned with `paths`
+        """
+        if paths is None:
+            paths = self.paths
+        rows = self._rows(paths)
+        known = rows >= 0
+        safe_rows = np.where(known, rows, 0)
+
+        written = self._written[safe_rows]
+        known &= written > 0
+        slots = (written - 1) % self.capacity
+
+        timestamps = np.where(known, self._timestamps[safe_rows, slots], 0)
+        missing = np.nan if self.dtype.kind == "f" else 0
+        vals = np.where(known, self._values[safe_rows, slots], missing)
+        return timestamps, vals.astype(self.dtype, copy=False)
+
+    def window(self, paths: Optional[Sequence[Hashable]] = None,
+               start: Optional[int] = None, end: Optional[int] = None,
+               how: str = "mean") -> np.ndarray:
+        r"""Aggregate the samples of many paths within a time window
+
+        Usage::
+
+            >>> store.window(["/a", "/b"], start=t0, end=t1, how="max")
+            array([12., nan])
+
+        :param paths: the paths, all paths by default
+        :type paths: Sequence[Hashable]
+        :param start: only samples at or after this timestamp
+        :type start: int
+        :param end: only samples before this timestamp
+        :type end: int
+        :param how: one of ``mean``, ``min``, ``max``, ``sum`` or ``count``
+        :type how: str
+        :rtype: numpy.ndarray
+        :returns: one value per path, NaN where a path has no samples in the
+            window
+        """
+        if how not in _AGGREGATES and how != "count":
+            raise ValueError("Unknown aggregate: %s" % how)
+
+        if paths is None:
+            paths = self.paths
+        rows = self._rows(paths)
+        known = rows >= 0
+        safe_rows = np.where(known, rows, 0)
+
+        timestamps = self._timestamps[safe_rows]
+        mask = np.arange(self.capacity) < self._written[safe_rows, None]
+        mask &= known[:, None]
+        if start is not None:
+            mask &= timestamps >= start
+        if end is not None:
+            mask &= timestamps < end
+
+        if how == "count":
+            return mask.sum(axis=1)
+
+        vals = np.where(mask, self._values[safe_rows].astype("float64"), np.nan)
+        empty = ~mask.any(axis=1)
+        with warnings.catch_warnings():
+            # rows without samples warn, they are set to NaN below
+            warnings.simplefilter("ignore", RuntimeWarning)
+            result = _AGGREGATES[how](vals, axis=1)
+        result[empty] = np.nan
+        return result
@@ -7,30 +7,32 @@ import os
 import re
 import pathlib
 
-from urllib.parse import urlparse, ParseResult
-from typing import Any, Dict, List, NoReturn, Optional, Tuple, Union
-
-import google.protobuf as _
-import gnmi.proto.gnmi_pb2 as pb  # type: ignore
+from typing import TYPE_CHECKING, Any, Dict, List, NoReturn, Optional, Tuple, Union
 
 from gnmi.environments import GNMI_RC_PATH
-from gnmi.config import Config
-from gnmi.constants import GNMIRC_FILES
 
-RE_PATH_COMPONENT = re.compile(r'''
-^
-(?P<name>[^[]+)
-(?P<keyval>\[.*\])?$
-''', re.VERBOSE)
+if TYPE_CHECKING:
+    from gnmi.config import Config
+
+_NAME, _KEY, _VALUE = range(3)
+
+# runs of plain or escaped characters, or a single delimiter
+RE_PATH_TOKEN = re.compile(r"(?:[^\\/\[\]=]|\\.?)+|.", re.DOTALL)
+RE_PATH_UNESCAPE = re.compile(r"\\(.)", re.DOTALL)
+RE_PATH_ORIGIN = re.compile(r"([\w\-]*):")
 
 def enable_grpc_debuging() -> NoReturn:
     os.environ['GRPC_TRACE'] = 'all'
     os.environ['GRPC_VERBOSITY'] = 'DEBUG'
 
 def get_gnmi_constant(name: str) -> int:
+    import gnmi.proto.gnmi_pb2 as pb  # type: ignore
     return getattr(pb, name.replace("-", "_").upper())
 
-def load_rc() -> Config:
+def load_rc() -> 'Config':
+    from gnmi.config import Config
+    from gnmi.constants import GNMIRC_FILES
+
     rc = Config({})
     path = pathlib.Path(GNMI_RC_PATH)
     for name in GNMIRC_FILES:
@@ -63,22 +65,144 @@ def parse_duration(duration: str) -> Optional[int]:
     return val * multipliers[unit]
 
 
-def parse_path(path: str) -> List[Dict[str, Any]]:
-    parsed = []
-    elems = [re.sub(r"\\", "", name) for name in re.split(r"(?<!\\)/", path) if name]
-
-    for elem in elems:
+def _unescape(text: str) -> str:
+    if "\\" in text:
+        return RE_PATH_UNESCAPE.sub(r"\1", text)
+    return text
+
+def split_origin(path: str) -> Tuple[Optional[str], str]:
+    r"""Split the origin from a path string
+
+    Usage::
+
+        >>> split_origin("openconfig:/interfaces")
+        ('openconfig', '/interfaces')
+        >>> split_origin("/interfaces")
+        (None, '/interfaces')
+
+    :param path: path string
+    :type path: str
+    :rtype: Tuple[Optional[str], str]
+    """
+    if path and path[0] != "/":
+        match = RE_PATH_ORIGIN.match(path)
+        if match:
+            return match.group(1) or None, path[match.end():]
+    return None, path
+
+def _parse_plain_path(path: str) -> List[Dict[str, Any]]:
+    # same grammar as the tokenizer in parse_path for paths without escapes,
+    # scanning with str.find is several times faster
+    parsed: List[Dict[str, Any]] = []
+    find = path.find
+    end = len(path)
+    pos = 0
+
+    while pos < end:
+        slash = find("/", pos)
+        if slash == -1:
+            slash = end
+        bracket = find("[", pos, slash)
+
+        if bracket == -1:
+            if slash > pos:
+                parsed.append(dict(name=path[pos:slash], keys={}))
+            pos = slash + 1
+            continue
+
+        if bracket == pos:
+            raise ValueError("Missing name before key in path: %r" % path)
+
+        name = path[pos:bracket]
         keys = {}
-        match = RE_PATH_COMPONENT.search(elem)
-        name = match.group("name")
-        keyvals = match.group("keyval")
-        if keyvals:
-            for keyval in re.findall(r"\[([^]]*)\]", keyvals):
-                key, val = keyval.split("=")
-                keys[key] = val
+        pos = bracket
+        while pos < end and path[pos] == "[":
+            equal = find("=", pos)
+            close = find("]", pos)
+            if close == -1:
+                raise ValueError("Unterminated key in path: %r" % path)
+            if equal == -1 or equal > close:
+                raise ValueError("Missing '=' in key of path: %r" % path)
+            close = find("]", equal)
+            keys[path[pos + 1:equal]] = path[equal + 1:close]
+            pos = close + 1
+
+        if pos < end and path[pos] != "/":
+            raise ValueError("Unexpected %r after key in path: %r" % (path[pos], path))
 
         parsed.append(dict(name=name, keys=keys))
-    
+        pos += 1
+
+    return parsed
+
+def parse_path(path: str) -> List[Dict[str, Any]]:
+    r"""Parse the elements of a path string
+
+    Elements are separated by ``/`` and may carry any number of
+    ``[key=value]`` pairs. A backslash escapes the next character, e.g. ``/``
+    or ``[`` in names, ``=`` or ``]`` in keys and ``]`` in values.
+
+    Usage::
+
+        >>> parse_path(r"/acl/acl-set[name=permit\]all][type=ipv4]")
+        [{'name': 'acl', 'keys': {}},
+         {'name': 'acl-set', 'keys': {'name': 'permit]all', 'type': 'ipv4'}}]
+
+    :param path: path string without origin
+    :type path: str
+    :rtype: List[Dict[str, Any]]
+    """
+    if "\\" not in path:
+        return _parse_plain_path(path)
+    return _parse_escaped_path(path)
+
+def _parse_escaped_path(path: str) -> List[Dict[str, Any]]:
+    parsed: List[Dict[str, Any]] = []
+    name: List[str] = []
+    keys: Dict[str, str] = {}
+    key: List[str] = []
+    value: List[str] = []
+    state = _NAME
+    closed = False
+
+    for token in RE_PATH_TOKEN.findall(path):
+        if state == _NAME:
+            if token == "/":
+                if name:
+                    parsed.append(dict(name="".join(name), keys=keys))
+                    name, keys = [], {}
+                closed = False
+            elif token == "[":
+                if not name:
+                    raise ValueError("Missing name before key in path: %r" % path)
+                key = []
+                state = _KEY
+            elif closed:
+                raise ValueError("Unexpected %r after key in path: %r" % (token, path))
+            else:
+                name.append(_unescape(token))
+        elif state == _KEY:
+            if token == "=":
+                value = []
+                state = _VALUE
+            elif token == "]":
+                raise ValueError("Missing '=' in key of path: %r" % path)
+            else:
+                key.append(_unescape(token))
+        else:
+            if token == "]":
+                keys["".join(key)] = "".join(value)
+                closed = True
+                state = _NAME
+            else:
+                value.append(_unescape(token))
+
+    if state != _NAME:
+        raise ValueError("Unterminated key in path: %r" % path)
+
+    if name:
+        parsed.append(dict(name="".join(name), keys=keys))
+
     return parsed
 
 def prepare_metadata(data: Union[dict, tuple]) -> List[Tuple[str, str]]:
@@ -90,12 +214,12 @@ def prepare_metadata(data: Union[dict, tuple]) -> List[Tuple[str, str]]:
     return [(k, v) for k,v in data.items()]
 
 def escape_string(string: str, escape: list) -> str:
-    result = ""
-    for character in string:
-        if character in tuple(escape) + ("\\",):
-            result += "\\"
-        result += character
-    return result
+    # fast path for the common case of nothing to escape
+    if "\\" not in string and not any(c in string for c in escape):
+        return string
+    escape = set(escape)
+    escape.add("\\")
+    return "".join("\\" + c if c in escape else c for c in string)
 
 def datetime_from_int64(timestamp: int) -> datetime:
     return datetime.datetime.fromtimestamp(timestamp // 1000000000)
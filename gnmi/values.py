@@ -0,0 +1,439 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+"""
+gnmi.values
+~~~~~~~~~~~~~~~~
+
+Decoding of gnmi.TypedValue messages
+
+The populated field is found with a single ``WhichOneof`` lookup and its
+value passed through the decoder registered for the field. Fields without a
+decoder, such as ``int_val`` or ``string_val``, are returned as is.
+
+"""
+
+import array
+import base64
+import decimal
+import importlib
+import importlib.util
+import json
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from gnmi.environments import GNMI_BYTES_MODE, GNMI_JSON_BACKEND, GNMI_JSON_LAZY
+from gnmi.proto import gnmi_pb2 as pb  # type: ignore
+
+Decoder = Callable[[Any], Any]
+
+ORJSON_SUPPORTED: bool = importlib.util.find_spec("orjson") is not None
+NUMPY_SUPPORTED: bool = importlib.util.find_spec("numpy") is not None
+
+# Decimal64 digits fit in 19 digits, scaling them is always exact with this
+# context whatever the thread's context is
+_DECIMAL_CONTEXT = decimal.Context(prec=28)
+
+# array typecodes by dtype name
+_TYPECODES = {
+    "int64": "q",
+    "uint64": "Q",
+    "float64": "d",
+}
+
+_POW10 = tuple(10.0 ** i for i in range(20))
+
+FIELDS = tuple(f.name for f in
+               pb.TypedValue.DESCRIPTOR.oneofs_by_name["value"].fields)
+
+
+def _decode_decimal(value: pb.Decimal64) -> Decimal:
+    return Decimal(value.digits).scaleb(-value.precision, _DECIMAL_CONTEXT)
+
+
+def _decode_leaflist(value: pb.ScalarArray) -> list:
+    return [decode(elem) for elem in value.element]
+
+
+class LazyJSON(object):
+    r"""JSON value decoded on first access
+
+    Holds the encoded bytes until the value is read, through `value`,
+    indexing, iteration or comparison. Consumers that only forward the value
+    can use `raw` without ever decoding it.
+
+    Usage::
+
+        >>> val = LazyJSON(b'{"name": "Ethernet1"}')
+        >>> val.raw
+        b'{"name": "Ethernet1"}'
+        >>> val["name"]
+        'Ethernet1'
+    """
+
+    __slots__ = ("raw", "_loads", "_value")
+
+    def __init__(self, raw: bytes, loads: Optional[Decoder] = None):
+        self.raw = raw
+        self._loads = loads or _json_loads
+
+    @property
+    def value(self) -> Any:
+        try:
+            return self._value
+        except AttributeError:
+            self._value = self._loads(self.raw)
+            return self._value
+
+    @property
+    def decoded(self) -> bool:
+        return hasattr(self, "_value")
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.raw)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.value[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.value)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.value
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyJSON):
+            other = other.value
+        return self.value == other
+
+    __hash__ = None  # type: ignore
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self.value.get(key, default)
+
+    def __repr__(self) -> str:
+        return "%s(%r)" % (self.__class__.__name__, self.raw)
+
+
+def _orjson_loads() -> Decoder:
+    orjson = importlib.import_module("orjson")
+
+    def loads(data: bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json, e.g. it rejects NaN
+            return json.loads(data)
+    return loads
+
+
+_json_loads: Decoder = json.loads
+
+
+def set_json_backend(backend: Union[str, Decoder] = GNMI_JSON_BACKEND,
+                     lazy: bool = GNMI_JSON_LAZY) -> None:
+    r"""Select how ``json_val`` and ``json_ietf_val`` values are decoded
+
+    Usage::
+
+        >>> set_json_backend("orjson", lazy=True)
+
+    :param backend: ``"auto"`` for orjson when installed and the standard
+        library otherwise, ``"orjson"``, ``"json"`` or a callable taking bytes.
+        Note orjson decodes integers wider than 64 bits as floats.
+    :type backend: Union[str, Callable[[bytes], Any]]
+    :param lazy: return :class:`LazyJSON` values decoded on first access
+    :type lazy: bool
+    """
+    global _json_loads
+
+    if callable(backend):
+        loads = backend
+    elif backend == "auto":
+        loads = _orjson_loads() if ORJSON_SUPPORTED else json.loads
+    elif backend == "orjson":
+        if not ORJSON_SUPPORTED:
+            raise ValueError("JSON backend 'orjson' is not installed")
+        loads = _orjson_loads()
+    elif backend == "json":
+        loads = json.loads
+    else:
+        raise ValueError("Unknown JSON backend: %s" % backend)
+
+    _json_loads = loads
+    decoder: Decoder = LazyJSON if lazy else loads
+
+    for field in ("json_val", "json_ietf_val"):
+        _DEFAULT_DECODERS[field] = decoder
+        _decoders[field] = decoder
+
+
+def decode_json(data: bytes) -> Any:
+    r"""Decode JSON `data` with the configured backend
+
+    :param data: encoded JSON
+    :type data: bytes
+    :rtype: Any
+    """
+    return _DEFAULT_DECODERS["json_val"](data)
+
+
+BYTES_MODES = ("base64", "raw", "memoryview")
+
+_bytes_mode = "base64"
+
+
+def set_bytes_mode(mode: str = GNMI_BYTES_MODE) -> None:
+    r"""Select how ``bytes_val`` and ``proto_bytes`` values are returned
+
+    - ``base64``: ``bytes_val`` base64 encoded and ``proto_bytes`` as is,
+      as in previous releases
+    - ``raw``: both as the ``bytes`` object read from the message
+    - ``memoryview``: both as a read-only ``memoryview`` of that object.
+      Protobuf copies the bytes out of the message when the field is read,
+      so this is a view of that copy, not of the received buffer. Slicing
+      the view does not copy again
+
+    Encoding for output, e.g. as JSON, is left to the consumer, see
+    :func:`gnmi.entry.write_notification`.
+
+    :param mode: one of :data:`BYTES_MODES`
+    :type mode: str
+    """
+    global _bytes_mode
+
+    if mode not in BYTES_MODES:
+        raise ValueError("Unknown bytes mode: %s" % mode)
+    _bytes_mode = mode
+
+    decoders = {
+        "base64": {"bytes_val": base64.b64encode, "proto_bytes": None},
+        "raw": {"bytes_val": None, "proto_bytes": None},
+        "memoryview": {"bytes_val": memoryview, "proto_bytes": memoryview},
+    }[mode]
+
+    for field, decoder in decoders.items():
+        if decoder is None:
+            _DEFAULT_DECODERS.pop(field, None)
+            _decoders.pop(field, None)
+        else:
+            _DEFAULT_DECODERS[field] = decoder
+            _decoders[field] = decoder
+
+
+def get_bytes_mode() -> str:
+    r"""The current bytes mode, see :func:`set_bytes_mode`
+
+    :rtype: str
+    """
+    return _bytes_mode
+
+
+def decode_bytes(data: bytes) -> Union[bytes, memoryview]:
+    r"""Return binary `data` according to the bytes mode
+
+    :param data: binary value
+    :type data: bytes
+    :rtype: Union[bytes, memoryview]
+    """
+    if _bytes_mode == "base64":
+        return base64.b64encode(data)
+    if _bytes_mode == "memoryview":
+        return memoryview(data)
+    return data
+
+
+_DEFAULT_DECODERS: Dict[str, Optional[Decoder]] = {
+    "decimal_val": _decode_decimal,
+    "leaflist_val": _decode_leaflist,
+}
+
+_decoders: Dict[str, Optional[Decoder]] = dict(_DEFAULT_DECODERS)
+
+set_json_backend()
+set_bytes_mode()
+
+
+def register_decoder(field: str, decoder: Optional[Decoder] = None) -> Optional[Decoder]:
+    r"""Register the decoder for a TypedValue field
+
+    The decoder is called with the field value, e.g. the ``pb.Decimal64`` of
+    ``decimal_val`` or the ``bytes`` of ``json_ietf_val``. Passing ``None``
+    restores the default.
+
+    Usage::
+
+        >>> register_decoder("json_ietf_val", orjson.loads)
+        <built-in function loads>
+
+    :param field: name of the field in the ``value`` oneof
+    :type field: str
+    :param decoder: callable taking the field value
+    :type decoder: Callable[[Any], Any]
+    :rtype: Optional[Callable[[Any], Any]]
+    :returns: the previous decoder
+    """
+    if field not in FIELDS:
+        raise ValueError("Unknown TypedValue field: %s" % field)
+
+    previous = _decoders.get(field)
+    if decoder is None:
+        decoder = _DEFAULT_DECODERS.get(field)
+
+    if decoder is None:
+        _decoders.pop(field, None)
+    else:
+        _decoders[field] = decoder
+    return previous
+
+
+def decode(value: pb.TypedValue) -> Any:
+    r"""Decode a gnmi.TypedValue message
+
+    :param value: the typed value
+    :type value: gnmi_pb2.TypedValue
+    :rtype: Any
+    """
+    field = value.WhichOneof("value")
+    if field is None:
+        raise ValueError("Unhandled typed value %s" % value)
+
+    decoder = _decoders.get(field)
+    if decoder is None:
+        return getattr(value, field)
+    return decoder(getattr(value, field))
+
+
+def extract_values(updates: Union[Any, Iterable[Any]]) -> List[Any]:
+    r"""Decode the values of many updates in one pass
+
+    Usage::
+
+        >>> for notif in sess.get(paths):
+        ...     values = extract_values(notif)
+
+    :param updates: a notification, or an iterable of updates, either as
+        protobuf messages or :mod:`gnmi.messages` wrappers
+    :type updates: Union[Notification_, Iterable[Update_]]
+    :rtype: List[Any]
+    """
+    raw = getattr(updates, "raw", updates)
+    if isinstance(raw, pb.Notification):
+        raw = raw.update
+
+    decoders = _decoders
+    values = []
+    append = values.append
+
+    for update in raw:
+        if type(update) is not _Update:
+            update = update.raw
+        val = update.val
+        field = val.WhichOneof("value")
+
+        if field is None:
+            append(_legacy_value(update))
+            continue
+
+        decoder = decoders.get(field)
+        if decoder is None:
+            append(getattr(val, field))
+        else:
+            append(decoder(getattr(val, field)))
+
+    return values
+
+
+def _decimal_float(value: pb.Decimal64) -> float:
+    precision = value.precision
+    if precision < len(_POW10):
+        return value.digits / _POW10[precision]
+    return value.digits / 10.0 ** precision
+
+
+def extract_numeric(updates: Union[Any, Iterable[Any]], dtype: str = "float64",
+                    backend: str = "array") -> Any:
+    r"""Convert the numeric values of many updates into a contiguous buffer
+
+    ``int_val``, ``uint_val``, ``float_val``, ``double_val`` and
+    ``decimal_val`` values are supported, anything else raises
+    :class:`ValueError`. Integer dtypes only take integers, Decimal64 values
+    must then have a zero precision, they are scaled in floating point for
+    ``float64``.
+
+    Usage::
+
+        >>> extract_numeric(notification, "uint64")
+        array('Q', [1200, 1300, 1250])
+        >>> extract_numeric(notification, "float64", backend="numpy")
+        array([1200., 1300., 1250.])
+
+    :param updates: a notification, or an iterable of updates, either as
+        protobuf messages or :mod:`gnmi.messages` wrappers
+    :type updates: Union[Notification_, Iterable[Update_]]
+    :param dtype: ``int64``, ``uint64`` or ``float64``
+    :type dtype: str
+    :param backend: ``array`` for :class:`array.array` or ``numpy`` for a
+        ``numpy.ndarray``
+    :type backend: str
+    :rtype: Union[array.array, numpy.ndarray]
+    """
+    if dtype not in _TYPECODES:
+        raise ValueError("Unsupported dtype: %s" % dtype)
+    if backend not in ("array", "numpy"):
+        raise ValueError("Unknown backend: %s" % backend)
+
+    raw = getattr(updates, "raw", updates)
+    if isinstance(raw, pb.Notification):
+        raw = raw.update
+
+    floating = dtype == "float64"
+    fields = _FLOAT_FIELDS if floating else _INTEGER_FIELDS
+    numbers = []
+    append = numbers.append
+
+    for update in raw:
+        if type(update) is not _Update:
+            update = update.raw
+        val = update.val
+        field = val.WhichOneof("value")
+
+        if field in fields:
+            append(getattr(val, field))
+        elif field == "decimal_val":
+            dec = val.decimal_val
+            if floating:
+                append(_decimal_float(dec))
+            elif dec.precision == 0:
+                append(dec.digits)
+            else:
+                raise ValueError("Decimal value %s does not fit %s" % (
+                    _decode_decimal(dec), dtype))
+        else:
+            raise ValueError("Value of %s does not fit %s" % (field, dtype))
+
+    try:
+        if backend == "numpy":
+            numpy = importlib.import_module("numpy")
+            return numpy.array(numbers, dtype=dtype)
+        return array.array(_TYPECODES[dtype], numbers)
+    except OverflowError as exc:
+        raise ValueError("Values do not fit %s: %s" % (dtype, exc))
+
+
+_INTEGER_FIELDS = frozenset(("int_val", "uint_val"))
+_FLOAT_FIELDS = frozenset(("int_val", "uint_val", "float_val", "double_val"))
+
+_Update = pb.Update
+
+
+def _legacy_value(update: pb.Update) -> Any:
+    if update.HasField("value"):
+        # deprecated gnmi.Value messages are rare enough to go through the
+        # wrapper
+        from gnmi.messages import Value_
+        return Value_(update.value).extract_val()
+    return None
@@ -35,3 +35,21 @@ def certificates():
 @pytest.fixture(scope="session")
 def is_insecure():
     return GNMI_INSECURE
+
+
+@pytest.fixture()
+def gnmi_server():
+    from tests.server import FakeServer
+
+    server = FakeServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture()
+def gnmi_tls_server():
+    from tests.server import FakeServer
+
+    server = FakeServer(tls=True).start()
+    yield server
+    server.stop()
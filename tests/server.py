@@ -0,0 +1,149 @@
+"""In-process gNMI server used by tests that do not need a real target"""
+
+import os
+import threading
+import time
+from concurrent import futures
+
+import grpc
+
+from gnmi.proto import gnmi_pb2 as pb
+from gnmi.proto import gnmi_pb2_grpc
+
+
+def _path_string(path: pb.Path) -> str:
+    return "".join("/" + e.name + "".join("[%s=%s]" % kv for kv in sorted(e.key.items()))
+                   for e in path.elem)
+
+
+class FakeServicer(gnmi_pb2_grpc.gNMIServicer):
+    """Answers every request with values derived from the requested paths
+
+    Each leaf value is the string form of the requested path. Attributes can
+    be tweaked by tests to change behaviour.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.lock = threading.Lock()
+        # number of extra notifications sent after sync in STREAM mode
+        self.stream_updates = 0
+        # abort the RPC with this code instead of answering
+        self.fail_code = None
+        # abort this many STREAM subscriptions with UNAVAILABLE after the
+        # extra notifications were sent
+        self.stream_failures = 0
+        # timestamp of the initial sync notifications, time of the request
+        # if not set
+        self.sync_timestamp = None
+        # Get requests including any of these paths fail with NOT_FOUND
+        self.fail_paths = set()
+
+    def _record(self, request):
+        with self.lock:
+            self.requests.append(request)
+
+    def _notification(self, prefix: pb.Path, path: pb.Path,
+                      timestamp: int = None) -> pb.Notification:
+        return pb.Notification(
+            timestamp=timestamp or time.time_ns(),
+            prefix=prefix,
+            update=[pb.Update(path=path,
+                              val=pb.TypedValue(string_val=_path_string(path)))])
+
+    def _check_fail(self, context):
+        if self.fail_code is not None:
+            context.abort(self.fail_code, "fake failure")
+
+    def Capabilities(self, request, context):
+        self._record(request)
+        self._check_fail(context)
+        return pb.CapabilityResponse(
+            supported_models=[pb.ModelData(name="fake-model",
+                                           organization="Arista", version="1.0")],
+            supported_encodings=[pb.JSON, pb.ASCII],
+            gNMI_version="0.10.0")
+
+    def Get(self, request, context):
+        self._record(request)
+        self._check_fail(context)
+        if self.fail_paths & {_path_string(p) for p in request.path}:
+            context.abort(grpc.StatusCode.NOT_FOUND, "fake missing path")
+        return pb.GetResponse(notification=[
+            self._notification(request.prefix, p) for p in request.path])
+
+    def Set(self, request, context):
+        self._record(request)
+        self._check_fail(context)
+        results = []
+        for path in request.delete:
+            results.append(pb.UpdateResult(path=path, op=pb.UpdateResult.DELETE))
+        for upd in request.replace:
+            results.append(pb.UpdateResult(path=upd.path, op=pb.UpdateResult.REPLACE))
+        for upd in request.update:
+            results.append(pb.UpdateResult(path=upd.path, op=pb.UpdateResult.UPDATE))
+        return pb.SetResponse(prefix=request.prefix, response=results,
+                              timestamp=time.time_ns())
+
+    def _sync(self, sub_list):
+        for sub in sub_list.subscription:
+            yield pb.SubscribeResponse(
+                update=self._notification(sub_list.prefix, sub.path,
+                                          self.sync_timestamp))
+        yield pb.SubscribeResponse(sync_response=True)
+
+    def Subscribe(self, request_iterator, context):
+        first = next(request_iterator)
+        self._record(first)
+        self._check_fail(context)
+        sub_list = first.subscribe
+
+        if not sub_list.updates_only:
+            yield from self._sync(sub_list)
+        else:
+            yield pb.SubscribeResponse(sync_response=True)
+
+        if sub_list.mode == pb.SubscriptionList.POLL:
+            for request in request_iterator:
+                self._record(request)
+                yield from self._sync(sub_list)
+        elif sub_list.mode == pb.SubscriptionList.STREAM:
+            for _ in range(self.stream_updates):
+                for sub in sub_list.subscription:
+                    yield pb.SubscribeResponse(
+                        update=self._notification(sub_list.prefix, sub.path))
+            with self.lock:
+                fail = self.stream_failures > 0
+                self.stream_failures -= fail
+            if fail:
+                context.abort(grpc.StatusCode.UNAVAILABLE, "fake restart")
+
+
+CERTS = os.path.join(os.path.dirname(__file__), "certs")
+
+
+def read_cert(name: str) -> bytes:
+    with open(os.path.join(CERTS, name), "rb") as fh:
+        return fh.read()
+
+
+class FakeServer:
+
+    def __init__(self, address: str = "localhost:0", tls: bool = False):
+        self.servicer = FakeServicer()
+        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=32))
+        gnmi_pb2_grpc.add_gNMIServicer_to_server(self.servicer, self.server)
+        if tls:
+            creds = grpc.ssl_server_credentials(
+                [(read_cert("server.key"), read_cert("server.crt"))])
+            port = self.server.add_secure_port(address, creds)
+        else:
+            port = self.server.add_insecure_port(address)
+        self.target = address.replace(":0", ":%d" % port) if port else address
+
+    def start(self):
+        self.server.start()
+        return self
+
+    def stop(self):
+        self.server.stop(None)
@@ -0,0 +1,167 @@
+import asyncio
+
+import grpc
+import pytest
+
+from gnmi.aio import AsyncSession
+from gnmi import aio
+from gnmi.exceptions import GrpcError
+from gnmi.messages import CapabilitiesResponse_, SubscribeResponse_
+from gnmi.target import Target
+
+
+def _session(server):
+    return AsyncSession(Target.from_url(server.target), insecure=True,
+                        metadata={"username": "admin", "password": ""})
+
+
+def test_async_unary(gnmi_server):
+    async def _run():
+        async with _session(gnmi_server) as sess:
+            caps = await sess.capabilities()
+            resp = await sess.get(["/system/config/hostname"])
+            sresp = await sess.set(updates=[("/system/config/hostname", "x")])
+        return caps, resp, sresp
+
+    caps, resp, sresp = asyncio.run(_run())
+
+    assert isinstance(caps, CapabilitiesResponse_)
+    assert caps.gnmi_version == "0.10.0"
+    values = [u.get_value() for n in resp for u in n.update]
+    assert values == ["/system/config/hostname"]
+    assert [r.op.name for r in sresp] == ["UPDATE"]
+
+
+def test_async_concurrent_first_calls_share_channel(gnmi_server):
+    sess = _session(gnmi_server)
+    opened = []
+    new_channel = sess._new_channel
+
+    async def _new_channel():
+        # yields like the executor certificate fetch of TLS sessions
+        await asyncio.sleep(0.01)
+        channel = await new_channel()
+        opened.append(channel)
+        return channel
+
+    sess._new_channel = _new_channel
+
+    async def _run():
+        async with sess:
+            return await asyncio.gather(*[sess.capabilities() for _ in range(5)])
+
+    assert len(asyncio.run(_run())) == 5
+    assert len(opened) == 1
+
+
+def test_async_subscribe(gnmi_server):
+    gnmi_server.servicer.stream_updates = 2
+    paths = ["/interfaces/interface[name=Ethernet%d]" % i for i in range(3)]
+
+    async def _run():
+        async with _session(gnmi_server) as sess:
+            return [r async for r in sess.subscribe(paths)]
+
+    responses = asyncio.run(_run())
+
+    assert all(isinstance(r, SubscribeResponse_) for r in responses)
+    assert [r.sync_response for r in responses].index(True) == 3
+    assert len(responses) == 3 + 1 + 6
+
+
+def test_async_many_streams_one_loop(gnmi_server):
+    async def _count(sess):
+        return len([r async for r in sess.subscribe(["/a", "/b"],
+                                                    {"mode": "once"})])
+
+    async def _run():
+        sessions = [_session(gnmi_server) for _ in range(50)]
+        try:
+            return await asyncio.gather(*[_count(s) for s in sessions])
+        finally:
+            await asyncio.gather(*[s.close() for s in sessions])
+
+    assert asyncio.run(_run()) == [3] * 50
+
+
+def test_async_error(gnmi_server):
+    gnmi_server.servicer.fail_code = grpc.StatusCode.PERMISSION_DENIED
+
+    async def _run():
+        async with _session(gnmi_server) as sess:
+            await sess.get(["/system"])
+
+    with pytest.raises(GrpcError):
+        asyncio.run(_run())
+
+
+def test_async_api(gnmi_server):
+    async def _run():
+        notifs = [n async for n in aio.get(gnmi_server.target, ["/system"],
+                                           insecure=True)]
+        streamed = [n async for n in aio.subscribe(gnmi_server.target,
+                                                   ["/system"], insecure=True,
+                                                   options={"mode": "once"})]
+        return notifs, streamed
+
+    notifs, streamed = asyncio.run(_run())
+    assert len(notifs) == 1
+    assert len(streamed) == 1
+
+
+def test_fanout_merges_and_isolates_errors(gnmi_server):
+    from gnmi.aio import Fanout
+
+    gnmi_server.servicer.stream_updates = 1
+    named = {"sw%d" % i: gnmi_server.target for i in range(20)}
+    named["broken"] = "localhost:1"
+
+    fanout = Fanout(named, ["/a", "/b"], insecure=True, concurrency=4)
+
+    async def _run():
+        return [item async for item in fanout]
+
+    merged = asyncio.run(_run())
+
+    assert len(merged) == 20 * 4
+    assert {name for name, _ in merged} == {"sw%d" % i for i in range(20)}
+    assert fanout.summary() == {"done": 20, "failed": 1}
+    assert fanout.status["sw0"].synced
+    assert fanout.status["sw0"].notifications == 4
+    assert isinstance(fanout.status["broken"].error, GrpcError)
+
+
+def test_fanout_concurrency_bounds_connecting_only(gnmi_server):
+    from gnmi.aio import Fanout
+
+    gnmi_server.servicer.stream_updates = 200
+    named = {"sw%d" % i: gnmi_server.target for i in range(3)}
+    fanout = Fanout(named, ["/a"], insecure=True, concurrency=1, queue_size=1,
+                    options={"mode": "stream"})
+
+    async def _run():
+        return [name async for name, _ in fanout]
+
+    order = asyncio.run(_run())
+
+    # streams run side by side, a target does not wait for the previous
+    # one to finish
+    last = len(order) - 1 - order[::-1].index("sw0")
+    assert order.index("sw2") < last
+    assert fanout.summary() == {"done": 3}
+
+
+def test_fanout_early_exit(gnmi_server):
+    from gnmi.aio import Fanout
+
+    gnmi_server.servicer.stream_updates = 100
+    fanout = Fanout([gnmi_server.target], ["/a"], insecure=True)
+
+    async def _run():
+        agen = fanout.__aiter__()
+        first = await agen.__anext__()
+        await agen.aclose()
+        return first
+
+    target, notif = asyncio.run(_run())
+    assert target == gnmi_server.target
@@ -0,0 +1,160 @@
+import asyncio
+
+import grpc
+import pytest
+
+from gnmi.aio import AsyncSession
+from gnmi.batch import SetBatcher
+from gnmi.exceptions import GnmiBatchError, GrpcError
+from gnmi.messages import Path_
+from gnmi.session import Session
+from gnmi.target import Target
+
+LEAVES = ["/interfaces/interface[name=Ethernet%d]/state/counters" % i
+          for i in range(1000)]
+
+
+def _values(response):
+    return [u.get_value() for n in response for u in n.update]
+
+
+def test_get_batched(gnmi_server):
+    sess = Session(Target.from_url(gnmi_server.target), insecure=True)
+
+    resp = sess.get_batched(LEAVES, {"encoding": "json"}, max_paths=64,
+                            concurrency=4)
+
+    requests = gnmi_server.servicer.requests
+    assert len(requests) == 16
+    assert max(len(r.path) for r in requests) == 64
+    assert _values(resp) == LEAVES
+
+
+def test_get_batched_bytes(gnmi_server):
+    sess = Session(Target.from_url(gnmi_server.target), insecure=True)
+
+    sess.get_batched(LEAVES[:100], max_paths=1000, max_bytes=2048)
+
+    sizes = [sum(p.ByteSize() for p in r.path)
+             for r in gnmi_server.servicer.requests]
+    assert len(sizes) > 1
+    assert max(sizes) <= 2048
+
+
+def test_get_batched_errors(gnmi_server):
+    gnmi_server.servicer.fail_paths = {LEAVES[5], LEAVES[700]}
+    sess = Session(Target.from_url(gnmi_server.target), insecure=True)
+
+    with pytest.raises(GnmiBatchError) as exc:
+        sess.get_batched(LEAVES, max_paths=100)
+
+    assert len(exc.value.errors) == 2
+    failed = {len(paths) for paths, _ in exc.value.errors}
+    assert failed == {100}
+    assert len(_values(exc.value.response)) == 800
+
+
+def test_async_get_batched(gnmi_server):
+    gnmi_server.servicer.fail_paths = {LEAVES[0]}
+
+    async def _run():
+        async with AsyncSession(Target.from_url(gnmi_server.target),
+                                insecure=True) as sess:
+            ok = await sess.get_batched(LEAVES[100:], max_paths=50)
+            with pytest.raises(GnmiBatchError) as exc:
+                await sess.get_batched(LEAVES, max_paths=50)
+            return ok, exc.value
+
+    ok, err = asyncio.run(_run())
+    assert _values(ok) == LEAVES[100:]
+    assert len(err.errors) == 1
+    assert _values(err.response) == LEAVES[50:]
+
+
+def _ops(request):
+    return ([str(Path_(p)) for p in request.delete],
+            [str(Path_(u.path)) for u in request.replace],
+            [str(Path_(u.path)) for u in request.update])
+
+
+def test_set_batcher_coalesces(gnmi_server):
+    sess = Session(Target.from_url(gnmi_server.target), insecure=True)
+
+    with SetBatcher(sess) as batcher:
+        first = batcher.update("/a/leaf", 1)
+        second = batcher.update("/a/leaf", 2)
+        merged = [batcher.update("/b", {"x": 1}), batcher.update("/b", {"y": 2})]
+        child = batcher.update("/c/d/leaf", "x")
+        replaced = batcher.replace("/c", {"d": {}})
+        assert batcher.pending == 4
+
+    requests = gnmi_server.servicer.requests
+    assert len(requests) == 1
+    assert _ops(requests[0]) == ([], ["/c"], ["/a/leaf", "/b", "/b"])
+    assert requests[0].update[0].val.int_val == 2
+
+    assert batcher.superseded == 2
+    assert first.result() is second.result()
+    assert child.result() is replaced.result()
+    assert all(f.done() for f in merged)
+
+
+def test_set_batcher_preserves_order(gnmi_server):
+    sess = Session(Target.from_url(gnmi_server.target), insecure=True)
+
+    with SetBatcher(sess) as batcher:
+        batcher.update("/a", {"x": 1})
+        # would be applied before the update above, needs a new request
+        batcher.replace("/a/x", 2)
+        batcher.update("/b/leaf", 1)
+        # supersedes the pending update instead of being reordered
+        batcher.delete("/b")
+
+    requests = gnmi_server.servicer.requests
+    assert [_ops(r) for r in requests] == [
+        ([], [], ["/a"]),
+        (["/b"], ["/a/x"], []),
+    ]
+
+
+def test_set_batcher_limits(gnmi_server):
+    sess = Session(Target.from_url(gnmi_server.target), insecure=True)
+
+    batcher = SetBatcher(sess, max_ops=100, max_bytes=4096)
+    futures = [batcher.update("/leaf[id=%d]/value" % i, i) for i in range(1000)]
+    # full batches are sent as they close
+    assert gnmi_server.servicer.requests
+    batcher.flush()
+
+    requests = gnmi_server.servicer.requests
+    assert sum(len(r.update) for r in requests) == 1000
+    assert all(len(r.update) <= 100 for r in requests)
+    assert all(sum(u.ByteSize() for u in r.update) <= 4096 for r in requests)
+    assert all(f.done() for f in futures)
+    assert batcher.pending == 0
+
+
+def test_set_batcher_errors(gnmi_server):
+    gnmi_server.servicer.fail_code = grpc.StatusCode.INVALID_ARGUMENT
+    sess = Session(Target.from_url(gnmi_server.target), insecure=True)
+
+    with SetBatcher(sess) as batcher:
+        superseded = batcher.update("/a", 1)
+        future = batcher.delete("/a")
+
+    assert isinstance(future.exception(), GrpcError)
+    assert isinstance(superseded.exception(), GrpcError)
+
+
+def test_set_batcher_unexpected_errors(gnmi_server):
+    sess = Session(Target.from_url(gnmi_server.target), insecure=True)
+    batcher = SetBatcher(sess)
+    futures = [batcher.update("/a", 1), batcher.update("/b", 2)]
+
+    # the stub raises ValueError once its channel is closed
+    sess._stub
+    sess._channel.close()
+    batcher.flush()
+
+    assert all(isinstance(f.exception(timeout=1), ValueError) for f in futures)
+    assert batcher.requests == 1
@@ -0,0 +1,166 @@
+import threading
+
+import pytest
+
+import gnmi.proto.gnmi_pb2 as pb
+from gnmi.cache import StateCache
+from gnmi.messages import Notification_, Path_, SubscribeResponse_
+from gnmi.path import PathKey
+
+
+def _response(timestamp=1, prefix="", updates=(), deletes=()):
+    return SubscribeResponse_(pb.SubscribeResponse(update=pb.Notification(
+        timestamp=timestamp,
+        prefix=Path_.from_string(prefix).raw,
+        update=[pb.Update(path=Path_.from_string(p).raw,
+                          val=pb.TypedValue(**v)) for p, v in updates],
+        delete=[Path_.from_string(p).raw for p in deletes])))
+
+
+SYNC = SubscribeResponse_(pb.SubscribeResponse(sync_response=True))
+
+
+def _interfaces(cache):
+    for name in ("Et1", "Et2", "Et3/1"):
+        base = "/interfaces/interface[name=%s]" % name
+        cache.update(base + "/state/oper-status", "UP", 1)
+        cache.update(base + "/state/counters/in-octets", 10, 1)
+        cache.update(base + "/state/counters/out-octets", 20, 1)
+    cache.update("/system/state/hostname", "veos1", 1)
+
+
+def test_get():
+    cache = StateCache()
+    _interfaces(cache)
+
+    leaf = cache.get("/interfaces/interface[name=Et3/1]/state/oper-status")
+    assert leaf.value == "UP" and leaf.timestamp == 1
+    assert cache.get("/interfaces/interface[name=Et4]/state/oper-status") is None
+    assert "/system/state/hostname" in cache
+    assert "/system/state" not in cache
+    assert len(cache) == 10
+
+
+def test_query_wildcards():
+    cache = StateCache()
+    _interfaces(cache)
+
+    def paths(pattern):
+        return sorted(str(leaf.path) for leaf in cache.query(pattern))
+
+    counters = paths("/interfaces/interface[name=*]/state/counters")
+    assert len(counters) == 6
+    assert counters[0] == "/interfaces/interface[name=Et1]/state/counters/in-octets"
+
+    assert paths("/interfaces/interface/state/oper-status") == paths(
+        "/interfaces/interface[name=*]/state/oper-status")
+    assert paths("/interfaces/interface[name=Et2]/*/oper-status") == [
+        "/interfaces/interface[name=Et2]/state/oper-status"]
+    assert len(paths(".../in-octets")) == 3
+    assert len(paths("/*/.../state")) == 10
+    assert paths("/interfaces/interface[name=Et9]") == []
+    assert len(cache.items()) == 10
+
+
+def test_delete_subtree():
+    cache = StateCache()
+    _interfaces(cache)
+
+    assert cache.delete("/interfaces/interface[name=Et1]") == 3
+    assert len(cache) == 7
+    assert cache.query("/interfaces/interface[name=Et1]") == []
+
+    assert cache.delete("/interfaces/interface[name=*]/state/counters") == 4
+    assert len(cache) == 3
+
+    cache.delete("/interfaces")
+    cache.delete("/system")
+    assert len(cache) == 0
+    # empty branches are not kept around
+    assert cache._roots == {}
+
+
+def test_delete_list_without_keys():
+    cache = StateCache()
+    _interfaces(cache)
+
+    assert cache.delete("/interfaces/interface/state/counters") == 6
+    assert cache.query("/interfaces/interface/state/counters") == []
+    assert cache.delete("/interfaces/interface") == 3
+    assert len(cache) == 1
+
+    _interfaces(cache)
+    cache.apply(_response(2, "/interfaces", deletes=["/interface"]))
+    assert cache.query("/interfaces") == []
+    assert [str(l.path) for l in cache.items()] == ["/system/state/hostname"]
+    assert list(cache._roots[""].children) == ["system"]
+
+
+def test_apply_notifications():
+    cache = StateCache()
+    cache.apply(_response(1, "/interfaces/interface[name=Et1]", updates=[
+        ("/state/oper-status", {"string_val": "UP"}),
+        ("/state/counters/in-octets", {"uint_val": 5}),
+    ]))
+    assert not cache.synced
+
+    cache.apply(SYNC)
+    assert cache.synced and cache.wait_synced(0)
+
+    cache.apply(_response(2, "/interfaces", updates=[
+        ("/interface[name=Et1]/state/oper-status", {"string_val": "DOWN"})],
+        deletes=["/interface[name=Et1]/state/counters"]))
+
+    leaf = cache.get(PathKey.from_string(
+        "/interfaces/interface[name=Et1]/state/oper-status"))
+    assert (leaf.value, leaf.timestamp) == ("DOWN", 2)
+    assert len(cache) == 1
+
+
+def test_resync_prunes_stale_leaves():
+    cache = StateCache()
+    cache.consume([
+        _response(1, updates=[("/a/b", {"int_val": 1}), ("/a/c", {"int_val": 2}),
+                              ("/a", {"json_val": b"{}"})]),
+        SYNC,
+    ])
+    assert len(cache) == 3
+
+    cache.resync()
+    assert not cache.synced
+    cache.consume([_response(2, updates=[("/a/b", {"int_val": 3})]), SYNC])
+
+    assert [(str(l.path), l.value) for l in cache.items()] == [("/a/b", 3)]
+    assert cache.synced
+
+
+def test_origins():
+    cache = StateCache()
+    cache.update("openconfig:/a", 1)
+    cache.update("cli:/a", 2)
+
+    assert cache.get("openconfig:/a").value == 1
+    assert len(cache.query("/a")) == 2
+    assert len(cache.query("cli:/a")) == 1
+
+
+def test_concurrent_reads():
+    cache = StateCache()
+    stop = threading.Event()
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            cache.update("/a/b[k=%d]/c" % (i % 50), i)
+            cache.delete("/a/b[k=%d]" % ((i + 25) % 50))
+            i += 1
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        for _ in range(200):
+            for leaf in cache.query("/a/b[k=*]/c"):
+                assert leaf.value is not None
+    finally:
+        stop.set()
+        thread.join()
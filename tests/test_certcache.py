@@ -0,0 +1,125 @@
+import json
+import os
+import socket
+
+import pytest
+
+from gnmi import certcache
+from gnmi.certcache import CertificateCache, fingerprint
+from gnmi.exceptions import GnmiCertificateError
+from gnmi.session import Session
+from gnmi.target import Target
+from tests.server import read_cert
+
+PEM = read_cert("server.crt")
+
+
+@pytest.fixture()
+def fetches(monkeypatch):
+    calls = []
+
+    def _fetch(target):
+        calls.append(str(target))
+        return PEM
+
+    monkeypatch.setattr(certcache, "fetch_server_certificate", _fetch)
+    return calls
+
+
+def test_cache_shared_on_disk(tmp_path, fetches):
+    target = Target.from_url("sw1:6030")
+
+    assert CertificateCache(tmp_path).get(target) == PEM
+    # another process reads the same directory
+    assert CertificateCache(tmp_path).get(target) == PEM
+    assert fetches == ["sw1:6030"]
+
+    entry = json.loads((tmp_path / "sw1_6030.json").read_text())
+    assert entry["fingerprint"] == fingerprint(PEM)
+
+
+def test_cache_expiry_and_integrity(tmp_path, fetches):
+    target = Target.from_url("sw1:6030")
+    cache = CertificateCache(tmp_path, max_age=0)
+    cache.get(target)
+    cache.get(target)
+    assert len(fetches) == 2
+
+    # tamper with the cached fingerprint to simulate a changed certificate
+    fil = tmp_path / "sw1_6030.json"
+    entry = json.loads(fil.read_text())
+    entry["fingerprint"] = "0" * 64
+    fil.write_text(json.dumps(entry))
+
+    # corrupt entries are ignored
+    assert CertificateCache(tmp_path).lookup(target) is None
+
+
+def test_cache_changed_certificate(tmp_path, fetches, monkeypatch):
+    target = Target.from_url("sw1:6030")
+    other = read_cert("other.crt")
+    CertificateCache(tmp_path).get(target)
+
+    monkeypatch.setattr(certcache, "fetch_server_certificate",
+                        lambda t: other)
+
+    with pytest.raises(GnmiCertificateError):
+        CertificateCache(tmp_path, max_age=0, pin=True).get(target)
+    assert CertificateCache(tmp_path).lookup(target) == PEM
+
+    with pytest.warns(RuntimeWarning):
+        assert CertificateCache(tmp_path, max_age=0, pin=False).get(target) == other
+    assert CertificateCache(tmp_path).lookup(target) == other
+
+
+def test_reconnect_expires_certificate(tmp_path, fetches, monkeypatch):
+    target = Target.from_url("sw1:6030")
+    cache = CertificateCache(tmp_path)
+    sess = Session(target, cert_cache=cache)
+
+    cache.get(target)
+    sess.reconnect()
+    assert cache.lookup(target) == PEM
+    cache.get(target)
+    assert len(fetches) == 2
+
+    # a rotated certificate is reported instead of being retried for a day
+    monkeypatch.setattr(certcache, "fetch_server_certificate",
+                        lambda t: read_cert("other.crt"))
+    sess.reconnect()
+    with pytest.raises(GnmiCertificateError):
+        cache.get(target)
+
+    # sessions with a CA do not use the cache
+    Session(target, cert_cache=cache,
+            certificates={"root_certificates": PEM}).reconnect()
+
+
+def test_remove(tmp_path, fetches):
+    target = Target.from_url("sw1:6030")
+    cache = CertificateCache(tmp_path)
+    cache.get(target)
+    cache.remove(target)
+    assert cache.lookup(target) is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_session_tofu(gnmi_tls_server, tmp_path):
+    target = Target.from_url(gnmi_tls_server.target)
+    cache = CertificateCache(tmp_path)
+
+    for _ in range(2):
+        with Session(target, cert_cache=cache) as sess:
+            assert sess.capabilities().gnmi_version == "0.10.0"
+
+    assert cache.lookup(target) == PEM
+
+
+def test_fetch_timeout():
+    # accepts connections but never answers the TLS handshake
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        target = Target.from_url("127.0.0.1:%d" % server.getsockname()[1])
+        with pytest.raises(OSError):
+            certcache.fetch_server_certificate(target, timeout=0.2)
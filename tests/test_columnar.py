@@ -0,0 +1,130 @@
+import pytest
+
+import gnmi.proto.gnmi_pb2 as pb
+from gnmi import columnar
+from gnmi.columnar import ColumnarBatcher
+from gnmi.messages import GetResponse_, Notification_, Path_, SubscribeResponse_
+
+BACKENDS = [
+    pytest.param("numpy", marks=pytest.mark.skipif(
+        not columnar.NUMPY_SUPPORTED, reason="numpy not installed")),
+    pytest.param("arrow", marks=pytest.mark.skipif(
+        not columnar.ARROW_SUPPORTED, reason="pyarrow not installed")),
+]
+
+
+def _update(path, **val):
+    return pb.Update(path=Path_.from_string(path).raw, val=pb.TypedValue(**val))
+
+
+def _notification(timestamp=1, target=""):
+    return Notification_(pb.Notification(
+        timestamp=timestamp,
+        prefix=pb.Path(target=target, elem=[pb.PathElem(name="sys")]),
+        update=[
+            _update("/a", int_val=-1),
+            _update("/b", uint_val=2**64 - 1),
+            _update("/c", decimal_val=pb.Decimal64(digits=125, precision=2)),
+            _update("/d", string_val="up"),
+            _update("/e", json_ietf_val=b'{"x": 1}'),
+            _update("/f", bytes_val=b"\x00"),
+            _update("/g", bool_val=True),
+        ],
+        delete=[Path_.from_string("/h").raw]))
+
+
+def _rows(batch):
+    if isinstance(batch, columnar.ColumnarBatch):
+        return [(batch.path(i), batch.value(i)) for i in range(len(batch))]
+    table = {name: batch.column(name).to_pylist()
+             for name in batch.schema.names if name != "timestamp"}
+    rows = []
+    for i, kind in enumerate(table["kind"]):
+        value = None
+        for name, _, _, kinds in columnar._COLUMNS:
+            if kind in kinds:
+                value = table[name][i]
+        rows.append((table["path"][i], value))
+    return rows
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_batch_columns(backend):
+    batcher = ColumnarBatcher(backend=backend, target="veos1")
+    assert batcher.add(_notification(timestamp=5)) is None
+    batch = batcher.flush()
+
+    assert _rows(batch) == [
+        ("/sys/a", -1), ("/sys/b", 2**64 - 1), ("/sys/c", 1.25),
+        ("/sys/d", "up"), ("/sys/e", '{"x": 1}'), ("/sys/f", b"\x00"),
+        ("/sys/g", True), ("/sys/h", None),
+    ]
+    kinds = batch["kind"]
+    kinds = kinds.tolist() if backend == "numpy" else kinds.to_pylist()
+    assert kinds == [
+        columnar.INT, columnar.UINT, columnar.FLOAT, columnar.STRING,
+        columnar.JSON, columnar.BYTES, columnar.BOOL, columnar.NULL]
+    assert batcher.flush() is None
+
+    if backend == "numpy":
+        assert batch["timestamp"].tolist() == [5] * 8
+        assert set(batch["target"]) == {"veos1"}
+    else:
+        assert set(batch.column("target").to_pylist()) == {"veos1"}
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_batch_size_and_path_ids(backend):
+    batcher = ColumnarBatcher(batch_size=10, backend=backend)
+
+    batches = list(batcher.feed(
+        [_notification(timestamp=i, target="t%d" % i) for i in range(3)]))
+
+    # a notification is never split across batches
+    assert [b.num_rows for b in batches] == [16, 8]
+    # each batch only carries its own paths
+    assert batcher.paths == [] and batcher._path_ids == {}
+    if backend == "numpy":
+        assert len(batches[0].paths) == 8
+        assert batches[1]["path_id"].tolist()[:2] == [0, 1]
+        assert batches[1]["target"].tolist() == ["t2"] * 8
+    else:
+        assert len(batches[0].column("path").dictionary) == 8
+
+
+def test_flush_interval():
+    batcher = ColumnarBatcher(flush_interval=0, backend="auto")
+
+    assert batcher.add(_notification()) is not None
+    assert len(batcher) == 0
+
+
+def test_flush_expired():
+    batcher = ColumnarBatcher(flush_interval=3600, backend="auto")
+    assert batcher.flush_expired() is None
+
+    assert batcher.add(_notification()) is None
+    assert batcher.flush_expired() is None
+
+    batcher.flush_interval = 0
+    assert batcher.flush_expired().num_rows == 8
+    assert batcher.flush_expired() is None
+
+
+def test_feed_responses():
+    notif = _notification().raw
+    responses = [
+        SubscribeResponse_(pb.SubscribeResponse(update=notif)),
+        SubscribeResponse_(pb.SubscribeResponse(sync_response=True)),
+        GetResponse_(pb.GetResponse(notification=[notif, notif])),
+    ]
+
+    batches = list(ColumnarBatcher().feed(responses))
+    assert sum(b.num_rows for b in batches) == 24
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError):
+        ColumnarBatcher(backend="polars")
+    with pytest.raises(ValueError):
+        ColumnarBatcher(batch_size=0)
@@ -0,0 +1,127 @@
+import pytest
+
+import gnmi.proto.gnmi_pb2 as pb
+from gnmi.dedup import Deduplicator
+from gnmi.messages import Notification_, Path_, SubscribeResponse_
+
+
+def _response(timestamp=1, prefix="", updates=(), deletes=()):
+    return SubscribeResponse_(pb.SubscribeResponse(update=pb.Notification(
+        timestamp=timestamp,
+        prefix=Path_.from_string(prefix).raw,
+        update=[pb.Update(path=Path_.from_string(p).raw,
+                          val=pb.TypedValue(**v)) for p, v in updates],
+        delete=[Path_.from_string(p).raw for p in deletes])))
+
+
+SYNC = SubscribeResponse_(pb.SubscribeResponse(sync_response=True))
+
+PREFIX = "/interfaces/interface[name=Et1]/state"
+
+
+def _sample(timestamp, in_octets, status="UP"):
+    return _response(timestamp, PREFIX, updates=[
+        ("counters/in-octets", {"uint_val": in_octets}),
+        ("oper-status", {"string_val": status}),
+    ])
+
+
+def test_suppress_unchanged():
+    dedup = Deduplicator()
+    first = _sample(1, 10)
+    out = list(dedup.filter([first, SYNC, _sample(2, 10), _sample(3, 11)]))
+
+    # unchanged responses are passed as is, sync responses are kept
+    assert out[0] is first
+    assert out[1] is SYNC
+    assert len(out) == 3
+    assert out[2].update.timestamp == 3
+    assert [str(u.path) for u in out[2].update.update] == ["/counters/in-octets"]
+    assert str(out[2].update.prefix) == PREFIX
+    assert (dedup.passed, dedup.suppressed) == (3, 3)
+
+
+def test_same_path_split_differently():
+    dedup = Deduplicator()
+    assert dedup.apply(_sample(1, 10).update) is not None
+    moved = _response(2, "/interfaces", updates=[
+        ("interface[name=Et1]/state/counters/in-octets", {"uint_val": 10})])
+    assert dedup.apply(moved.update) is None
+    assert len(dedup) == 2
+
+
+def test_heartbeat():
+    dedup = Deduplicator(heartbeat=10)
+    out = list(dedup.filter([_sample(t, 10) for t in (0, 5, 10, 15, 21)]))
+    assert [r.update.timestamp for r in out] == [0, 10, 21]
+
+
+def test_deletes_forget_paths():
+    dedup = Deduplicator()
+    out = list(dedup.filter([
+        _sample(1, 10),
+        _response(2, deletes=["/interfaces/interface[name=Et1]"]),
+        _sample(3, 10),
+    ]))
+    assert len(out) == 3
+    assert len(out[2].raw.update.update) == 2
+
+
+def test_unrelated_delete_keeps_paths():
+    dedup = Deduplicator()
+    other = _response(1, "/interfaces/interface[name=Et2]/state", updates=[
+        ("oper-status", {"string_val": "UP"})])
+    out = list(dedup.filter([
+        _sample(1, 10),
+        other,
+        _response(2, "/interfaces", deletes=["/interface[name=Et2]"]),
+        _sample(3, 10),
+        other,
+    ]))
+
+    # Et1 is unchanged, only the deleted Et2 is passed again
+    assert len(out) == 4
+    assert out[3] is other
+    assert len(dedup) == 3
+
+
+def test_delete_matching():
+    dedup = Deduplicator()
+    dedup.apply(_sample(1, 10).update)
+
+    # a single leaf
+    dedup.apply(_response(2, deletes=[PREFIX + "/oper-status"]).update)
+    assert len(dedup) == 1
+    assert len(dedup.apply(_sample(3, 10).update).raw.update) == 1
+
+    # list elements without keys match every entry
+    dedup.apply(_response(4, deletes=["/interfaces/interface/state"]).update)
+    assert len(dedup) == 0 and dedup._groups == {}
+
+    dedup.apply(_sample(5, 10).update)
+    dedup.apply(_response(6, deletes=["/"]).update)
+    assert len(dedup) == 0
+
+
+def test_bounded():
+    dedup = Deduplicator(max_paths=2)
+    notifications = [_response(1, updates=[("/a", {"int_val": 1})]).update,
+                     _response(1, updates=[("/b", {"int_val": 1})]).update,
+                     _response(1, updates=[("/c", {"int_val": 1})]).update]
+    for n in notifications:
+        dedup.apply(n)
+    assert len(dedup) == 2 and dedup.evicted == 1
+    assert len(dedup._parents) == 2
+
+    # /a was forgotten, /c is still known
+    assert dedup.apply(notifications[0]) is notifications[0]
+    assert dedup.apply(notifications[2]) is None
+
+    with pytest.raises(ValueError):
+        Deduplicator(max_paths=0)
+
+
+def test_notifications():
+    dedup = Deduplicator()
+    notification = Notification_(_sample(1, 10).raw.update)
+    assert list(dedup.filter([notification, notification])) == [notification]
@@ -0,0 +1,124 @@
+import json
+
+import pytest
+
+import gnmi.proto.gnmi_pb2 as pb
+from gnmi import values
+from gnmi.entry import write_notification
+from gnmi.flatten import flatten
+from gnmi.messages import Notification_, Path_, Update_
+
+INTERFACES = {
+    "openconfig-interfaces:interface": [
+        {
+            "name": "Ethernet1/1",
+            "config": {"name": "Ethernet1/1", "mtu": 9214},
+            "state": {"oper-status": "UP", "counters": {"in-octets": 10}},
+            "subinterfaces": {"subinterface": [
+                {"index": 0, "state": {"enabled": True}}
+            ]},
+        },
+        {"name": "Ethernet2", "config": {"mtu": 1500}},
+    ]
+}
+
+
+def _notification(value, prefix="/interfaces", path=""):
+    return Notification_(pb.Notification(
+        prefix=Path_.from_string(prefix).raw,
+        update=[pb.Update(path=Path_.from_string(path).raw,
+                          val=pb.TypedValue(json_ietf_val=json.dumps(value).encode()))]))
+
+
+def test_flatten_lists():
+    leaves = dict(flatten(INTERFACES, "/interfaces"))
+
+    base = r"/interfaces/openconfig-interfaces:interface[name=Ethernet1/1]"
+    assert leaves[base + "/config/mtu"] == 9214
+    assert leaves[base + "/state/counters/in-octets"] == 10
+    assert leaves[base + "/subinterfaces/subinterface[index=0]/state/enabled"] is True
+    assert leaves["/interfaces/openconfig-interfaces:interface[name=Ethernet2]"
+                  "/config/mtu"] == 1500
+
+
+def test_flatten_list_keys():
+    value = [{"name": "a", "seq": 10, "action": "permit"}]
+
+    assert list(flatten(value, "/acl/entry", {"entry": ["seq"]})) == [
+        ("/acl/entry[seq=10]/name", "a"),
+        ("/acl/entry[seq=10]/seq", 10),
+        ("/acl/entry[seq=10]/action", "permit"),
+    ]
+
+
+def test_flatten_unknown_list():
+    # not an OpenConfig list, keys cannot be told from counters and entries
+    # without keys would share their paths
+    value = {"peer": [{"address": "10.0.0.1", "received": 10},
+                      {"address": "10.0.0.2", "received": 10}]}
+
+    with pytest.raises(ValueError, match="peer"):
+        list(flatten(value, "/bgp"))
+
+    leaves = list(flatten(value, "/bgp", {"peer": ["address"]}))
+    assert len({path for path, _ in leaves}) == 4
+    assert leaves[1] == ("/bgp/peer[address=10.0.0.1]/received", 10)
+
+
+def test_flatten_leaflist_and_scalar():
+    assert list(flatten({"servers": ["a", "b"], "empty": []}, "/dns")) == [
+        ("/dns/servers", ["a", "b"]),
+        ("/dns/empty", []),
+    ]
+    assert list(flatten(5, "/a")) == [("/a", 5)]
+
+
+def test_notification_flatten():
+    notif = _notification(INTERFACES)
+    leaves = dict(notif.flatten({"interface": ["name"]}))
+    tuples = dict(notif.flatten(as_tuple=True))
+
+    assert leaves["/interfaces/openconfig-interfaces:interface[name=Ethernet1/1]"
+                  "/state/oper-status"] == "UP"
+    assert len(leaves) == len(tuples)
+    assert (("interfaces", ()),
+            ("openconfig-interfaces:interface", (("name", "Ethernet2"),)),
+            ("config", ()), ("mtu", ())) in tuples
+
+
+def test_notification_flatten_list_path():
+    notif = _notification([{"name": "Et1", "mtu": 1}], "/interfaces", "/interface")
+
+    assert list(notif.flatten({"interface": ["name"]})) == [
+        ("/interfaces/interface[name=Et1]/name", "Et1"),
+        ("/interfaces/interface[name=Et1]/mtu", 1),
+    ]
+
+
+def test_update_flatten_lazy():
+    values.set_json_backend(lazy=True)
+    try:
+        upd = Update_(pb.Update(path=Path_.from_string("/a").raw,
+                                val=pb.TypedValue(json_val=b'{"b": {"c": 1}}')))
+        assert list(upd.flatten()) == [("/a/b/c", 1)]
+    finally:
+        values.set_json_backend()
+
+
+def test_write_notification_flatten_unknown_list(capsys):
+    write_notification(_notification([{"id": 1}, {"id": 2}], path="/peers/peer"),
+                       flatten=True)
+
+    captured = capsys.readouterr()
+    out = json.loads(captured.out)
+    assert out["updates"] == [{"path": "/peers/peer",
+                               "value": [{"id": 1}, {"id": 2}]}]
+    assert "list_keys" in captured.err
+
+
+def test_write_notification_flatten(capsys):
+    write_notification(_notification({"mtu": 1500}, path="/interface[name=Et1]"),
+                       flatten=True)
+
+    out = json.loads(capsys.readouterr().out)
+    assert out["updates"] == [{"path": "/interface[name=Et1]/mtu", "value": 1500}]
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import gnmi
+from gnmi.session import Session
+from gnmi.target import Target
+
+
+def _modules_after(statement):
+    code = "import sys\n%s\nprint(' '.join(sys.modules))" % statement
+    out = subprocess.run([sys.executable, "-c", code], check=True,
+                         capture_output=True, text=True).stdout
+    return set(out.split())
+
+
+def test_import_is_light():
+    modules = _modules_after("import gnmi")
+    assert "grpc" not in modules
+    assert "gnmi.proto.gnmi_pb2" not in modules
+    assert "yaml" not in modules
+
+
+def test_version_is_light():
+    modules = _modules_after(
+        "sys.argv = ['gnmipy', '--version']\n"
+        "from gnmi.entry import main\n"
+        "try:\n    main()\nexcept SystemExit:\n    pass")
+    assert "grpc" not in modules
+    assert "gnmi.session" not in modules
+
+
+def test_entry_import_is_light():
+    modules = _modules_after("import gnmi.entry")
+    assert "importlib.metadata" not in modules
+    assert "grpc" not in modules
+
+
+def test_lazy_attributes():
+    from gnmi.api import get
+
+    assert gnmi.get is get
+    assert gnmi.Session is Session
+    assert "subscribe" in dir(gnmi)
+
+
+def test_lazy_channel():
+    # nothing listens here, creating the session must not connect or fetch
+    # a certificate
+    sess = Session(Target.from_url("localhost:1"))
+    assert sess._channel is None
+    sess.close()
@@ -5,7 +5,8 @@ import json
 import gnmi.proto.gnmi_pb2 as pb
 from google.protobuf import any_pb2
 from gnmi.util import escape_string
-from gnmi.messages import Path_, Update_
+from gnmi import messages
+from gnmi.messages import Notification_, Path_, Update_
 
 @pytest.fixture()
 def gnmi_path():
@@ -112,4 +113,81 @@ def test_gnmi_path():
 def test_gnmi_update_fromkeyval():
     upd = Update_.from_keyval(("/path/to/val", "hello"))
 
-    assert isinstance(upd, Update_)
\ No newline at end of file
+    assert isinstance(upd, Update_)
+
+def test_iter_leaves(gnmi_notification):
+    notif = Notification_(gnmi_notification)
+    expected = [(str(u.path), u.get_value()) for u in notif.update]
+
+    assert list(notif.iter_leaves()) == expected
+
+
+def test_iter_leaves_prefix():
+    notif = Notification_(pb.Notification(
+        prefix=Path_.from_string("openconfig:/interfaces/interface[name=Ethernet1]").raw,
+        update=[
+            Update_.from_keyval(("/state/counters/in-octets", 10)).raw,
+            Update_.from_keyval(("/state/name", "Ethernet1")).raw,
+        ]
+    ))
+
+    assert list(notif.iter_leaves()) == [
+        ("openconfig:/interfaces/interface[name=Ethernet1]/state/counters/in-octets", 10),
+        ("openconfig:/interfaces/interface[name=Ethernet1]/state/name", "Ethernet1"),
+    ]
+    assert list(notif.iter_leaves(as_tuple=True))[0] == (
+        (("interfaces", ()), ("interface", (("name", "Ethernet1"),)),
+         ("state", ()), ("counters", ()), ("in-octets", ())),
+        10
+    )
+
+
+def test_slots(gnmi_notification):
+    notif = Notification_(gnmi_notification)
+    upd = next(notif.update)
+
+    for obj in (notif, notif.prefix, upd, upd.path, upd.val):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_memoized(gnmi_update):
+    upd = Update_(gnmi_update)
+
+    assert upd.path is upd.path
+    assert upd.val is upd.val
+    assert upd.path.to_string() is upd.path.to_string()
+    assert upd.get_value() is upd.get_value()
+
+
+@pytest.fixture()
+def path_cache():
+    messages.set_path_cache_size(8)
+    yield
+    messages.set_path_cache_size()
+
+
+def test_path_cache(path_cache):
+    first = Path_.from_string("/interfaces/interface[name=Ethernet1]/state")
+    second = Path_.from_string("/interfaces/interface[name=Ethernet1]/state")
+
+    assert first.raw == second.raw
+    assert first.raw is not second.raw
+    # cached messages are copied, changing one does not leak into the cache
+    first.raw.origin = "openconfig"
+    assert Path_.from_string(
+        "/interfaces/interface[name=Ethernet1]/state").raw.origin == ""
+
+    assert str(second) == str(Path_(second.raw))
+
+    info = messages.path_cache_info()
+    assert (info["parse"].hits, info["parse"].misses) == (2, 1)
+    assert (info["render"].hits, info["render"].misses) == (1, 1)
+
+
+def test_path_cache_disabled():
+    messages.set_path_cache_size(0)
+    try:
+        assert str(Path_.from_string("/a/b[k=v]")) == "/a/b[k=v]"
+        assert messages.path_cache_info() == {"parse": None, "render": None}
+    finally:
+        messages.set_path_cache_size()
@@ -0,0 +1,91 @@
+import pickle
+
+import pytest
+
+import gnmi.proto.gnmi_pb2 as pb
+from gnmi.messages import Notification_, Path_
+from gnmi.path import PathKey
+
+
+def test_canonical_keys():
+    a = PathKey([("acl-set", {"type": "ipv4", "name": "permit"})])
+    b = PathKey.from_string("/acl-set[name=permit][type=ipv4]")
+
+    assert a == b
+    assert hash(a) == hash(b)
+    assert a.elems == (("acl-set", (("name", "permit"), ("type", "ipv4"))),)
+    assert {a: 1}[b] == 1
+
+
+def test_origin():
+    assert PathKey.from_string("openconfig:/a") != PathKey.from_string("/a")
+    assert PathKey.from_string("openconfig:/a").origin == "openconfig"
+
+
+def test_concat():
+    prefix = PathKey.from_string("oc:/interfaces/interface[name=Et1/1]")
+    key = prefix + PathKey.from_string("/state/oper-status")
+
+    assert str(key) == "oc:/interfaces/interface[name=Et1/1]/state/oper-status"
+    assert key.startswith(prefix)
+    assert not prefix.startswith(key)
+    assert key[:2] == prefix
+    assert key[-1] == ("oper-status", ())
+    assert len(key) == 4
+
+
+def test_immutable():
+    key = PathKey.from_string("/a/b")
+
+    with pytest.raises(AttributeError):
+        key.foo = 1
+    with pytest.raises(AttributeError):
+        key._elems = ()
+
+
+def test_pb_conversion():
+    path = Path_.from_string(r"cli:/a\/b/c[k=v\]w]").raw
+    key = PathKey.from_pb(path)
+
+    assert key.to_pb() == path
+    assert str(key) == str(Path_(path))
+    assert PathKey.from_string(str(key)) == key
+    assert pickle.loads(pickle.dumps(key)) == key
+
+
+def test_path_wrapper_hashable():
+    a = Path_.from_string("/a[x=1][y=2]")
+    b = Path_(pb.Path(elem=[pb.PathElem(name="a", key={"y": "2", "x": "1"})]))
+
+    assert a == b
+    assert len({a, b}) == 1
+    assert a.key is a.key
+
+
+def test_iter_leaves_tuples():
+    notif = Notification_(pb.Notification(
+        prefix=Path_.from_string("/a[k=v]").raw,
+        update=[pb.Update(path=Path_.from_string("/b").raw,
+                          val=pb.TypedValue(int_val=1))]))
+
+    (elems, value), = notif.iter_leaves(as_tuple=True)
+    assert PathKey(elems) == PathKey.from_string("/a[k=v]/b")
+
+
+@pytest.mark.parametrize("pattern,path,expected", [
+    ("/a/b[k=*]/c", "/a/b[k=1]/c", True),
+    ("/a/b/c", "/a/b[k=1]/c", True),
+    ("/a/b[k=2]/c", "/a/b[k=1]/c", False),
+    ("/a/b[x=*]", "/a/b[k=1]", False),
+    ("/a/*", "/a/b[k=1]", True),
+    ("/a/*", "/a/b/c", False),
+    ("/a/...", "/a/b/c", True),
+    ("/.../c", "/c", True),
+    ("oc:/a", "/a", False),
+    ("/a", "oc:/a", True),
+])
+def test_matches(pattern, path, expected):
+    pattern = PathKey.from_string(pattern)
+
+    assert pattern.wildcard or "*" not in str(pattern)
+    assert pattern.matches(PathKey.from_string(path)) is expected
@@ -0,0 +1,39 @@
+import pytest
+
+hypothesis = pytest.importorskip("hypothesis")
+
+from hypothesis import given, strategies as st
+
+import gnmi.proto.gnmi_pb2 as pb
+from gnmi import util
+from gnmi.messages import Path_
+
+_text = st.text(min_size=1)
+
+_elems = st.lists(st.builds(
+    lambda name, keys: pb.PathElem(name=name, key=keys),
+    _text, st.dictionaries(_text, st.text(), max_size=3)), max_size=6)
+
+_origins = st.one_of(st.just(""), st.from_regex(r"[\w\-]+", fullmatch=True))
+
+
+@given(_origins, _elems)
+def test_path_roundtrip(origin, elems):
+    path = pb.Path(origin=origin, elem=elems)
+    string = Path_(path).to_string()
+    parsed = Path_.from_string(string)
+
+    assert parsed.raw == path
+    assert parsed.to_string() == string
+
+
+@given(st.text(alphabet="ab/[]=", max_size=12))
+def test_plain_parser_matches_tokenizer(path):
+    # the str.find fast path must agree with the tokenizer, errors included
+    try:
+        expected = util._parse_escaped_path(path)
+    except ValueError:
+        with pytest.raises(ValueError):
+            util._parse_plain_path(path)
+    else:
+        assert util._parse_plain_path(path) == expected
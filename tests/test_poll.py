@@ -0,0 +1,71 @@
+import asyncio
+
+import grpc
+
+from gnmi.aio import AsyncSession, PollScheduler
+from gnmi.session import Session
+from gnmi.target import Target
+
+
+def test_poll_subscription(gnmi_server):
+    sess = Session(Target.from_url(gnmi_server.target), insecure=True)
+
+    with sess.poll(["/a", "/b"], {"mode": "stream"}) as sub:
+        rounds = [sub.poll() for _ in range(3)]
+
+    requests = gnmi_server.servicer.requests
+    assert requests[0].subscribe.mode == 2  # POLL
+    assert [r.WhichOneof("request") for r in requests] == \
+        ["subscribe", "poll", "poll"]
+    assert [len(r) for r in rounds] == [2, 2, 2]
+    assert str(rounds[2][1].update.__next__().path) == "/b"
+
+
+def test_async_poll_subscription(gnmi_server):
+    async def _run():
+        async with AsyncSession(Target.from_url(gnmi_server.target),
+                                insecure=True) as sess:
+            async with await sess.poll(["/a"]) as sub:
+                return [await sub.poll() for _ in range(4)]
+
+    rounds = asyncio.run(_run())
+    assert [len(r) for r in rounds] == [1, 1, 1, 1]
+    assert len(gnmi_server.servicer.requests) == 4
+
+
+def test_scheduler(gnmi_server):
+    target = Target.from_url(gnmi_server.target)
+    blocking = Session(target, insecure=True).poll(["/sync"])
+
+    async def _run():
+        async with AsyncSession(target, insecure=True) as sess:
+            scheduler = PollScheduler(interval=0.05, jitter=0.2, rounds=3)
+            for i in range(5):
+                scheduler.add("sw%d" % i, await sess.poll(["/a"]))
+            scheduler.add("blocking", blocking)
+            results = [item async for item in scheduler]
+        return scheduler, results
+
+    scheduler, results = asyncio.run(_run())
+    blocking.close()
+
+    assert not scheduler.errors
+    assert len(results) == 6 * 3
+    names = [name for name, _ in results]
+    assert all(names.count(n) == 3 for n in set(names))
+
+
+def test_scheduler_errors(gnmi_server):
+    gnmi_server.servicer.fail_code = grpc.StatusCode.UNAVAILABLE
+    target = Target.from_url(gnmi_server.target)
+
+    async def _run():
+        async with AsyncSession(target, insecure=True) as sess:
+            scheduler = PollScheduler(interval=0.01, rounds=2)
+            scheduler.add("bad", await sess.poll(["/a"]))
+            results = [item async for item in scheduler]
+        return scheduler, results
+
+    scheduler, results = asyncio.run(_run())
+    assert results == []
+    assert "bad" in scheduler.errors
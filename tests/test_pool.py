@@ -0,0 +1,122 @@
+import threading
+
+import gnmi
+from gnmi import pool as gnmi_pool
+from gnmi.pool import ChannelPool
+from gnmi.session import Session
+from gnmi.target import Target
+
+
+class _Channel(object):
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_acquire_shares_channel():
+    pool = ChannelPool()
+    created = []
+
+    def _factory():
+        created.append(_Channel())
+        return created[-1]
+
+    a = pool.acquire("t1", _factory)
+    b = pool.acquire("t1", _factory)
+    c = pool.acquire("t2", _factory)
+
+    assert a is b
+    assert a is not c
+    assert len(created) == 2
+    assert len(pool) == 2
+
+
+def test_slow_factory_does_not_block_other_keys():
+    pool = ChannelPool()
+    started, release = threading.Event(), threading.Event()
+    created = []
+
+    def _slow():
+        started.set()
+        release.wait(5)
+        created.append(_Channel())
+        return created[-1]
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(pool.acquire("slow", _slow)))
+               for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    assert started.wait(5)
+
+    # the pool lock is not held while "slow" is being created
+    other = pool.acquire("fast", _Channel)
+    assert "fast" in pool and "slow" not in pool
+
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert len(created) == 1
+    assert results == [created[0]] * 2
+    assert other is not created[0]
+    assert pool._connecting == {}
+
+
+def test_idle_eviction():
+    pool = ChannelPool(idle_timeout=0)
+    chan = pool.acquire("t1", _Channel)
+
+    # referenced channels are never evicted
+    assert pool.evict_idle() == 0
+    assert not chan.closed
+
+    pool.release("t1")
+    assert chan.closed
+    assert "t1" not in pool
+
+
+def test_close_and_discard():
+    pool = ChannelPool()
+    a = pool.acquire("t1", _Channel)
+    b = pool.acquire("t2", _Channel)
+
+    pool.discard("t1")
+    assert "t1" not in pool
+    # still referenced, closed on release
+    assert not a.closed
+    c = pool.acquire("t1", _Channel)
+    assert c is not a
+    pool.release("t1", a)
+    assert a.closed and not c.closed
+
+    pool.close()
+    assert b.closed
+    assert len(pool) == 0
+
+
+def test_session_pool(gnmi_server):
+    pool = ChannelPool()
+    target = Target.from_url(gnmi_server.target)
+
+    with Session(target, insecure=True, pool=pool) as one, \
+            Session(target, insecure=True, pool=pool) as two:
+        one.get(["/system"])
+        two.get(["/system"])
+        assert one._channel is two._channel
+
+    assert len(pool) == 1
+    pool.close()
+
+
+def test_api_reuses_channel(gnmi_server):
+    gnmi_pool.close()
+    for _ in range(5):
+        list(gnmi.get(gnmi_server.target, ["/system"], insecure=True))
+        gnmi.capabilites(gnmi_server.target, insecure=True)
+
+    assert len(gnmi_pool.default_pool) == 1
+    gnmi_pool.close()
+    assert len(gnmi_pool.default_pool) == 0
@@ -0,0 +1,122 @@
+import asyncio
+
+import grpc
+import pytest
+
+from gnmi.aio import AsyncSession, AsyncResilientSubscription
+from gnmi.exceptions import GrpcError
+from gnmi.resilient import Backoff, ResilientSubscription
+from gnmi.session import Session
+from gnmi.target import Target
+
+
+def _no_wait():
+    return Backoff(initial=0.001, maximum=0.01)
+
+
+def test_backoff():
+    backoff = Backoff(initial=1, maximum=8, multiplier=2, jitter=0)
+    assert [backoff.next() for _ in range(5)] == [1, 2, 4, 8, 8]
+    backoff.reset()
+    assert backoff.next() == 1
+
+    jittered = Backoff(initial=10, maximum=10, jitter=0.5)
+    delays = [jittered.next() for _ in range(100)]
+    assert all(5 <= d <= 10 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_resubscribe_marks_replayed(gnmi_server):
+    servicer = gnmi_server.servicer
+    servicer.stream_updates = 1
+    servicer.stream_failures = 2
+    servicer.sync_timestamp = 1000
+
+    sess = Session(Target.from_url(gnmi_server.target), insecure=True)
+    sub = ResilientSubscription(sess, ["/a", "/b"], backoff=_no_wait())
+    responses = list(sub)
+
+    assert sub.reconnects == 2
+    assert len(sub.errors) == 2
+    # three rounds of: 2 sync updates, sync_response, 2 streamed updates
+    assert len(responses) == 15
+    replayed = [r.replayed for r in responses if not r.sync_response]
+    assert replayed == [False] * 4 + [True, True, False, False] * 2
+    assert sub.last_timestamp == max(r.update.timestamp for r in responses
+                                     if not r.sync_response)
+
+
+def test_resume_updates_only(gnmi_server):
+    servicer = gnmi_server.servicer
+    servicer.stream_updates = 1
+    servicer.stream_failures = 1
+
+    sess = Session(Target.from_url(gnmi_server.target), insecure=True)
+    sub = ResilientSubscription(sess, ["/a"], backoff=_no_wait(),
+                                resume_updates_only=True)
+    responses = list(sub)
+
+    assert servicer.requests[-1].subscribe.updates_only
+    assert [r.sync_response for r in responses] == [False, True, False,
+                                                    True, False]
+
+
+def test_max_retries(gnmi_server):
+    gnmi_server.servicer.fail_code = grpc.StatusCode.UNAVAILABLE
+
+    sess = Session(Target.from_url(gnmi_server.target), insecure=True)
+    sub = ResilientSubscription(sess, ["/a"], backoff=_no_wait(),
+                                max_retries=2)
+
+    with pytest.raises(GrpcError):
+        list(sub)
+    assert sub.reconnects == 2
+    assert len(gnmi_server.servicer.requests) == 3
+
+
+def test_non_retryable(gnmi_server):
+    gnmi_server.servicer.fail_code = grpc.StatusCode.PERMISSION_DENIED
+
+    sess = Session(Target.from_url(gnmi_server.target), insecure=True)
+    with pytest.raises(GrpcError):
+        list(ResilientSubscription(sess, ["/a"], backoff=_no_wait()))
+    assert len(gnmi_server.servicer.requests) == 1
+
+
+def test_async_resubscribe(gnmi_server):
+    servicer = gnmi_server.servicer
+    servicer.stream_updates = 1
+    servicer.stream_failures = 1
+    servicer.sync_timestamp = 1000
+
+    async def _run():
+        async with AsyncSession(Target.from_url(gnmi_server.target),
+                                insecure=True) as sess:
+            sub = AsyncResilientSubscription(sess, ["/a"], backoff=_no_wait())
+            return sub, [r async for r in sub]
+
+    sub, responses = asyncio.run(_run())
+
+    assert sub.reconnects == 1
+    assert [r.replayed for r in responses if not r.sync_response] == \
+        [False, False, True, False]
+
+
+def test_fanout_backoff(gnmi_server):
+    from gnmi.aio import Fanout
+
+    gnmi_server.servicer.stream_updates = 1
+    gnmi_server.servicer.stream_failures = 3
+    gnmi_server.servicer.sync_timestamp = 1000
+
+    fanout = Fanout({"sw%d" % i: gnmi_server.target for i in range(3)},
+                    ["/a"], insecure=True, backoff=_no_wait())
+
+    async def _run():
+        return [item async for item in fanout]
+
+    merged = asyncio.run(_run())
+
+    assert fanout.summary() == {"done": 3}
+    # replayed sync notifications are dropped
+    assert len(merged) == 3 * 2 + 3
@@ -0,0 +1,111 @@
+import pytest
+
+import gnmi.proto.gnmi_pb2 as pb
+from gnmi.messages import Path_, SubscribeResponse_
+from gnmi.path import PathKey
+from gnmi.router import Router
+
+
+def _response(timestamp=1, prefix="", updates=(), deletes=()):
+    return SubscribeResponse_(pb.SubscribeResponse(update=pb.Notification(
+        timestamp=timestamp,
+        prefix=Path_.from_string(prefix).raw,
+        update=[pb.Update(path=Path_.from_string(p).raw,
+                          val=pb.TypedValue(**v)) for p, v in updates],
+        delete=[Path_.from_string(p).raw for p in deletes])))
+
+
+SYNC = SubscribeResponse_(pb.SubscribeResponse(sync_response=True))
+
+PATTERNS = [
+    "/interfaces/interface[name=*]/state/counters/...",
+    "/interfaces/interface[name=Et1]/state/oper-status",
+    "/interfaces/interface/state/oper-status",
+    "/interfaces/*[name=Et2]/state/oper-status",
+    ".../in-octets",
+    "/system/...",
+    "/...",
+    "/interfaces/interface[name=Et1]",
+    "openconfig:/system/state/hostname",
+]
+
+
+@pytest.mark.parametrize("path", [
+    "/interfaces/interface[name=Et1]/state/counters/in-octets",
+    "/interfaces/interface[name=Et2]/state/oper-status",
+    "/interfaces/interface[name=Et1]/state/oper-status",
+    "/interfaces/interface[name=Et3/1]/state/counters",
+    "/interfaces/interface[name=Et1]",
+    "/interfaces/interface[name=Et1][unit=0]/state/oper-status",
+    "/system/state/hostname",
+    "openconfig:/system/state/hostname",
+    "other:/system/state/hostname",
+    "/",
+    "/in-octets",
+])
+def test_match_agrees_with_pathkey(path):
+    router = Router()
+    handlers = {}
+    for pattern in PATTERNS:
+        handlers[pattern] = lambda update, pattern=pattern: pattern
+        router.add(pattern, handlers[pattern])
+
+    key = PathKey.from_string(path)
+    expected = [handlers[p] for p in PATTERNS
+                if PathKey.from_string(p).matches(key)]
+    assert router.match(path) == expected
+
+
+def test_registration_order_and_remove():
+    router = Router()
+    calls = []
+
+    first = router.add("/a/...", lambda u: calls.append("first"))
+
+    @router.route("/a/b")
+    def second(update):
+        calls.append("second")
+
+    router.add("/a/*", lambda u: calls.append("third"))
+    assert len(router.match("/a/b")) == 3
+
+    assert router.remove(first)
+    assert not router.remove(first)
+    assert router.match("/a/b") == [second, router.match("/a/c")[0]]
+    assert not router.remove((PathKey.from_string("/x/y"), second))
+
+
+def test_dispatch():
+    router = Router()
+    routed = []
+    router.add("/interfaces/interface[name=*]/state/counters/...", routed.append)
+
+    responses = [
+        _response(5, "/interfaces/interface[name=Et1]/state", updates=[
+            ("counters/in-octets", {"uint_val": 10}),
+            ("oper-status", {"string_val": "UP"}),
+        ]),
+        SYNC,
+        _response(6, deletes=["/interfaces/interface[name=Et1]/state/counters"]),
+    ]
+    assert router.consume(responses) == 2
+
+    update, delete = routed
+    assert str(update.path) == \
+        "/interfaces/interface[name=Et1]/state/counters/in-octets"
+    assert update.value == 10 and update.timestamp == 5
+    assert not update.deleted
+    assert delete.deleted and delete.value is None and delete.timestamp == 6
+
+
+def test_cache_invalidated():
+    router = Router(cache_size=16)
+    assert router.match("/a/b") == []
+    handle = router.add("/a/b", print)
+    assert router.match("/a/b") == [print]
+    router.remove(handle)
+    assert router.match("/a/b") == []
+
+    uncached = Router(cache_size=0)
+    uncached.add("/a/*", print)
+    assert uncached.match("/a/b") == [print]
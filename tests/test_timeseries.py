@@ -0,0 +1,103 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import gnmi.proto.gnmi_pb2 as pb
+from gnmi.messages import Notification_, Path_, SubscribeResponse_
+from gnmi.timeseries import TimeSeriesStore
+
+
+def _notification(timestamp, **leaves):
+    return Notification_(pb.Notification(
+        timestamp=timestamp,
+        prefix=Path_.from_string("/c").raw,
+        update=[pb.Update(path=Path_.from_string("/" + name).raw,
+                          val=pb.TypedValue(**val))
+                for name, val in leaves.items()]))
+
+
+def test_ring_buffer():
+    store = TimeSeriesStore(capacity=4)
+    for t in range(10):
+        store.add("/a", t, t * 10)
+
+    timestamps, values = store.series("/a")
+    assert timestamps.tolist() == [6, 7, 8, 9]
+    assert values.tolist() == [60, 70, 80, 90]
+
+    timestamps, values = store.series("/a", start=7, end=9)
+    assert timestamps.tolist() == [7, 8]
+
+    assert store.series("/missing")[0].size == 0
+
+
+def test_memory_is_bounded():
+    store = TimeSeriesStore(capacity=8)
+    store.add("/a", 0, 0)
+    nbytes = store.nbytes
+    for t in range(1000):
+        store.add("/a", t, t)
+    assert store.nbytes == nbytes
+
+
+def test_grow_and_max_paths():
+    store = TimeSeriesStore(capacity=2, max_paths=20)
+    for i in range(25):
+        store.add("/p%d" % i, 1, i)
+
+    assert len(store) == 20
+    assert store.dropped == 5
+    assert store.last(["/p19"])[1].tolist() == [19]
+
+
+def test_last():
+    store = TimeSeriesStore(capacity=3)
+    store.add("/a", 1, 1.5)
+    store.add("/a", 2, 2.5)
+    store.add("/b", 5, 7)
+
+    timestamps, values = store.last(["/a", "/b", "/c"])
+    assert timestamps.tolist() == [2, 5, 0]
+    assert values[:2].tolist() == [2.5, 7]
+    assert math.isnan(values[2])
+
+
+def test_window():
+    store = TimeSeriesStore(capacity=4)
+    for t in range(6):
+        store.add("/a", t, t)
+        store.add("/b", t, -t)
+
+    assert store.window(["/a", "/b"], start=3, how="max").tolist() == [5, -3]
+    assert store.window(["/a", "/b"], start=2, end=4, how="sum").tolist() == [5, -5]
+    assert store.window(["/a", "/x"], how="count").tolist() == [4, 0]
+    assert np.isnan(store.window(["/a"], start=100)).all()
+
+    with pytest.raises(ValueError):
+        store.window(how="median")
+
+
+def test_consume_notifications():
+    responses = [
+        SubscribeResponse_(pb.SubscribeResponse(update=_notification(
+            1, a={"uint_val": 3}, b={"string_val": "up"},
+            d={"decimal_val": pb.Decimal64(digits=150, precision=2)}).raw)),
+        SubscribeResponse_(pb.SubscribeResponse(sync_response=True)),
+        SubscribeResponse_(pb.SubscribeResponse(update=_notification(
+            2, a={"uint_val": 4}).raw)),
+    ]
+
+    store = TimeSeriesStore(dtype="float64")
+    assert store.consume(responses) == 3
+    assert store.paths == ["/c/a", "/c/d"]
+    assert store.series("/c/a")[1].tolist() == [3, 4]
+    assert store.last(["/c/d"])[1].tolist() == [1.5]
+
+
+def test_integer_dtype():
+    store = TimeSeriesStore(dtype="uint64")
+    store.add("/a", 1, 2**64 - 1)
+
+    assert store.last(["/a", "/b"])[1].tolist() == [2**64 - 1, 0]
@@ -0,0 +1,78 @@
+import asyncio
+import os
+
+import pytest
+
+from gnmi.aio import AsyncSession
+from gnmi.certcache import CertificateCache, fetch_server_certificate
+from gnmi.certcache import fingerprint
+from gnmi.session import Session
+from gnmi.structures import CertificateStore
+from gnmi.target import Target
+from tests.server import FakeServer, read_cert
+
+
+@pytest.fixture(params=[False, True], ids=["insecure", "tls"])
+def unix_server(request, tmp_path):
+    path = os.path.join(str(tmp_path), "gnmi.sock")
+    server = FakeServer("unix:" + path, tls=request.param).start()
+    server.socket_path = path
+    server.tls = request.param
+    yield server
+    server.stop()
+
+
+def _session_args(server, tmp_path):
+    if not server.tls:
+        return dict(insecure=True)
+    return dict(cert_cache=CertificateCache(tmp_path / "certs"))
+
+
+def test_grpc_target():
+    assert Target.from_url("/var/run/gnmi.sock").grpc_target == \
+        "unix:/var/run/gnmi.sock"
+    assert Target.from_url("unix:///var/run/gnmi.sock").grpc_target == \
+        "unix:/var/run/gnmi.sock"
+    assert Target.from_url("https://10.0.0.1:6030").grpc_target == \
+        "10.0.0.1:6030"
+    assert Target.from_url("veos1:6030").grpc_target == "veos1:6030"
+
+
+def test_unix_session(unix_server, tmp_path):
+    target = Target.from_url(unix_server.socket_path)
+
+    with Session(target, **_session_args(unix_server, tmp_path)) as sess:
+        assert sess.capabilities().gnmi_version == "0.10.0"
+        values = [u.get_value() for n in sess.get(["/system/config"])
+                  for u in n.update]
+        responses = list(sess.subscribe(["/a"], {"mode": "once"}))
+
+    assert values == ["/system/config"]
+    assert [r.sync_response for r in responses] == [False, True]
+
+
+def test_unix_async_session(unix_server, tmp_path):
+    target = Target.from_url("unix://" + unix_server.socket_path)
+
+    async def _run():
+        async with AsyncSession(target, **_session_args(unix_server,
+                                                        tmp_path)) as sess:
+            return await sess.get(["/system/config"])
+
+    resp = asyncio.run(_run())
+    assert len(list(resp)) == 1
+
+
+def test_unix_root_certificates(tmp_path):
+    path = os.path.join(str(tmp_path), "gnmi.sock")
+    server = FakeServer("unix:" + path, tls=True).start()
+    try:
+        certificates = CertificateStore(root_certificates=read_cert("server.crt"))
+        with Session(Target.from_url(path), certificates=certificates,
+                     grpc_options={"server_host_override": "localhost"}) as sess:
+            assert sess.capabilities().gnmi_version == "0.10.0"
+
+        pem = fetch_server_certificate(Target.from_url(path))
+        assert fingerprint(pem) == fingerprint(read_cert("server.crt"))
+    finally:
+        server.stop()
@@ -1,3 +1,4 @@
+import pytest
 
 from gnmi import util
 
@@ -23,4 +24,27 @@ def test_parse_path():
     
     assert parsed[0]["name"] == "apple"
     assert parsed[1]["keys"]["cat"] == "yes"
-    assert parsed[1]["keys"]["dog"] == "no"
\ No newline at end of file
+    assert parsed[1]["keys"]["dog"] == "no"
+
+def test_parse_path_escaped():
+    parsed = util.parse_path(
+        r"/acl/acl-set[name=permit\]all][type=a\=b]/entries/entry[id=1/2]")
+
+    assert [p["name"] for p in parsed] == ["acl", "acl-set", "entries", "entry"]
+    assert parsed[1]["keys"] == {"name": "permit]all", "type": "a=b"}
+    assert parsed[3]["keys"] == {"id": "1/2"}
+
+
+@pytest.mark.parametrize("path", [
+    "/a[k=v", "/a[k]", "/[k=v]", "/a[k=v]b",
+])
+def test_parse_path_invalid(path):
+    with pytest.raises(ValueError):
+        util.parse_path(path)
+
+
+def test_split_origin():
+    assert util.split_origin("openconfig:/a/b") == ("openconfig", "/a/b")
+    assert util.split_origin("/a[k=x:y]") == (None, "/a[k=x:y]")
+    assert util.split_origin("cli:") == ("cli", "")
+    assert util.split_origin(":/a") == (None, "/a")
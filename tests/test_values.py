@@ -0,0 +1,205 @@
+import json
+from decimal import Decimal
+
+import pytest
+
+import gnmi.proto.gnmi_pb2 as pb
+from gnmi import values
+from gnmi.messages import Notification_, TypedValue_, Update_
+
+
+@pytest.mark.parametrize("field,value,expected", [
+    ("int_val", -11, -11),
+    ("uint_val", 21342342534, 21342342534),
+    ("double_val", 2.5, 2.5),
+    ("string_val", "up", "up"),
+    ("bytes_val", b"abc", b"YWJj"),
+    ("decimal_val", pb.Decimal64(digits=1234, precision=2), Decimal("12.34")),
+    ("json_ietf_val", b'{"a": 1}', {"a": 1}),
+    ("leaflist_val", pb.ScalarArray(element=[
+        pb.TypedValue(int_val=1), pb.TypedValue(string_val="b")]), [1, "b"]),
+])
+def test_decode(field, value, expected):
+    tv = pb.TypedValue(**{field: value})
+
+    assert values.decode(tv) == expected
+    assert TypedValue_(tv).extract_val() == expected
+
+
+def test_decode_empty():
+    with pytest.raises(ValueError):
+        values.decode(pb.TypedValue())
+
+
+def test_register_decoder():
+    tv = pb.TypedValue(json_ietf_val=b'{"a": 1.5}')
+
+    previous = values.register_decoder(
+        "json_ietf_val", lambda v: json.loads(v, parse_float=Decimal))
+    try:
+        assert previous is values._json_loads
+        assert values.decode(tv) == {"a": Decimal("1.5")}
+    finally:
+        values.register_decoder("json_ietf_val")
+
+    assert values.decode(tv) == {"a": 1.5}
+
+
+def test_register_decoder_unknown():
+    with pytest.raises(ValueError):
+        values.register_decoder("foo_val", str)
+
+
+def test_extract_values():
+    updates = [
+        Update_.from_keyval(("/a", 1)).raw,
+        Update_.from_keyval(("/b", "x")).raw,
+        pb.Update(path=pb.Path()),
+    ]
+    notif = pb.Notification(update=updates)
+
+    assert values.extract_values(notif) == [1, "x", None]
+    assert values.extract_values(Notification_(notif)) == [1, "x", None]
+    assert values.extract_values(Notification_(notif).update) == [1, "x", None]
+
+
+@pytest.fixture()
+def json_backend():
+    yield values.set_json_backend
+    values.set_json_backend()
+
+
+@pytest.mark.parametrize("backend", ["json", "auto", "orjson"])
+def test_json_backend(json_backend, backend):
+    if backend == "orjson" and not values.ORJSON_SUPPORTED:
+        pytest.skip("orjson not installed")
+    json_backend(backend)
+
+    tv = pb.TypedValue(json_ietf_val=b'{"a": [1, 2], "max": 18446744073709551615}')
+    assert values.decode(tv) == {"a": [1, 2], "max": 18446744073709551615}
+    assert values.decode(pb.TypedValue(json_val=b'[NaN]'))[0] != 0
+
+
+def test_json_backend_invalid(json_backend):
+    with pytest.raises(ValueError):
+        json_backend("simdjson")
+
+
+def test_json_lazy(json_backend):
+    calls = []
+
+    def loads(data):
+        calls.append(data)
+        return json.loads(data)
+
+    json_backend(loads, lazy=True)
+    val = values.decode(pb.TypedValue(json_val=b'{"name": "Et1"}'))
+
+    assert isinstance(val, values.LazyJSON)
+    assert val.raw == b'{"name": "Et1"}'
+    assert not val.decoded and not calls
+
+    assert val["name"] == "Et1"
+    assert val == {"name": "Et1"}
+    assert val.decoded and len(calls) == 1
+
+
+def test_legacy_value_json():
+    with pytest.warns(DeprecationWarning):
+        update = Update_(pb.Update(value=pb.Value(value=b'{"a": 1}',
+                                                   type=pb.JSON_IETF)))
+        assert update.get_value() == {"a": 1}
+
+
+@pytest.mark.parametrize("digits,precision,expected", [
+    (-123456789012345678, 7, "-12345678901.2345678"),
+    (9223372036854775807, 18, "9.223372036854775807"),
+    (1, 0, "1"),
+    (-5, 3, "-0.005"),
+])
+def test_decimal_exact(digits, precision, expected):
+    tv = pb.TypedValue(decimal_val=pb.Decimal64(digits=digits, precision=precision))
+
+    assert str(values.decode(tv)) == expected
+
+
+def _numeric_updates(*vals):
+    return [pb.Update(val=pb.TypedValue(**{field: v})) for field, v in vals]
+
+
+@pytest.mark.parametrize("backend", ["array", "numpy"])
+def test_extract_numeric(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+
+    updates = _numeric_updates(
+        ("int_val", -3), ("uint_val", 2**64 - 1),
+        ("decimal_val", pb.Decimal64(digits=5, precision=0)))
+    floats = _numeric_updates(
+        ("double_val", 0.5), ("float_val", 0.25),
+        ("decimal_val", pb.Decimal64(digits=-1234, precision=2)))
+
+    assert list(values.extract_numeric(updates[1:], "uint64", backend)) == \
+        [2**64 - 1, 5]
+    assert list(values.extract_numeric(pb.Notification(update=floats),
+                                       backend=backend)) == [0.5, 0.25, -12.34]
+
+    with pytest.raises(ValueError):
+        values.extract_numeric(updates, "uint64", backend)
+    with pytest.raises(ValueError):
+        values.extract_numeric(floats, "int64", backend)
+    with pytest.raises(ValueError):
+        values.extract_numeric(_numeric_updates(("string_val", "x")),
+                               backend=backend)
+
+
+def test_extract_numeric_buffer():
+    result = values.extract_numeric(
+        Notification_(pb.Notification(update=_numeric_updates(
+            ("int_val", 1), ("int_val", 2)))), "int64")
+
+    assert memoryview(result).format == "q"
+    assert result.tolist() == [1, 2]
+
+
+@pytest.fixture()
+def bytes_mode():
+    yield values.set_bytes_mode
+    values.set_bytes_mode()
+
+
+def test_bytes_modes(bytes_mode):
+    data = pb.TypedValue(bytes_val=b"\x00\xff")
+    proto = pb.TypedValue(proto_bytes=b"\x01")
+
+    assert values.decode(data) == b"AP8="
+    assert values.decode(proto) == b"\x01"
+
+    bytes_mode("raw")
+    assert values.decode(data) == b"\x00\xff"
+    assert values.decode(proto) == b"\x01"
+
+    bytes_mode("memoryview")
+    view = values.decode(data)
+    assert isinstance(view, memoryview) and view.readonly
+    assert view.tobytes() == b"\x00\xff"
+    assert values.get_bytes_mode() == "memoryview"
+
+    with pytest.raises(ValueError):
+        bytes_mode("hex")
+
+
+@pytest.mark.parametrize("mode", values.BYTES_MODES)
+def test_write_notification_bytes(bytes_mode, mode, capsys):
+    from gnmi.entry import write_notification
+
+    bytes_mode(mode)
+    write_notification(Notification_(pb.Notification(update=[
+        pb.Update(path=pb.Path(elem=[pb.PathElem(name="a")]),
+                  val=pb.TypedValue(bytes_val=b"\x00\xff")),
+        pb.Update(path=pb.Path(elem=[pb.PathElem(name="b")]),
+                  val=pb.TypedValue(proto_bytes=b"\x80")),
+    ])))
+
+    updates = json.loads(capsys.readouterr().out)["updates"]
+    assert [u["value"] for u in updates] == ["AP8=", "gA=="]